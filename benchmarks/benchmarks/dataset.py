@@ -0,0 +1,183 @@
+"""
+Benchmarks measuring the cost of constructing and cloning Dataset
+elements, which dominates operations producing many small elements
+such as groupby.
+"""
+import time
+
+import numpy as np
+import holoviews as hv
+
+
+class ElementConstruction(object):
+    """
+    Measures the number of Curve elements constructed per second via
+    the constructor and via clone, for each of the columnar backends.
+    """
+
+    params = ['array', 'dataframe', 'dictionary']
+    param_names = ['datatype']
+    unit = 'elements/s'
+
+    elements = 2000
+
+    def setup(self, datatype):
+        xs = np.arange(100.)
+        self.curve = hv.Curve((xs, np.sin(xs)), datatype=[datatype])
+        self.redimmed = [hv.Dimension('x', unit='s'), hv.Dimension('y', unit='m')]
+
+    def _rate(self, fn):
+        start = time.time()
+        for _ in range(self.elements):
+            fn()
+        return self.elements/(time.time()-start)
+
+    def track_construct(self, datatype):
+        return self._rate(lambda: hv.Curve(self.curve.data,
+                                           datatype=[datatype]))
+
+    def track_clone(self, datatype):
+        return self._rate(self.curve.clone)
+
+    def track_clone_dimensions(self, datatype):
+        kdims, vdims = self.redimmed[:1], self.redimmed[1:]
+        return self._rate(lambda: self.curve.clone(self.curve.data, kdims=kdims,
+                                                   vdims=vdims))
+
+
+class DatasetGroupby(object):
+    """
+    Times grouping a Dataset into many small groups.
+    """
+
+    params = ['array', 'dataframe', 'dictionary']
+    param_names = ['datatype']
+
+    def setup(self, datatype):
+        n = 20000
+        data = (np.arange(n) % 5000, np.random.rand(n), np.random.rand(n))
+        self.dataset = hv.Dataset(data, kdims=['a', 'x'], vdims=['y'],
+                                  datatype=[datatype])
+
+    def time_groupby(self, datatype):
+        self.dataset.groupby('a')
+
+
+class DatasetSelect(object):
+    """
+    Times selecting rows of a Dataset by a scalar, a range and a
+    large set of values for each of the columnar backends.
+    """
+
+    params = [['array', 'dataframe', 'dictionary'], ['scalar', 'range', 'set']]
+    param_names = ['datatype', 'selection']
+
+    def setup(self, datatype, selection):
+        n = 1000000
+        data = (np.arange(n) % 50000, np.random.rand(n))
+        self.dataset = hv.Dataset(data, kdims=['a'], vdims=['y'],
+                                  datatype=[datatype])
+        self.selection = {'scalar': 100, 'range': (1000, 20000),
+                          'set': set(range(0, 50000, 5))}[selection]
+
+    def time_select(self, datatype, selection):
+        self.dataset.select(a=self.selection)
+
+
+class CategoricalSelect(object):
+    """
+    Times selecting a large set of categories from a DataFrame
+    column with an object and with a categorical dtype.
+    """
+
+    params = ['object', 'category']
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        import pandas as pd
+        n = 1000000
+        categories = np.array(['c%d' % i for i in range(10000)])
+        df = pd.DataFrame({'a': categories[np.random.randint(0, 10000, n)],
+                           'y': np.random.rand(n)})
+        df['a'] = df.a.astype(dtype)
+        self.dataset = hv.Dataset(df, kdims=['a'], vdims=['y'])
+        self.selection = list(categories[::2])
+
+    def time_select(self, dtype):
+        self.dataset.select(a=self.selection)
+
+
+class GridSelect(object):
+    """
+    Times selecting a set of coordinates along both axes of a
+    gridded Dataset.
+    """
+
+    def setup(self):
+        xs, ys = np.arange(2000), np.arange(1000)
+        self.dataset = hv.Dataset((xs, ys, np.random.rand(1000, 2000)),
+                                  kdims=['x', 'y'], vdims=['z'],
+                                  datatype=['grid'])
+        self.xs, self.ys = list(xs[::2]), list(ys[::3])
+
+    def time_select(self):
+        self.dataset.select(x=self.xs, y=self.ys)
+
+
+class DatasetOperations(object):
+    """
+    Times the core operations of the columnar interfaces on a
+    Dataset with an increasing number of rows.
+    """
+
+    params = [['array', 'dataframe', 'dictionary'], [10000, 1000000]]
+    param_names = ['datatype', 'rows']
+
+    def setup(self, datatype, rows):
+        data = (np.arange(rows) % 1000, np.random.rand(rows), np.random.rand(rows))
+        self.dataset = hv.Dataset(data, kdims=['a', 'x'], vdims=['y'],
+                                  datatype=[datatype])
+        self.selection = {'a': (100, 500), 'x': (0.1, 0.9)}
+
+    def time_select_mask(self, datatype, rows):
+        self.dataset.interface.select_mask(self.dataset, self.selection)
+
+    def time_dimension_values(self, datatype, rows):
+        self.dataset.dimension_values('y')
+
+    def time_range(self, datatype, rows):
+        self.dataset.range('y')
+
+    def time_sort(self, datatype, rows):
+        self.dataset.sort('x')
+
+    def time_aggregate(self, datatype, rows):
+        self.dataset.aggregate('a', np.mean)
+
+    def time_aggregate_spread(self, datatype, rows):
+        self.dataset.aggregate('a', np.mean, np.std)
+
+    def time_sample(self, datatype, rows):
+        self.dataset.sample([(i, None) for i in range(0, 1000, 10)])
+
+
+class GridOperations(object):
+    """
+    Times grouping and aggregating a three dimensional gridded
+    Dataset.
+    """
+
+    def setup(self):
+        xs, ys, zs = np.arange(100), np.arange(100), np.arange(50)
+        self.dataset = hv.Dataset((xs, ys, zs, np.random.rand(50, 100, 100)),
+                                  kdims=['x', 'y', 'z'], vdims=['v'],
+                                  datatype=['grid'])
+
+    def time_groupby(self):
+        self.dataset.groupby(['x', 'y'], container_type=dict, group_type=dict)
+
+    def time_aggregate(self):
+        self.dataset.aggregate(['x', 'y'], np.mean)
+
+    def time_aggregate_transposed(self):
+        self.dataset.aggregate(['y', 'x'], np.mean)
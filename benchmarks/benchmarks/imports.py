@@ -0,0 +1,20 @@
+"""
+Benchmarks measuring the time taken to import HoloViews and its
+plotting extensions in a fresh interpreter.
+"""
+
+
+class ImportTime(object):
+    """
+    Times importing holoviews and the plotting extensions, each in
+    a new process so previously imported modules are not cached.
+    """
+
+    def timeraw_import_holoviews(self):
+        return "import holoviews"
+
+    def timeraw_import_bokeh(self):
+        return "import holoviews.plotting.bokeh"
+
+    def timeraw_import_mpl(self):
+        return "import holoviews.plotting.mpl"
@@ -0,0 +1,52 @@
+"""
+Benchmarks measuring the throughput of rendering matplotlib
+animations frame by frame.
+"""
+import time
+
+import numpy as np
+import holoviews as hv
+
+from matplotlib import pyplot
+pyplot.switch_backend('agg')
+
+from holoviews.plotting.mpl import MPLRenderer
+
+
+class AnimationFPS(object):
+    """
+    Measures the number of frames per second rendered by the
+    MPLPlot.frames generator, which drives animation exports.
+    """
+
+    params = [True, False]
+    param_names = ['blit']
+    unit = 'frames/s'
+
+    frames = 100
+
+    def setup(self, blit):
+        xs = np.linspace(0, 10, 1000)
+        self.curves = hv.HoloMap({i: hv.Curve((xs, np.sin(xs+i/10.)))
+                                  for i in range(self.frames)})
+        self.images = hv.HoloMap({i: hv.Image(np.random.rand(100, 100))
+                                  for i in range(self.frames)})
+        self.layout = (self.images + hv.Curve((xs, np.sin(xs))) +
+                       hv.Scatter((xs, np.cos(xs)))).cols(2)
+        self.renderer = MPLRenderer.instance()
+
+    def _fps(self, obj, blit):
+        plot = self.renderer.get_plot(obj)
+        start = time.time()
+        for _ in plot.frames(blit=blit):
+            pass
+        return self.frames/(time.time()-start)
+
+    def track_curve_fps(self, blit):
+        return self._fps(self.curves, blit)
+
+    def track_image_fps(self, blit):
+        return self._fps(self.images, blit)
+
+    def track_layout_fps(self, blit):
+        return self._fps(self.layout, blit)
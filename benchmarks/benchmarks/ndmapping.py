@@ -0,0 +1,90 @@
+"""
+Benchmarks measuring the cost of indexing and regrouping large
+HoloMaps along their key dimensions and of indexing DynamicMaps.
+"""
+import holoviews as hv
+
+
+class HoloMapGroupby(object):
+    """
+    Times HoloMap.groupby and the layout and overlay methods built
+    on top of it for HoloMaps with a large number of keys.
+    """
+
+    params = [1000, 100000]
+    param_names = ['keys']
+
+    def setup(self, keys):
+        curve = hv.Curve([1, 2, 3])
+        n = int(keys**0.5)
+        self.hmap = hv.HoloMap({(i, j): curve for i in range(n)
+                                for j in range(keys//n)}, kdims=['a', 'b'])
+
+    def time_groupby(self, keys):
+        self.hmap.groupby('a')
+
+    def time_layout_outer(self, keys):
+        self.hmap.layout('a')
+
+    def time_layout_inner(self, keys):
+        self.hmap.layout('b')
+
+    def time_overlay(self, keys):
+        self.hmap.overlay('b')
+
+
+class NdMappingGetitem(object):
+    """
+    Times indexing and slicing a HoloMap with a large number of
+    keys.
+    """
+
+    params = [1000, 100000]
+    param_names = ['keys']
+
+    lookups = 1000
+
+    def setup(self, keys):
+        curve = hv.Curve([1, 2, 3])
+        self.hmap = hv.HoloMap({i: curve for i in range(keys)}, kdims=['a'])
+        self.keys = list(range(0, keys, max(keys//self.lookups, 1)))
+
+    def time_getitem(self, keys):
+        for key in self.keys:
+            self.hmap[key]
+
+    def time_slice(self, keys):
+        self.hmap[keys//4:keys//2]
+
+    def time_select(self, keys):
+        self.hmap.select(a=set(self.keys))
+
+
+class DynamicMapGetitem(object):
+    """
+    Times indexing a DynamicMap with keys which have and have not
+    been cached.
+    """
+
+    params = [1, 10]
+    param_names = ['layers']
+
+    lookups = 200
+
+    def setup(self, layers):
+        xs = range(100)
+        self.dmap = hv.DynamicMap(lambda a: hv.Overlay([hv.Curve((xs, [a+l]*100))
+                                                        for l in range(layers)]),
+                                  kdims=['a'], cache_size=self.lookups*2)
+        for key in range(self.lookups):
+            self.dmap[key]
+        self.offset = self.lookups
+
+    def time_getitem_cached(self, layers):
+        for key in range(self.lookups):
+            self.dmap[key]
+
+    def time_getitem(self, layers):
+        for key in range(self.offset, self.offset+self.lookups):
+            self.dmap[key]
+        self.offset += self.lookups
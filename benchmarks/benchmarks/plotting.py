@@ -0,0 +1,125 @@
+"""
+Benchmarks measuring the cost of instantiating, updating and
+rendering plots of overlays with an increasing number of layers with
+the bokeh and matplotlib backends.
+"""
+import numpy as np
+import holoviews as hv
+
+from matplotlib import pyplot
+pyplot.switch_backend('agg')
+
+from holoviews.core.options import Store
+from holoviews.plotting.bokeh import BokehRenderer
+from holoviews.plotting.mpl import MPLRenderer
+
+
+renderers = {'bokeh': BokehRenderer, 'matplotlib': MPLRenderer}
+
+
+def overlay_map(layers, frames=10, samples=100):
+    "Returns a HoloMap of Overlays of Curves with the supplied size."
+    xs = np.linspace(0, 10, samples)
+    return hv.HoloMap({f: hv.Overlay([hv.Curve((xs, np.sin(xs+f+l)))
+                                      for l in range(layers)])
+                       for f in range(frames)}, kdims=['Frame'])
+
+
+class PlotInstantiation(object):
+    """
+    Times instantiating and initializing the plot of a HoloMap of
+    Overlays and computing its ranges for each backend.
+    """
+
+    params = [['bokeh', 'matplotlib'], [1, 10, 50]]
+    param_names = ['backend', 'layers']
+
+    def setup(self, backend, layers):
+        self.renderer = renderers[backend].instance()
+        self.hmap = overlay_map(layers)
+        self.plot = self.renderer.get_plot(self.hmap)
+
+    def teardown(self, backend, layers):
+        pyplot.close('all')
+
+    def time_get_plot(self, backend, layers):
+        self.renderer.get_plot(self.hmap)
+
+    def time_compute_ranges(self, backend, layers):
+        self.plot.compute_ranges(self.hmap, self.plot.keys[-1], None)
+
+
+class PlotUpdate(object):
+    """
+    Times updating an existing plot to a new frame and computing the
+    data required to update the displayed plot.
+    """
+
+    params = [['bokeh', 'matplotlib'], [1, 10, 50]]
+    param_names = ['backend', 'layers']
+
+    def setup(self, backend, layers):
+        self.renderer = renderers[backend].instance()
+        self.plot = self.renderer.get_plot(overlay_map(layers))
+        if backend == 'bokeh':
+            # Attaches the Document the bokeh diffs are computed against
+            self.renderer(self.plot)
+
+    def teardown(self, backend, layers):
+        pyplot.close('all')
+
+    def time_update(self, backend, layers):
+        for key in self.plot.keys:
+            self.plot.update(key)
+
+    def time_update_diff(self, backend, layers):
+        for key in self.plot.keys:
+            self.plot.update(key)
+            self.renderer.diff(self.plot)
+
+
+class Render(object):
+    """
+    Times rendering a plot to the default output format of each
+    backend, i.e. HTML for bokeh and PNG for matplotlib.
+    """
+
+    params = [['bokeh', 'matplotlib'], [1, 10, 50]]
+    param_names = ['backend', 'layers']
+
+    def setup(self, backend, layers):
+        self.renderer = renderers[backend].instance()
+        self.overlay = overlay_map(layers, frames=1).last
+
+    def teardown(self, backend, layers):
+        pyplot.close('all')
+
+    def time_render(self, backend, layers):
+        self.renderer(self.overlay)
+
+
+class OptionsLookup(object):
+    """
+    Times looking up the plot and style options of elements with
+    and without custom options.
+    """
+
+    params = ['bokeh', 'matplotlib']
+    param_names = ['backend']
+
+    lookups = 1000
+
+    def setup(self, backend):
+        Store.current_backend = backend
+        self.curve = hv.Curve([1, 2, 3], group='Group', label='Label')
+        self.custom = self.curve(plot=dict(show_grid=True), style=dict(color='red'))
+
+    def time_lookup(self, backend):
+        for _ in range(self.lookups):
+            Store.lookup_options(backend, self.curve, 'plot')
+            Store.lookup_options(backend, self.curve, 'style')
+
+    def time_lookup_custom(self, backend):
+        for _ in range(self.lookups):
+            Store.lookup_options(backend, self.custom, 'plot')
+            Store.lookup_options(backend, self.custom, 'style')
@@ -35,15 +35,19 @@ import warnings
 warnings.filterwarnings("ignore",
                         message="elementwise comparison failed; returning scalar instead")
 
-try:
-    import IPython  # noqa (API import)
+# The notebook extension is only imported eagerly if IPython is
+# already loaded, otherwise it is imported when first called
+if 'IPython' in sys.modules:
     from .ipython import notebook_extension
-except ImportError as e:
+else:
     class notebook_extension(param.ParameterizedFunction):
         def __call__(self, *args, **opts):
-            raise Exception("IPython notebook not available")
-    if str(e) != 'No module named IPython':
-        raise e
+            try:
+                import IPython  # noqa (Availability import)
+            except ImportError:
+                raise Exception("IPython notebook not available")
+            from .ipython import notebook_extension
+            return notebook_extension(*args, **opts)
 
 
 # A single holoviews.rc file may be executed if found.
@@ -9,6 +9,7 @@ from .sheetcoords import *     # noqa (API import)
 from .spaces import *          # noqa (API import)
 from .tree import *            # noqa (API import)
 from .io import FileArchive
+from . import util
 
 archive = FileArchive()
 
@@ -25,11 +26,9 @@ Dimension.type_formatters[np.float32] = "%.5g"
 Dimension.type_formatters[np.float64] = "%.5g"
 Dimension.type_formatters[np.datetime64] = '%Y-%m-%d %H:%M:%S'
 
-try:
-    import pandas as pd
-    Dimension.type_formatters[pd.tslib.Timestamp] = "%Y-%m-%d %H:%M:%S"
-except:
-    pass
+# Registered by the pandas interface if pandas is imported later
+if util.pd.imported():
+    Dimension.type_formatters[util.pd.Timestamp] = "%Y-%m-%d %H:%M:%S"
 
 def public(obj):
     if not isinstance(obj, type): return False
@@ -10,52 +10,43 @@ import numpy as np
 import param
 
 from ..dimension import replace_dimensions
+from .. import util
 from .interface import Interface
 from .array import ArrayInterface
 from .dictionary import DictInterface
 from .grid import GridInterface
 from .ndelement import NdElementInterface
+from .lazy import LazyInterface, QueryPlan
+
+# Optional interfaces are only imported once they are first used,
+# at which point they are exported from this module and holoviews.core
+def _exports(*names):
+    return ['%s.%s' % (namespace, name) for name in names
+            for namespace in ('holoviews.core.data', 'holoviews.core')]
+
+if util.pd:
+    Interface.register_lazy('dataframe', 'holoviews.core.data.pandas', 'pandas',
+                            _exports('PandasInterface', 'DFColumns'))
+if util.LazyModule('iris'):
+    Interface.register_lazy('cube', 'holoviews.core.data.iris', 'iris',
+                            _exports('CubeInterface'))
+if util.LazyModule('xarray'):
+    Interface.register_lazy('xarray', 'holoviews.core.data.xarray', 'xarray',
+                            _exports('XArrayInterface'))
+if util.pd and util.dd:
+    Interface.register_lazy('dask', 'holoviews.core.data.dask', 'dask',
+                            _exports('DaskInterface'))
 
 datatypes = ['array', 'dictionary', 'grid', 'ndelement']
-
-try:
-    import pandas as pd # noqa (Availability import)
-    from .pandas import PandasInterface
-    datatypes = ['array', 'dataframe', 'dictionary', 'grid', 'ndelement']
-    DFColumns = PandasInterface
-except ImportError:
-    pass
-except Exception as e:
-    param.main.warning('Pandas interface failed to import with '
-                       'following error: %s' % e)
-
-try:
-    import iris # noqa (Availability import)
-    from .iris import CubeInterface # noqa (Conditional API import)
-    datatypes.append('cube')
-except ImportError:
-    pass
-except Exception as e:
-    param.main.warning('Iris interface failed to import with '
-                       'following error: %s' % e)
-
-try:
-    import xarray # noqa (Availability import)
-    from .xarray import XArrayInterface # noqa (Conditional API import)
-    datatypes.append('xarray')
-except ImportError:
-    pass
-
-try:
-    from .dask import DaskInterface
-    datatypes.append('dask')
-except ImportError:
-    pass
+if util.pd:
+    datatypes.insert(1, 'dataframe')
+datatypes += [dt for dt in ['cube', 'xarray', 'dask'] if dt in Interface._lazy]
+datatypes.append('lazy')
 
 from ..dimension import Dimension
+from ..util import group_sanitizer, label_sanitizer
 from ..element import Element
 from ..spaces import HoloMap, DynamicMap
-from .. import util
 
 
 class DataConversion(object):
@@ -184,10 +175,123 @@ class Dataset(Element):
         elif isinstance(self.data, np.ndarray):
             self.interface = ArrayInterface
         elif util.is_dataframe(self.data):
-            self.interface = PandasInterface
+            self.interface = Interface.load('dataframe')
 
         super(Dataset, self).__setstate__(state)
 
+    def clone(self, data=None, shared_data=True, new_type=None, *args, **overrides):
+        """
+        Returns a clone of the object with matching parameter values
+        containing the specified args and kwargs.
+
+        If shared_data is set to True and no data explicitly supplied,
+        the clone will share data with the original. May also supply
+        a new_type, which will inherit all shared parameters.
+
+        If the data is of the same type as the existing data and would
+        be assigned the same interface, the clone is constructed
+        without reinitializing the data and parameters, only
+        validating the overridden parameters and the dimensions.
+        """
+        if data is None and shared_data:
+            data = self.data
+        if new_type is None and not args and self._trusted(data, overrides):
+            return self._trusted_clone(data, **overrides)
+        return super(Dataset, self).clone(data, shared_data, new_type,
+                                          *args, **overrides)
+
+
+    def _trusted(self, data, overrides):
+        """
+        Whether the data and parameter overrides may be used to clone
+        the Dataset without invoking the constructor.
+        """
+        if (type(self).__init__ is not Dataset.__init__ or
+            type(data) is not type(self.data)):
+            return False
+        params = self.params()
+        for k, v in overrides.items():
+            if k == 'id':
+                continue
+            elif k not in params or k == 'datatype':
+                return False
+            elif k in ('kdims', 'vdims', 'cdims'):
+                if not all(isinstance(d, Dimension) for d in v):
+                    return False
+            elif k in ('group', 'label') and isinstance(v, tuple):
+                return False
+        for dt in self.datatype:
+            interface = Interface.interfaces.get(dt)
+            if interface is not None and type(data) in interface.types:
+                return (interface is self.interface and
+                        interface.conforms(self, data))
+        return False
+
+
+    # Instance attributes holding the state of the param library
+    _param_machinery = frozenset(['param', '_param_watchers', '_instance__params',
+                                  'initialized'])
+
+    def _trusted_clone(self, data, **overrides):
+        """
+        Clones the Dataset by copying its state, replacing the data
+        and setting the overridden parameters, which skips the
+        interface lookup and parameter instantiation of the
+        constructor. Only valid for data already in the format of the
+        Dataset interface (see Dataset._trusted).
+        """
+        clone = type(self).__new__(type(self))
+        # Only the parameter values and plain attributes are copied,
+        # the parameter machinery is set up afresh for the clone as in
+        # Parameterized.__init__, since newer param versions bind an
+        # instance param namespace and watchers to each object
+        clone.__dict__.update({k: v for k, v in self.__dict__.items()
+                               if k not in self._param_machinery})
+        if 'param' in self.__dict__:
+            clone.param = type(self.param)(type(clone), self=clone)
+        for attr in ('_instance__params', '_param_watchers'):
+            if attr in self.__dict__:
+                setattr(clone, attr, {})
+        clone.data = data
+        overrides = dict(dict(kdims=self.kdims, vdims=self.vdims,
+                              cdims=OrderedDict(self.cdims)), **overrides)
+        clone.initialized = False
+        try:
+            for k, v in overrides.items():
+                setattr(clone, k, list(v) if k in ('kdims', 'vdims') else v)
+        finally:
+            clone.initialized = True
+        clone.ndims = len(clone.kdims)
+        clone._cached_constants = OrderedDict((d.name, val) for d, val
+                                              in clone.cdims.items())
+        clone._settings = None
+        if not group_sanitizer.allowable(clone.group):
+            raise ValueError("Supplied group %r contains invalid characters." %
+                             clone.group)
+        elif not label_sanitizer.allowable(clone.label):
+            raise ValueError("Supplied label %r contains invalid characters." %
+                             clone.label)
+        clone.interface.validate(clone)
+        return clone
+
+
+    def lazy(self):
+        """
+        Returns a lazy version of the Dataset, on which the select,
+        reindex, sort, sample and aggregate methods only record the
+        operation in a query plan. The plan is optimized, fusing
+        selections and pushing down projections, and executed once by
+        the interface of the original Dataset when values are
+        requested, e.g. by dimension_values or when plotting. Gridded
+        and NdElement based Datasets are returned unchanged.
+        """
+        if (self.interface in (LazyInterface, NdElementInterface) or
+            self.interface.gridded):
+            return self
+        datatype = self.datatype if 'lazy' in self.datatype else self.datatype+['lazy']
+        return self.clone(QueryPlan(self), datatype=datatype)
+
+
     def closest(self, coords):
         """
         Given single or multiple samples along the first key dimension
@@ -199,6 +303,14 @@ class Dataset(Element):
 
         if not isinstance(coords, list): coords = [coords]
         xs = self.dimension_values(0)
+        if len(coords) > 1 and xs.dtype.kind in 'iuf':
+            # Look up all coordinates in the sorted values at once
+            xs = np.sort(xs)
+            coords = np.asarray(coords)
+            right = np.clip(np.searchsorted(xs, coords), 0, len(xs)-1)
+            left = np.clip(right-1, 0, len(xs)-1)
+            closer = np.abs(xs[right]-coords) < np.abs(xs[left]-coords)
+            return list(xs[np.where(closer, right, left)])
         idxs = [np.argmin(np.abs(xs-coord)) for coord in coords]
         return [xs[idx] for idx in idxs] if len(coords) > 1 else xs[idxs[0]]
 
@@ -380,13 +492,39 @@ class Dataset(Element):
     def aggregate(self, dimensions=None, function=None, spreadfn=None, **kwargs):
         """
         Aggregates over the supplied key dimensions with the defined
-        function.
+        function. The function may also be a list of functions, in
+        which case each value dimension is aggregated with each
+        function, suffixing the dimension name with the function name.
+        If a spreadfn is supplied the spread of each value dimension
+        is added as an additional value dimension.
         """
         if function is None:
             raise ValueError("The aggregate method requires a function to be specified")
         if dimensions is None: dimensions = self.kdims
         elif not isinstance(dimensions, list): dimensions = [dimensions]
         kdims = [self.get_dimension(d, strict=True) for d in dimensions]
+
+        functions = list(function) if isinstance(function, list) else [function]
+        if spreadfn or len(functions) > 1:
+            functions += [spreadfn] if spreadfn else []
+            vdims = []
+            for fn in functions:
+                if fn is function:
+                    vdims += self.vdims
+                else:
+                    vdims += [d('_'.join([d.name, fn.__name__])) for d in self.vdims]
+            try:
+                keys, results = self.interface.aggregate_columns(
+                    self, kdims, functions, **kwargs)
+            except NotImplementedError:
+                if isinstance(function, list):
+                    raise
+            else:
+                columns = list(keys.values())
+                for result in results:
+                    columns += list(result.values())
+                return self.clone(tuple(columns), kdims=kdims, vdims=vdims)
+
         aggregated = self.interface.aggregate(self, kdims, function, **kwargs)
         aggregated = self.interface.unpack_scalar(self, aggregated)
 
@@ -438,9 +576,16 @@ class Dataset(Element):
             group_kwargs = dict(util.get_param_values(self), kdims=kdims)
             group_kwargs.update(kwargs)
             drop_dim = len(kdims) != len(group_kwargs['kdims'])
+            # The group index is computed on the first call and reused
+            index = []
             def load_subset(*args):
-                constraint = dict(zip(dim_names, args))
-                group = self.select(**constraint)
+                try:
+                    if not index:
+                        index.append(self.interface.group_index(self, dim_names))
+                    rows = index[0].get(args)
+                    group = self.clone(self.interface.take(self, rows))
+                except NotImplementedError:
+                    group = self.select(**dict(zip(dim_names, args)))
                 if np.isscalar(group):
                     return group_type(([group],), group=self.group,
                                       label=self.label, vdims=self.vdims)
@@ -551,3 +696,21 @@ ArrayColumns = ArrayInterface
 DictColumns  = DictInterface
 NdColumns    = NdElementInterface
 GridColumns  = GridInterface
+
+
+# Interfaces wrapping packages which have already been imported are
+# cheap to import and are exported immediately
+for _datatype, (_, _package, _) in list(Interface._lazy.items()):
+    if util.LazyModule(_package).imported():
+        Interface.load(_datatype)
+
+
+def __getattr__(name):
+    # Resolves the names of optional interfaces on first access on
+    # Python versions supporting module level __getattr__
+    for datatype, (_, _, exports) in list(Interface._lazy.items()):
+        if 'holoviews.core.data.'+name in exports:
+            interface = Interface.load(datatype)
+            if interface is not None:
+                return interface
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
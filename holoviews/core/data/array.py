@@ -74,6 +74,11 @@ class ArrayInterface(Interface):
             raise ValueError("Supplied data does not match specified "
                              "dimensions, expected at least %s columns." % ndims)
 
+    @classmethod
+    def conforms(cls, dataset, data):
+        return data.ndim == 2
+
+
     @classmethod
     def array(cls, dataset, dimensions):
         if dimensions:
@@ -90,8 +95,10 @@ class ArrayInterface(Interface):
 
     @classmethod
     def concat(cls, dataset_objs):
-        cast_objs = cls.cast(dataset_objs)
-        return np.concatenate([col.data for col in cast_objs])
+        if all(ds.interface is cls for ds in dataset_objs):
+            return np.concatenate([ds.data for ds in dataset_objs])
+        columns = cls.concat_columns(dataset_objs, dataset_objs[0].dimensions())
+        return np.column_stack(list(columns.values()))
 
 
     @classmethod
@@ -132,21 +139,10 @@ class ArrayInterface(Interface):
 
         # Get dimension objects, labels, indexes and data
         dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
-        dim_idxs = [dataset.get_dimension_index(d) for d in dimensions]
-        ndims = len(dimensions)
         kdims = [kdim for kdim in dataset.kdims
                  if kdim not in dimensions]
         vdims = dataset.vdims
-
-        # Find unique entries along supplied dimensions
-        # by creating a view that treats the selected
-        # groupby keys as a single object.
-        indices = data[:, dim_idxs].copy()
-        group_shape = indices.dtype.itemsize * indices.shape[1]
-        view = indices.view(np.dtype((np.void, group_shape)))
-        _, idx = np.unique(view, return_index=True)
-        idx.sort()
-        unique_indices = indices[idx]
+        columns = [dataset.get_dimension_index(d) for d in kdims+vdims]
 
         # Get group
         group_kwargs = {}
@@ -155,20 +151,19 @@ class ArrayInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Iterate over the unique entries building masks
-        # to apply the group selection
+        construct = cls.group_constructor(group_type, **group_kwargs)
+
+        # Gather the rows of each group using the group index
         grouped_data = []
-        for group in unique_indices:
-            mask = np.logical_and.reduce([data[:, d_idx] == group[i]
-                                          for i, d_idx in enumerate(dim_idxs)])
-            group_data = data[mask, ndims:]
+        for key, rows in cls.group_index(dataset, dimensions).groups():
+            group_data = data[np.ix_(rows, columns)]
             if not group_type == 'raw':
                 if issubclass(group_type, dict):
                     group_data = {d.name: group_data[:, i] for i, d in
                                   enumerate(kdims+vdims)}
                 else:
-                    group_data = group_type(group_data, **group_kwargs)
-            grouped_data.append((tuple(group), group_data))
+                    group_data = construct(group_data)
+            grouped_data.append((key, group_data))
 
         if issubclass(container_type, NdMapping):
             with item_check(False):
@@ -177,6 +172,11 @@ class ArrayInterface(Interface):
             return container_type(grouped_data)
 
 
+    @classmethod
+    def take(cls, dataset, rows):
+        return dataset.data[rows]
+
+
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         if selection_mask is None:
@@ -190,16 +190,7 @@ class ArrayInterface(Interface):
 
     @classmethod
     def sample(cls, dataset, samples=[]):
-        data = dataset.data
-        mask = False
-        for sample in samples:
-            sample_mask = True
-            if np.isscalar(sample): sample = [sample]
-            for i, v in enumerate(sample):
-                sample_mask &= data[:, i]==v
-            mask |= sample_mask
-
-        return data[mask]
+        return dataset.data[cls.sample_mask(dataset, samples)]
 
 
     @classmethod
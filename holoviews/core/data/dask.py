@@ -76,6 +76,17 @@ class DaskInterface(PandasInterface):
             data = data.unique()
         return data.compute().values
 
+    @classmethod
+    def chunks(cls, dataset, dimensions, chunksize=None):
+        """
+        Yields the values of the supplied dimensions one partition
+        at a time, ignoring the chunksize.
+        """
+        names = [dataset.get_dimension(d, strict=True).name for d in dimensions]
+        for partition in dataset.data[names].to_delayed():
+            df = partition.compute()
+            yield tuple(df[name].values for name in names)
+
     @classmethod
     def select_mask(cls, dataset, selection):
         """
@@ -97,14 +108,7 @@ class DaskInterface(PandasInterface):
                 if k.stop is not None:
                     masks.append(series < k.stop)
             elif isinstance(k, (set, list)):
-                iter_slc = None
-                for ik in k:
-                    mask = series == ik
-                    if iter_slc is None:
-                        iter_slc = mask
-                    else:
-                        iter_slc |= mask
-                masks.append(iter_slc)
+                masks.append(series.isin(list(k)))
             elif callable(k):
                 masks.append(k(series))
             else:
@@ -116,6 +120,15 @@ class DaskInterface(PandasInterface):
                     select_mask = mask
         return select_mask
 
+    @classmethod
+    def group_index(cls, columns, dimensions):
+        raise NotImplementedError('Dask dataframes cannot be indexed by row.')
+
+    @classmethod
+    def take(cls, columns, rows):
+        raise NotImplementedError('Dask dataframes cannot be indexed by row.')
+
+
     @classmethod
     def select(cls, columns, selection_mask=None, **selection):
         df = columns.data
@@ -205,18 +218,14 @@ class DaskInterface(PandasInterface):
 
     @classmethod
     def sample(cls, columns, samples=[]):
-        data = columns.data
-        dims = columns.dimensions('key', label='name')
-        mask = None
-        for sample in samples:
-            if np.isscalar(sample): sample = [sample]
-            for i, (c, v) in enumerate(zip(dims, sample)):
-                dim_mask = data[c]==v
-                if mask is None:
-                    mask = dim_mask
-                else:
-                    mask |= dim_mask
-        return data[mask]
+        dims = columns.dimensions(label='name')
+        samples = [(s,) if np.isscalar(s) else tuple(s) for s in samples]
+        ndims = max(len(s) for s in samples) if samples else 0
+        def sample_partition(df):
+            mask = cls.key_mask([df[d].values for d in dims[:ndims]],
+                                samples, len(df))
+            return df[mask]
+        return columns.data.map_partitions(sample_partition)
 
     @classmethod
     def add_dimension(cls, columns, dimension, dim_pos, values, vdim):
@@ -231,8 +240,11 @@ class DaskInterface(PandasInterface):
 
     @classmethod
     def concat(cls, columns_objs):
-        cast_objs = cls.cast(columns_objs)
-        return dd.concat([col.data for col in cast_objs])
+        # Wrap each input in its own partition rather than loading all
+        # of them into memory at once
+        return dd.concat([ds.data if ds.interface is cls else
+                          dd.from_pandas(ds.dframe(), npartitions=1)
+                          for ds in columns_objs])
 
     @classmethod
     def dframe(cls, columns, dimensions):
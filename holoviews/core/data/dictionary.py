@@ -16,6 +16,16 @@ from ..ndmapping import NdMapping, item_check
 from .. import util
 
 
+class SharedColumns(OrderedDict):
+    """
+    An OrderedDict of columns which the DictInterface wraps without
+    copying, e.g. the views onto the rows held by a streaming buffer.
+    Elements constructed from it share memory with the supplied
+    arrays and therefore reflect any later changes to them.
+    """
+
+
+
 class DictInterface(Interface):
     """
     Interface for simple dictionary-based dataset format. The dictionary
@@ -23,7 +33,7 @@ class DictInterface(Interface):
     are collections representing the values in that column.
     """
 
-    types = (dict, OrderedDict, cyODict)
+    types = (dict, OrderedDict, cyODict, SharedColumns)
 
     datatype = 'dictionary'
 
@@ -74,13 +84,14 @@ class DictInterface(Interface):
         if not isinstance(data, cls.types):
             raise ValueError("DictInterface interface couldn't convert data.""")
         elif isinstance(data, dict):
-            unpacked = [(d, np.array(data[d])) for d in data]
+            array = np.asarray if isinstance(data, SharedColumns) else np.array
+            unpacked = [(d, array(data[d])) for d in data]
             if not cls.expanded([d[1] for d in unpacked]):
                 raise ValueError('DictInterface expects data to be of uniform shape.')
             if isinstance(data, odict_types):
                 data.update(unpacked)
             else:
-                data = OrderedDict([(d, np.array(data[d])) for d in dimensions])
+                data = OrderedDict([(d, array(data[d])) for d in dimensions])
         return data, {'kdims':kdims, 'vdims':vdims}, {}
 
 
@@ -95,6 +106,11 @@ class DictInterface(Interface):
             raise ValueError('Length of columns do not match')
 
 
+    @classmethod
+    def conforms(cls, dataset, data):
+        return all(isinstance(v, np.ndarray) and v.ndim for v in data.values())
+
+
     @classmethod
     def unpack_scalar(cls, dataset, data):
         """
@@ -140,15 +156,15 @@ class DictInterface(Interface):
 
     @classmethod
     def concat(cls, dataset_objs):
-        cast_objs = cls.cast(dataset_objs)
-        cols = set(tuple(c.data.keys()) for c in cast_objs)
+        dimensions = dataset_objs[0].dimensions()
+        if not all(ds.interface is cls for ds in dataset_objs):
+            return cls.concat_columns(dataset_objs, dimensions)
+        cols = set(tuple(ds.data.keys()) for ds in dataset_objs)
         if len(cols) != 1:
             raise Exception("In order to concatenate, all Dataset objects "
                             "should have matching set of columns.")
-        concatenated = OrderedDict()
-        for column in cols.pop():
-            concatenated[column] = np.concatenate([obj[column] for obj in cast_objs])
-        return concatenated
+        return OrderedDict((d.name, np.concatenate([ds.data[d.name] for ds in dataset_objs]))
+                           for d in dimensions)
 
 
     @classmethod
@@ -193,16 +209,14 @@ class DictInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Find all the keys along supplied dimensions
-        keys = [tuple(dataset.data[d.name][i] for d in dimensions)
-                for i in range(len(dataset))]
-
-        # Iterate over the unique entries applying selection masks
+        # Gather the rows of each group using the group index
+        index = cls.group_index(dataset, dimensions)
+        columns = [(d.name, cls.values(dataset, d)) for d in kdims+vdims]
+        construct = cls.group_constructor(group_type, **group_kwargs)
         grouped_data = []
-        for unique_key in util.unique_iterator(keys):
-            mask = cls.select_mask(dataset, dict(zip(dimensions, unique_key)))
-            group_data = OrderedDict(((d.name, dataset[d.name][mask]) for d in kdims+vdims))
-            group_data = group_type(group_data, **group_kwargs)
+        for unique_key, rows in index.groups():
+            group_data = OrderedDict((name, values[rows]) for name, values in columns)
+            group_data = construct(group_data)
             grouped_data.append((unique_key, group_data))
 
         if issubclass(container_type, NdMapping):
@@ -212,6 +226,11 @@ class DictInterface(Interface):
             return container_type(grouped_data)
 
 
+    @classmethod
+    def take(cls, dataset, rows):
+        return OrderedDict((k, np.asarray(v)[rows]) for k, v in dataset.data.items())
+
+
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         if selection_mask is None:
@@ -226,14 +245,7 @@ class DictInterface(Interface):
 
     @classmethod
     def sample(cls, dataset, samples=[]):
-        mask = False
-        for sample in samples:
-            sample_mask = True
-            if np.isscalar(sample): sample = [sample]
-            for i, v in enumerate(sample):
-                name = dataset.get_dimension(i).name
-                sample_mask &= (np.array(dataset.data[name])==v)
-            mask |= sample_mask
+        mask = cls.sample_mask(dataset, samples)
         return {k: np.array(col)[mask]
                 for k, col in dataset.data.items()}
 
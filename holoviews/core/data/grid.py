@@ -82,6 +82,12 @@ class GridInterface(DictInterface):
         Interface.validate(dataset)
 
 
+    @classmethod
+    def conforms(cls, dataset, data):
+        # The shapes of gridded data are only validated by init
+        return False
+
+
     @classmethod
     def dimension_type(cls, dataset, dim):
         if dim in dataset.dimensions():
@@ -188,29 +194,51 @@ class GridInterface(DictInterface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        drop_dim = any(d not in group_kwargs['kdims'] for d in kdims)
+        drop_dim = any(d not in group_kwargs.get('kdims', kdims) for d in kdims)
+        if issubclass(group_type, Element):
+            group_type = cls.group_constructor(group_type, **group_kwargs)
+            group_kwargs = {}
 
         # Find all the keys along supplied dimensions
         keys = [dataset.data[d.name] for d in dimensions]
 
-        # Iterate over the unique entries applying selection masks
         grouped_data = []
-        for unique_key in zip(*util.cartesian_product(keys)):
-            select = dict(zip(dim_names, unique_key))
-            if drop_dim:
+        if drop_dim:
+            # Iterate over the unique entries applying selection masks
+            for unique_key in zip(*util.cartesian_product(keys)):
+                select = dict(zip(dim_names, unique_key))
                 group_data = dataset.select(**select)
-                group_data = group_data if np.isscalar(group_data) else group_data.columns()
-            else:
-                group_data = cls.select(dataset, **select)
-            if np.isscalar(group_data):
-                group_data = {dataset.vdims[0].name: np.atleast_1d(group_data)}
-                for dim, v in zip(dim_names, unique_key):
-                    group_data[dim] = np.atleast_1d(v)
-            elif not drop_dim:
-                for vdim in dataset.vdims:
-                    group_data[vdim.name] = np.squeeze(group_data[vdim.name])
-            group_data = group_type(group_data, **group_kwargs)
-            grouped_data.append((tuple(unique_key), group_data))
+                if np.isscalar(group_data):
+                    group_data = {dataset.vdims[0].name: np.atleast_1d(group_data)}
+                    for dim, v in zip(dim_names, unique_key):
+                        group_data[dim] = np.atleast_1d(v)
+                else:
+                    group_data = group_data.columns()
+                group_data = group_type(group_data, **group_kwargs)
+                grouped_data.append((tuple(unique_key), group_data))
+        else:
+            # Move the grouped axes to the front and flatten them, so
+            # that the value arrays of each group are views into a
+            # single transposed array
+            group_axes = [dataset.ndims-dataset.get_dimension_index(d)-1
+                          for d in dimensions]
+            axes = group_axes+[ax for ax in range(dataset.ndims)
+                               if ax not in group_axes]
+            arrays = []
+            for vdim in dataset.vdims:
+                array = dataset.data[vdim.name].transpose(axes)
+                arrays.append(array.reshape((-1,)+array.shape[len(group_axes):]))
+            coords = {kd.name: dataset.data[kd.name] for kd in kdims}
+            for i, unique_key in enumerate(zip(*util.cartesian_product(keys))):
+                group_data = dict(coords)
+                for vdim, array in zip(dataset.vdims, arrays):
+                    group_data[vdim.name] = array[i]
+                if not kdims:
+                    group_data = {vd: np.atleast_1d(v) for vd, v in group_data.items()}
+                    for dim, v in zip(dim_names, unique_key):
+                        group_data[dim] = np.atleast_1d(v)
+                group_data = group_type(group_data, **group_kwargs)
+                grouped_data.append((tuple(unique_key), group_data))
 
         if issubclass(container_type, NdMapping):
             with item_check(False):
@@ -232,10 +260,7 @@ class GridInterface(DictInterface):
             if ind.stop is not None:
                 mask &= values < ind.stop
         elif isinstance(ind, (set, list)):
-            iter_slcs = []
-            for ik in ind:
-                iter_slcs.append(values == ik)
-            mask = np.logical_or.reduce(iter_slcs)
+            mask = cls.isin(values, ind)
         elif callable(ind):
             mask = ind(values)
         elif ind is None:
@@ -251,6 +276,15 @@ class GridInterface(DictInterface):
         return mask
 
 
+    @classmethod
+    def group_index(cls, dataset, dimensions):
+        raise NotImplementedError('Gridded data cannot be indexed by row.')
+
+    @classmethod
+    def take(cls, dataset, rows):
+        raise NotImplementedError('Gridded data cannot be indexed by row.')
+
+
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         dimensions = dataset.kdims
@@ -322,17 +356,44 @@ class GridInterface(DictInterface):
 
     @classmethod
     def aggregate(cls, dataset, kdims, function, **kwargs):
-        kdims = [kd.name if isinstance(kd, Dimension) else kd for kd in kdims]
-        data = {kdim: dataset.data[kdim] for kdim in kdims}
+        kdims = [dataset.get_dimension(kd, strict=True) for kd in kdims]
+        data = {kdim.name: dataset.data[kdim.name] for kdim in kdims}
         axes = tuple(dataset.ndims-dataset.get_dimension_index(kdim)-1
                      for kdim in dataset.kdims if kdim not in kdims)
+        # The remaining axes are transposed into the order of the
+        # supplied key dimensions
+        kept = [dataset.ndims-dataset.get_dimension_index(kd)-1 for kd in kdims][::-1]
+        transpose = [sorted(kept).index(ax) for ax in kept]
         for vdim in dataset.vdims:
-            data[vdim.name] = np.atleast_1d(function(dataset.data[vdim.name],
-                                                      axis=axes, **kwargs))
-
+            reduced = cls._reduce_axes(dataset.data[vdim.name], function,
+                                       axes, **kwargs)
+            if transpose != sorted(transpose):
+                reduced = reduced.transpose(transpose)
+            data[vdim.name] = np.atleast_1d(reduced)
         return data
 
 
+    @classmethod
+    def _reduce_axes(cls, array, function, axes, **kwargs):
+        """
+        Reduces the array along the supplied axes with the function.
+        Ufuncs are applied using their reduce method and functions
+        which do not support reducing multiple axes at once are
+        applied to the reduced axes flattened into the last axis.
+        """
+        if isinstance(function, np.ufunc):
+            return function.reduce(array, axis=axes, **kwargs)
+        try:
+            return function(array, axis=axes, **kwargs)
+        except TypeError:
+            if len(axes) < 2:
+                raise
+            kept = [ax for ax in range(array.ndim) if ax not in axes]
+            shape = tuple(array.shape[ax] for ax in kept)+(-1,)
+            flattened = array.transpose(kept+list(axes)).reshape(shape)
+            return function(flattened, axis=-1, **kwargs)
+
+
     @classmethod
     def reindex(cls, dataset, kdims, vdims):
         dropped_kdims = [kd for kd in dataset.kdims if kd not in kdims]
@@ -1,14 +1,66 @@
+import importlib
+import os
+import sys
+from collections import OrderedDict
+
 import param
 import numpy as np
 
+from ..dimension import Dimension
 from ..element import Element, NdElement
 from .. import util
 
 
+class GroupIndex(object):
+    """
+    An index of the rows in each group of a dataset along a set of
+    dimensions. Holds the unique keys in order of first appearance
+    and the row indices sorted by group, such that the rows of the
+    ith group are given by rows[starts[i]:stops[i]].
+    """
+
+    def __init__(self, keys, rows, starts, stops):
+        self.keys = keys
+        self.rows = rows
+        self.starts = starts
+        self.stops = stops
+        self._lookup = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, index):
+        return self.rows[self.starts[index]:self.stops[index]]
+
+    def get(self, key):
+        """
+        Returns the rows in the group with the supplied key, which is
+        empty if the key is not in the index.
+        """
+        if self._lookup is None:
+            self._lookup = {k: i for i, k in enumerate(self.keys)}
+        index = self._lookup.get(tuple(key))
+        if index is None:
+            return self.rows[:0]
+        return self[index]
+
+    def groups(self):
+        "Iterates over the keys and rows of each group."
+        for i, key in enumerate(self.keys):
+            yield key, self[i]
+
+
+
 class Interface(param.Parameterized):
 
     interfaces = {}
 
+    # Interfaces for optional dependencies, which are only imported
+    # when they are first needed, indexed by datatype and holding
+    # the module defining the interface, the package it wraps and
+    # the dotted paths the interface is exported as once imported
+    _lazy = {}
+
     datatype = None
 
     gridded = False
@@ -18,6 +70,45 @@ class Interface(param.Parameterized):
         cls.interfaces[interface.datatype] = interface
 
 
+    @classmethod
+    def register_lazy(cls, datatype, module, package, exports=[]):
+        """
+        Registers an interface defined in the supplied module, which
+        will only be imported once data of the given datatype is
+        requested or data of a type defined by the package is
+        supplied. Once imported the interface is assigned to each of
+        the dotted paths listed as exports, if their module has been
+        imported.
+        """
+        cls._lazy[datatype] = (module, package, list(exports))
+
+
+    @classmethod
+    def load(cls, datatype):
+        """
+        Returns the interface for the supplied datatype, importing
+        it first if it was registered lazily. Returns None if the
+        interface is not available.
+        """
+        if datatype not in cls._lazy:
+            return cls.interfaces.get(datatype)
+        module, package, exports = cls._lazy.pop(datatype)
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+        except Exception as e:
+            param.main.warning('%s interface failed to import with '
+                               'following error: %s' % (package.title(), e))
+        interface = cls.interfaces.get(datatype)
+        if interface is not None:
+            for path in exports:
+                namespace, name = path.rsplit('.', 1)
+                if namespace in sys.modules:
+                    setattr(sys.modules[namespace], name, interface)
+        return interface
+
+
     @classmethod
     def cast(cls, dataset, datatype=None, cast_type=None):
         """
@@ -63,16 +154,27 @@ class Interface(param.Parameterized):
         # Set interface priority order
         if datatype is None:
             datatype = eltype.datatype
-        prioritized = [cls.interfaces[p] for p in datatype
-                       if p in cls.interfaces]
 
-        head = [intfc for intfc in prioritized if type(data) in intfc.types]
+        # Load lazy interfaces wrapping the package the data came from
+        package = type(data).__module__.split('.')[0]
+        for dt, (_, pkg, _) in list(cls._lazy.items()):
+            if pkg == package and dt in datatype:
+                cls.load(dt)
+
+        prioritized = [p for p in datatype if p in cls.interfaces
+                       or p in cls._lazy]
+
+        head = [p for p in prioritized if p in cls.interfaces
+                and type(data) in cls.interfaces[p].types]
         if head:
             # Prioritize interfaces which have matching types
             prioritized = head + [el for el in prioritized if el != head[0]]
 
         # Iterate over interfaces until one can interpret the input
-        for interface in prioritized:
+        for p in prioritized:
+            interface = cls.load(p)
+            if interface is None:
+                continue
             try:
                 (data, dims, extra_kws) = interface.init(eltype, data, kdims, vdims)
                 break
@@ -95,6 +197,16 @@ class Interface(param.Parameterized):
                              "not found: %s" % repr(not_found))
 
 
+    @classmethod
+    def conforms(cls, dataset, data):
+        """
+        Whether data of one of the interface types is already in the
+        format produced by init, allowing the dataset to be cloned with
+        the data without reinitializing it.
+        """
+        return True
+
+
     @classmethod
     def expanded(cls, arrays):
         return not any(array.shape not in [arrays[0].shape, (1,)] for array in arrays[1:])
@@ -119,10 +231,7 @@ class Interface(param.Parameterized):
                 if k.stop is not None:
                     mask &= arr < k.stop
             elif isinstance(k, (set, list)):
-                iter_slcs = []
-                for ik in k:
-                    iter_slcs.append(arr == ik)
-                mask &= np.logical_or.reduce(iter_slcs)
+                mask &= cls.isin(arr, k)
             elif callable(k):
                 mask &= k(arr)
             else:
@@ -136,6 +245,115 @@ class Interface(param.Parameterized):
         return mask
 
 
+    @classmethod
+    def sample_mask(cls, dataset, samples):
+        """
+        Given a Dataset object and a list of samples, i.e. scalars or
+        tuples of values along the leading dimensions, return a boolean
+        mask over the rows in the Dataset object matching any of the
+        samples.
+        """
+        samples = [(s,) if np.isscalar(s) else tuple(s) for s in samples]
+        ndims = max(len(s) for s in samples) if samples else 0
+        columns = [cls.values(dataset, d) for d in dataset.dimensions()[:ndims]]
+        return cls.key_mask(columns, samples, len(dataset))
+
+
+    @classmethod
+    def key_mask(cls, columns, keys, length):
+        """
+        Given a list of columns and a list of key tuples along the
+        leading columns, return a boolean mask of the rows matching
+        any of the keys. Rather than comparing each key against every
+        row the keys are factorized along each column and the rows are
+        matched by a hash lookup of their codes, so the cost scales
+        with the number of rows plus the number of keys.
+        """
+        mask = np.zeros(length, dtype=np.bool)
+        for ndims in set(len(k) for k in keys):
+            matching = [k for k in keys if len(k) == ndims]
+            key_mask = np.ones(length, dtype=np.bool)
+            codes, key_codes = None, None
+            for column, values in zip(columns, zip(*matching)):
+                unique = cls._unique(values)
+                column_codes = cls._lookup(unique, column)
+                value_codes = cls._lookup(unique, values)
+                key_mask &= column_codes >= 0
+                if codes is None:
+                    codes, key_codes = column_codes, value_codes
+                    continue
+                # Compact the combined codes to the observed keys
+                combined = key_codes*len(unique) + value_codes
+                unique_combined = np.unique(combined)
+                key_codes = np.searchsorted(unique_combined, combined)
+                codes = cls._lookup(unique_combined, codes*len(unique) + column_codes)
+                key_mask &= codes >= 0
+            mask |= key_mask
+        return mask
+
+
+    @classmethod
+    def isin(cls, values, keys):
+        """
+        Returns a boolean mask of the values which are equal to one of
+        the supplied keys, using a hash lookup rather than comparing
+        the values against each key.
+        """
+        shape = np.shape(values)
+        if len(shape) > 1:
+            values = np.asarray(values).ravel()
+        return (cls._lookup(cls._unique(keys), values) >= 0).reshape(shape)
+
+
+    @classmethod
+    def _unique(cls, values):
+        """
+        Returns an array of the unique values in the supplied
+        collection, avoiding the coercion of mixed types to strings.
+        """
+        if not isinstance(values, np.ndarray):
+            values = list(values)
+            array = np.asarray(values)
+            if array.ndim != 1 or (array.dtype.kind in 'SU' and not
+                                   all(isinstance(v, util.basestring) for v in values)):
+                array = np.empty(len(values), dtype=object)
+                array[:] = values
+            values = array
+        if util.pd.imported():
+            return util.pd.unique(values)
+        try:
+            return np.unique(values)
+        except TypeError:
+            unique = np.empty(len(set(values)), dtype=object)
+            unique[:] = list(OrderedDict.fromkeys(values))
+            return unique
+
+
+    @classmethod
+    def _lookup(cls, unique, values):
+        """
+        Returns the position of each of the values in the array of
+        unique keys or -1 if the value does not match any key.
+        Categorical values are matched by looking up the categories.
+        """
+        if util.pd.imported():
+            if isinstance(values, util.pd.Categorical):
+                positions = cls._lookup(unique, values.categories)
+                return np.append(positions, -1)[values.codes]
+            return util.pd.Index(unique).get_indexer(values).astype(np.int64)
+        values = np.asarray(values)
+        if not len(unique):
+            return np.full(len(values), -1, dtype=np.int64)
+        try:
+            order = np.argsort(unique)
+            positions = np.searchsorted(unique, values, sorter=order)
+            positions = order[np.clip(positions, 0, len(unique)-1)]
+            return np.where(unique[positions] == values, positions, -1)
+        except TypeError:
+            lookup = {k: i for i, k in enumerate(unique)}
+            return np.array([lookup.get(v, -1) for v in values], dtype=np.int64)
+
+
     @classmethod
     def indexed(cls, dataset, selection):
         """
@@ -162,26 +380,271 @@ class Interface(param.Parameterized):
                 return column[0], column[-1]
 
     @classmethod
-    def concatenate(cls, dataset, datatype=None):
+    def concatenate(cls, dataset, datatype=None, memmap=None):
         """
         Utility function to concatenate a list of Column objects,
         returning a new Dataset object. Note that this is unlike the
         .concat method which only concatenates the data.
+
+        If a memmap directory is supplied the columns are written to
+        memory mapped files in that directory one Dataset at a time,
+        allowing collections larger than memory to be concatenated,
+        and the result uses the dictionary format.
         """
         if len(set(type(c) for c in dataset)) != 1:
                raise Exception("All inputs must be same type in order to concatenate")
 
+        if memmap is not None:
+            columns = cls.concat_columns(dataset, dataset[0].dimensions(), memmap)
+            return dataset[0].clone(columns, datatype=['dictionary'])
+
         interfaces = set(c.interface for c in dataset)
         if len(interfaces)!=1 and datatype is None:
             raise Exception("Please specify the concatenated datatype")
         elif len(interfaces)!=1:
-            interface = cls.interfaces[datatype]
+            interface = cls.load(datatype)
         else:
             interface = interfaces.pop()
 
         concat_data = interface.concat(dataset)
         return dataset[0].clone(concat_data)
 
+    @classmethod
+    def concat_columns(cls, datasets, dimensions, memmap=None):
+        """
+        Concatenates the values along the supplied dimensions of a
+        list of Datasets into an OrderedDict of columns. The values
+        are read directly through the interface of each input rather
+        than first casting the inputs to a common format.
+
+        If a memmap directory is supplied, the columns are instead
+        preallocated as memory mapped .npy files in that directory,
+        using the lengths and common dtype of the inputs, and the
+        inputs are copied into them one at a time.
+        """
+        names = [d.name if isinstance(d, Dimension) else d for d in dimensions]
+        for ds in datasets:
+            if not set(names) <= set(ds.dimensions(label='name')):
+                raise Exception("In order to concatenate, all Dataset objects "
+                                "should have matching set of columns.")
+
+        columns = OrderedDict()
+        if memmap is None:
+            values = [[ds.interface.values(ds, name) for name in names]
+                      for ds in datasets]
+            for i, name in enumerate(names):
+                columns[name] = np.concatenate([vals[i] for vals in values])
+            return columns
+
+        lengths = [len(ds) for ds in datasets]
+        for i, name in enumerate(names):
+            # Use the dtype promotion rules of np.concatenate
+            dtype = np.concatenate([np.empty(0, np.asarray(ds.interface.values(ds, name)).dtype)
+                                    for ds in datasets]).dtype
+            if dtype.hasobject:
+                columns[name] = np.empty(sum(lengths), dtype=dtype)
+            else:
+                path = os.path.join(memmap, 'column_%d.npy' % i)
+                columns[name] = np.lib.format.open_memmap(path, mode='w+', dtype=dtype,
+                                                          shape=(sum(lengths),))
+        start = 0
+        for ds, length in zip(datasets, lengths):
+            for name, column in columns.items():
+                column[start:start+length] = ds.interface.values(ds, name)
+            start += length
+        return columns
+
+
+    @classmethod
+    def chunks(cls, dataset, dimensions, chunksize=None):
+        """
+        Iterates over the values of the supplied dimensions, yielding
+        a tuple of aligned arrays for each chunk of at most chunksize
+        rows. Interfaces wrapping partitioned data yield a chunk per
+        partition, allowing operations to stream over the data
+        without loading it all into memory at once.
+        """
+        columns = [cls.values(dataset, d) for d in dimensions]
+        length = len(columns[0]) if columns else 0
+        chunksize = chunksize or length or 1
+        for i in range(0, length, chunksize):
+            yield tuple(column[i:i+chunksize] for column in columns)
+
+    @classmethod
+    def group_index(cls, dataset, dimensions):
+        """
+        Returns a GroupIndex of the rows in each group along the
+        supplied dimensions. The group keys are factorized into
+        integer codes once, so that selecting a group only gathers
+        the rows in it. The index is not cached on the dataset since
+        the data may be modified in place.
+        """
+        dimensions = tuple(dataset.get_dimension(d, strict=True).name
+                           for d in dimensions)
+
+        columns = [cls.values(dataset, d) for d in dimensions]
+        codes = np.zeros(len(dataset), dtype=np.int64)
+        for i, (dim, column) in enumerate(zip(dimensions, columns)):
+            categories = dataset.get_dimension(dim).categories
+            ngroups, inverse = cls._factorize(column, categories)
+            if i == 0:
+                codes = inverse
+            else:
+                _, codes = np.unique(codes*ngroups+inverse, return_inverse=True)
+
+        # A stable sort keeps the rows of each group in order, so the
+        # first row of each group gives the order of first appearance
+        ngroups = codes.max()+1 if len(codes) else 0
+        rows = np.argsort(codes, kind='mergesort')
+        offsets = np.zeros(ngroups+1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=ngroups), out=offsets[1:])
+        first = rows[offsets[:-1]]
+        order = np.argsort(first)
+        first = first[order]
+        if columns:
+            keys = list(zip(*[column[first] for column in columns]))
+        else:
+            keys = [()]*len(first)
+        return GroupIndex(keys, rows, offsets[:-1][order], offsets[1:][order])
+
+
+    @classmethod
+    def _factorize(cls, values, categories=None):
+        """
+        Returns the number of unique values and an array of integer
+        codes identifying the unique value of each element. Values of
+        a categorical Dimension are encoded using its CategoryTable,
+        compacting the codes so categories which do not occur in the
+        values are not assigned a code.
+        """
+        if categories is not None:
+            codes = categories.encode(values)
+            if len(codes) and codes.min() >= 0:
+                present = np.bincount(codes, minlength=len(categories)) > 0
+                remap = np.cumsum(present)-1
+                return int(present.sum()), remap[codes]
+        if util.pd.imported():
+            codes, unique = util.pd.factorize(values)
+            codes = codes.astype(np.int64)
+            # Missing values are assigned a code of -1
+            missing = codes < 0
+            if missing.any():
+                codes[missing] = len(unique)
+                return len(unique)+1, codes
+            return len(unique), codes
+        try:
+            unique, codes = np.unique(values, return_inverse=True)
+            return len(unique), codes
+        except TypeError:
+            lookup = {}
+            codes = np.array([lookup.setdefault(v, len(lookup)) for v in values],
+                             dtype=np.int64)
+            return len(lookup), codes
+
+
+    @classmethod
+    def aggregate_columns(cls, dataset, dimensions, functions, **kwargs):
+        """
+        Aggregates the value dimensions over the supplied dimensions
+        with each of the supplied functions in a single grouped pass,
+        returning the key columns and a list of the aggregated value
+        columns for each function. The groups are computed once using
+        the GroupIndex and common numpy reductions are computed on the
+        grouped values using ufunc.reduceat, any other function is
+        applied to each group in turn.
+        """
+        index = cls.group_index(dataset, dimensions)
+        starts, stops = index.starts, index.stops
+        order = np.argsort(starts)
+        bounds, counts = starts[order], (stops-starts)[order]
+
+        first = index.rows[starts]
+        keys = OrderedDict()
+        for d in dimensions:
+            d = dataset.get_dimension(d, strict=True)
+            keys[d.name] = cls.values(dataset, d)[first]
+
+        results = [OrderedDict() for _ in functions]
+        for vdim in dataset.vdims:
+            values = cls.values(dataset, vdim)[index.rows]
+            for function, result in zip(functions, results):
+                reduced = cls._reduceat(function, values, bounds, counts, **kwargs)
+                if reduced is None:
+                    if isinstance(function, np.ufunc):
+                        function = function.reduce
+                    reduced = [function(values[start:stop], **kwargs)
+                               for start, stop in zip(starts, stops)]
+                    reduced = np.array(reduced)
+                else:
+                    # Reductions are computed in sorted group order
+                    unsorted = np.empty_like(reduced)
+                    unsorted[order] = reduced
+                    reduced = unsorted
+                result[vdim.name] = reduced
+        return keys, results
+
+
+    @classmethod
+    def _reduceat(cls, function, values, bounds, counts, **kwargs):
+        """
+        Reduces the contiguous groups of numeric values starting at
+        the supplied bounds using ufunc.reduceat, returning None if
+        the function has no such reduction.
+        """
+        if kwargs or not len(values) or values.dtype.kind not in 'iuf':
+            return None
+        if isinstance(function, np.ufunc):
+            if function.nin != 2:
+                return None
+            return function.reduceat(values, bounds)
+        elif function is np.sum:
+            return np.add.reduceat(values, bounds)
+        elif function is np.prod:
+            return np.multiply.reduceat(values, bounds)
+        elif function is np.min:
+            return np.minimum.reduceat(values, bounds)
+        elif function is np.max:
+            return np.maximum.reduceat(values, bounds)
+        elif function not in (np.mean, np.var, np.std):
+            return None
+
+        mean = np.add.reduceat(values, bounds)/counts.astype('float64')
+        if function is np.mean:
+            return mean
+        deviations = values-np.repeat(mean, counts)
+        var = np.add.reduceat(deviations**2, bounds)/counts
+        return var if function is np.var else np.sqrt(var)
+
+
+    @classmethod
+    def take(cls, dataset, rows):
+        """
+        Returns the data of the supplied rows in the format of the
+        interface. Interfaces which do not support gathering rows by
+        index raise a NotImplementedError.
+        """
+        raise NotImplementedError
+
+
+    @classmethod
+    def group_constructor(cls, group_type, **kwargs):
+        """
+        Returns a function constructing an Element of the supplied
+        group_type with the supplied parameters from the data of each
+        group. The first group is constructed normally, subsequent
+        groups are cloned from it, which avoids reinitializing the
+        parameters of each group (see Dataset.clone).
+        """
+        groups = []
+        def construct(data):
+            if groups:
+                return groups[0].clone(data)
+            group = group_type(data, **kwargs)
+            if isinstance(group, Element):
+                groups.append(group)
+            return group
+        return construct
+
     @classmethod
     def reduce(cls, dataset, reduce_dims, function, **kwargs):
         kdims = [kdim for kdim in dataset.kdims if kdim not in reduce_dims]
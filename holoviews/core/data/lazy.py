@@ -0,0 +1,296 @@
+from __future__ import absolute_import
+
+import numpy as np
+
+from .interface import Interface
+
+
+class QueryPlan(object):
+    """
+    A QueryPlan wraps a source Dataset together with a sequence of
+    operations (select, reindex, sort, sample and aggregate) which
+    have been applied to it lazily. A plan is immutable, appending an
+    operation returns a new plan, and the result of executing it is
+    cached so each plan is only executed once.
+
+    Before execution the operations are optimized into a number of
+    stages separated by the sample and aggregate operations. Within a
+    stage all selections are fused into a single mask evaluated on
+    the input of the stage, projections are pushed ahead of the
+    selection where possible so only the required columns are
+    gathered and only the final projection and sort are applied.
+    """
+
+    def __init__(self, source, operations=()):
+        self.source = source
+        self.operations = tuple(operations)
+        self._results = {}
+
+
+    def append(self, operation, *args):
+        "Returns a new QueryPlan with the supplied operation appended."
+        return QueryPlan(self.source, self.operations+((operation, args),))
+
+
+    def optimize(self):
+        """
+        Returns the stages of the plan as a list of (selections,
+        projection, sort, operation) tuples, where the operation is
+        a sample or aggregate operation applied at the end of the
+        stage or None.
+        """
+        stages = []
+        selections, projection, sort = [], None, None
+        for operation, args in self.operations:
+            if operation == 'select':
+                selections.append(args[0])
+            elif operation == 'reindex':
+                projection = args
+            elif operation == 'sort':
+                sort = args[0]
+            else:
+                stages.append((selections, projection, sort, (operation, args)))
+                selections, projection, sort = [], None, None
+        if selections or projection or sort or not stages:
+            stages.append((selections, projection, sort, None))
+        return stages
+
+
+    def execute(self, kdims, vdims):
+        """
+        Executes the plan using the interface of the source Dataset,
+        returning a Dataset with the supplied dimensions.
+        """
+        key = (tuple(d.name for d in kdims), tuple(d.name for d in vdims))
+        if key not in self._results:
+            self._results[key] = self._execute(kdims, vdims)
+        return self._results[key]
+
+
+    def _execute(self, kdims, vdims):
+        dataset = self.source
+        for selections, projection, sort, operation in self.optimize():
+            mask = None
+            for selection in selections:
+                selected = dataset.interface.select_mask(dataset, selection)
+                mask = selected if mask is None else (mask & selected)
+            pushdown = projection is not None and all(
+                any(d.name == s for d in projection[0]+projection[1])
+                for s in (sort or []))
+            if pushdown:
+                dataset = dataset.reindex(*projection)
+            if mask is not None:
+                dataset = self._gather(dataset, mask)
+            if sort:
+                dataset = dataset.sort(sort)
+            if projection is not None and not pushdown:
+                dataset = dataset.reindex(*projection)
+            if operation is None:
+                continue
+            operation, args = operation
+            if operation == 'aggregate':
+                dimensions, function, kwargs = args
+                dataset = dataset.aggregate(dimensions, function, **kwargs)
+            elif operation == 'sample':
+                dataset = dataset.sample(*args)
+
+        if [d.name for d in dataset.kdims+dataset.vdims] != [d.name for d in kdims+vdims]:
+            dataset = dataset.reindex(kdims, vdims)
+        return dataset.clone(dataset.data, kdims=list(kdims), vdims=list(vdims))
+
+
+    @classmethod
+    def _gather(cls, dataset, mask):
+        try:
+            data = dataset.interface.take(dataset, np.flatnonzero(mask))
+        except NotImplementedError:
+            data = dataset.interface.select(dataset, selection_mask=mask)
+        return dataset.clone(data)
+
+
+    def __len__(self):
+        return len(self.operations)
+
+
+    def __repr__(self):
+        operations = ''.join(', %s' % op for op, _ in self.operations)
+        return 'QueryPlan(%s%s)' % (type(self.source).__name__, operations)
+
+
+
+class LazyInterface(Interface):
+    """
+    Interface for Datasets wrapping a QueryPlan, created using the
+    Dataset.lazy method. Selecting, reindexing, sorting, sampling and
+    aggregating the Dataset appends operations to the plan rather
+    than applying them. The plan is only executed, by the interface
+    of the source Dataset, once values are requested, e.g. by
+    dimension_values or when plotting. Any other operation is applied
+    eagerly to the executed Dataset.
+    """
+
+    types = (QueryPlan,)
+
+    datatype = 'lazy'
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        if not isinstance(data, QueryPlan):
+            raise ValueError('LazyInterface only supports QueryPlan data.')
+        if kdims is None:
+            kdims = data.source.kdims
+        if vdims is None:
+            vdims = data.source.vdims
+        return data, {'kdims': kdims, 'vdims': vdims}, {}
+
+
+    @classmethod
+    def validate(cls, dataset):
+        source = dataset.data.source
+        not_found = [d.name for d in dataset.kdims+dataset.vdims
+                     if source.get_dimension(d) is None]
+        if not_found:
+            raise ValueError("Supplied data does not contain specified "
+                             "dimensions, the following dimensions were "
+                             "not found: %s" % repr(not_found))
+
+
+    @classmethod
+    def execute(cls, dataset):
+        """
+        Returns the Dataset resulting from executing the query plan
+        of the supplied lazy Dataset.
+        """
+        return dataset.data.execute(dataset.kdims, dataset.vdims)
+
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        if selection_mask is not None or cls.indexed(dataset, selection):
+            executed = cls.execute(dataset)
+            return executed.interface.select(executed, selection_mask, **selection)
+        selection = {dataset.get_dimension(d, strict=True).name: k
+                     for d, k in selection.items()}
+        return dataset.data.append('select', selection)
+
+
+    @classmethod
+    def reindex(cls, dataset, kdims=None, vdims=None):
+        return dataset.data.append('reindex', kdims, vdims)
+
+
+    @classmethod
+    def sort(cls, dataset, by=[]):
+        by = [dataset.get_dimension(d, strict=True).name for d in by]
+        return dataset.data.append('sort', by)
+
+
+    @classmethod
+    def sample(cls, dataset, samples=[]):
+        return dataset.data.append('sample', list(samples))
+
+
+    @classmethod
+    def aggregate(cls, dataset, dimensions, function, **kwargs):
+        if not dimensions:
+            executed = cls.execute(dataset)
+            aggregated = executed.interface.aggregate(executed, dimensions,
+                                                      function, **kwargs)
+            return executed.interface.unpack_scalar(executed, aggregated)
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        return dataset.data.append('aggregate', dimensions, function, kwargs)
+
+
+    @classmethod
+    def aggregate_columns(cls, dataset, dimensions, functions, **kwargs):
+        executed = cls.execute(dataset)
+        return executed.interface.aggregate_columns(executed, dimensions,
+                                                    functions, **kwargs)
+
+
+    @classmethod
+    def unpack_scalar(cls, dataset, data):
+        return data
+
+
+    @classmethod
+    def group_index(cls, dataset, dimensions):
+        raise NotImplementedError('Lazy datasets are grouped by '
+                                  'appending selections to the plan.')
+
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        executed = cls.execute(dataset)
+        return executed.interface.groupby(executed, dimensions, container_type,
+                                          group_type, **kwargs)
+
+
+    @classmethod
+    def concat(cls, dataset_objs):
+        executed = [cls.execute(ds) for ds in dataset_objs]
+        return executed[0].interface.concat(executed)
+
+
+    @classmethod
+    def take(cls, dataset, rows):
+        executed = cls.execute(dataset)
+        return executed.interface.take(executed, rows)
+
+
+    @classmethod
+    def values(cls, dataset, dim, expanded=True, flat=True):
+        executed = cls.execute(dataset)
+        return executed.interface.values(executed, dim, expanded, flat)
+
+
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        executed = cls.execute(dataset)
+        return executed.interface.dimension_type(executed, dim)
+
+
+    @classmethod
+    def range(cls, dataset, dimension):
+        executed = cls.execute(dataset)
+        return executed.interface.range(executed, dimension)
+
+
+    @classmethod
+    def shape(cls, dataset):
+        executed = cls.execute(dataset)
+        return executed.interface.shape(executed)
+
+
+    @classmethod
+    def length(cls, dataset):
+        executed = cls.execute(dataset)
+        return executed.interface.length(executed)
+
+
+    @classmethod
+    def array(cls, dataset, dimensions):
+        executed = cls.execute(dataset)
+        return executed.interface.array(executed, dimensions)
+
+
+    @classmethod
+    def dframe(cls, dataset, dimensions):
+        executed = cls.execute(dataset)
+        return executed.interface.dframe(executed, dimensions)
+
+
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        executed = cls.execute(dataset)
+        return executed.interface.redim(executed, dimensions)
+
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        executed = cls.execute(dataset)
+        return executed.interface.add_dimension(executed, dimension, dim_pos,
+                                                values, vdim)
+
+
+Interface.register(LazyInterface)
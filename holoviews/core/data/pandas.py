@@ -105,8 +105,10 @@ class PandasInterface(Interface):
 
     @classmethod
     def concat(cls, columns_objs):
-        cast_objs = cls.cast(columns_objs)
-        return pd.concat([col.data for col in cast_objs])
+        if all(ds.interface is cls for ds in columns_objs):
+            return pd.concat([ds.data for ds in columns_objs])
+        columns = cls.concat_columns(columns_objs, columns_objs[0].dimensions())
+        return pd.DataFrame(columns, columns=list(columns))
 
 
     @classmethod
@@ -121,6 +123,10 @@ class PandasInterface(Interface):
                                 kdims=element_dims)
         group_kwargs.update(kwargs)
 
+        if group_type != 'raw' and issubclass(group_type, Element):
+            group_type = cls.group_constructor(group_type, **group_kwargs)
+            group_kwargs = {}
+
         group_by = [d.name for d in index_dims]
         data = [(k, group_type(v, **group_kwargs)) for k, v in
                 columns.data.groupby(group_by, sort=False)]
@@ -146,6 +152,23 @@ class PandasInterface(Interface):
                                             zip(agg.index, agg.values)])
 
 
+    @classmethod
+    def aggregate_columns(cls, columns, dimensions, functions, **kwargs):
+        names = [getattr(f, '__name__', None) for f in functions]
+        if not len(dimensions) or None in names or len(set(names)) < len(names):
+            return super(PandasInterface, cls).aggregate_columns(
+                columns, dimensions, functions, **kwargs)
+        cols = [columns.get_dimension(d, strict=True).name for d in dimensions]
+        vdims = columns.dimensions('value', label='name')
+        grouped = columns.data[cols+vdims].groupby(cols, sort=False)
+        aggregated = grouped.aggregate(functions, **kwargs)
+        keys = cyODict((col, aggregated.index.get_level_values(i).values)
+                       for i, col in enumerate(cols))
+        results = [cyODict((vd, aggregated[vd][name].values) for vd in vdims)
+                   for name in names]
+        return keys, results
+
+
     @classmethod
     def unpack_scalar(cls, columns, data):
         """
@@ -180,6 +203,11 @@ class PandasInterface(Interface):
         return columns.data.sort_values(by=cols)
 
 
+    @classmethod
+    def take(cls, columns, rows):
+        return columns.data.iloc[rows]
+
+
     @classmethod
     def select(cls, columns, selection_mask=None, **selection):
         df = columns.data
@@ -203,15 +231,7 @@ class PandasInterface(Interface):
 
     @classmethod
     def sample(cls, columns, samples=[]):
-        data = columns.data
-        mask = False
-        for sample in samples:
-            sample_mask = True
-            if np.isscalar(sample): sample = [sample]
-            for i, v in enumerate(sample):
-                sample_mask = np.logical_and(sample_mask, data.iloc[:, i]==v)
-            mask |= sample_mask
-        return data[mask]
+        return columns.data[cls.sample_mask(columns, samples)]
 
 
     @classmethod
@@ -245,3 +265,4 @@ class PandasInterface(Interface):
 
 
 Interface.register(PandasInterface)
+Dimension.type_formatters[pd.Timestamp] = "%Y-%m-%d %H:%M:%S"
@@ -118,10 +118,19 @@ class XArrayInterface(GridInterface):
                     v = v.to_dataframe().reset_index()
                 data.append((k, group_type(v, **group_kwargs)))
         else:
-            unique_iters = [cls.values(dataset, d, False) for d in group_by]
-            indexes = zip(*util.cartesian_product(unique_iters))
-            for k in indexes:
-                sel = dataset.data.sel(**dict(zip(group_by, k)))
+            # Select each group by integer position, avoiding a label
+            # lookup along each coordinate per group
+            coords = [np.atleast_1d(dataset.data[d].values) for d in group_by]
+            positions = []
+            for d, values in zip(group_by, coords):
+                ordered = cls.values(dataset, d, False)
+                indexes = np.arange(len(values))
+                if len(values) > 1 and values[0] != ordered[0]:
+                    indexes = indexes[::-1]
+                positions.append(indexes)
+            for inds in zip(*util.cartesian_product(positions)):
+                k = tuple(values[i] for values, i in zip(coords, inds))
+                sel = dataset.data.isel(**dict(zip(group_by, inds)))
                 if drop_dim:
                     sel = sel.to_dataframe().reset_index()
                 data.append((k, group_type(sel, **group_kwargs)))
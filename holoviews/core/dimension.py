@@ -14,7 +14,8 @@ import param
 from ..core.util import (basestring, sanitize_identifier,
                          group_sanitizer, label_sanitizer, max_range,
                          find_range, dimension_sanitizer, OrderedDict,
-                         bytes_to_unicode, unicode, dt64_to_dt, unique_array)
+                         bytes_to_unicode, unicode, dt64_to_dt, unique_array,
+                         CategoryTable)
 from .options import Store, StoreOptions
 from .pprint import PrettyPrinter
 
@@ -168,6 +169,22 @@ class Dimension(param.Parameterized):
         return self.__class__(**settings)
 
 
+    @property
+    def categories(self):
+        """
+        A CategoryTable encoding the declared values of the Dimension
+        as integer codes, or None if no values have been declared.
+        """
+        values = self.values
+        if not values or isinstance(values, basestring):
+            return None
+        table = self.__dict__.get('_categories')
+        if table is None or table.categories != values:
+            table = CategoryTable(values)
+            self._categories = table
+        return table
+
+
     @property
     def pprint_label(self):
         "The pretty-printed label string for the Dimension"
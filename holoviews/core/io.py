@@ -16,6 +16,7 @@ from __future__ import absolute_import
 
 import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 
 from io import BytesIO
 from hashlib import sha256
@@ -370,6 +371,17 @@ class Unpickler(Importer):
     the entries method.
     """
 
+    threads = param.Integer(default=4, bounds=(1, None), doc="""
+        Number of threads used by collect to read the metadata and
+        entries of the supplied files concurrently.""")
+
+    index = param.String(default=None, allow_None=True, doc="""
+        Optional path to a metadata index file used by collect. The
+        key metadata and entries of each scanned file are cached in
+        the index along with the file modification time and size, so
+        that subsequent calls to collect only need to open new or
+        modified files.""")
+
     def __call__(self, data, entries=None):
         buff = BytesIO(data)
         return self.load(buff, entries=entries)
@@ -413,6 +425,68 @@ class Unpickler(Importer):
         with zipfile.ZipFile(filename, 'r') as f:
             return [el for el in f.namelist() if el != 'metadata']
 
+    @bothmethod
+    def _scan(self_or_cls, filename):
+        """
+        Reads the key metadata (None if unavailable) and the entries
+        of a file, opening the zip archive only once.
+        """
+        with zipfile.ZipFile(filename, 'r') as f:
+            names = f.namelist()
+            key = None
+            if 'metadata' in names:
+                key = pickle.loads(f.read('metadata')).get('key', {})
+        return key, [el for el in names if el != 'metadata']
+
+    @bothmethod
+    def _load_index(self_or_cls):
+        "Loads the metadata index if one is specified and available"
+        if self_or_cls.index is None or not os.path.isfile(self_or_cls.index):
+            return {}
+        try:
+            with open(self_or_cls.index, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            self_or_cls.warning('Metadata index %s could not be read '
+                                'and will be rebuilt.' % self_or_cls.index)
+            return {}
+
+    @bothmethod
+    def scan(self_or_cls, files):
+        """
+        Given a list of filenames, return a dictionary mapping each
+        filename to a (key, entries) tuple where key is None if the
+        file has no metadata. Files are read concurrently using the
+        specified number of threads and any up-to-date records in the
+        metadata index are reused, updating the index as required.
+        """
+        index = self_or_cls._load_index()
+        stamps, stale = {}, []
+        for fname in unique_iterator(files):
+            stat = os.stat(fname)
+            stamp = (stat.st_mtime, stat.st_size)
+            path = os.path.abspath(fname)
+            stamps[fname] = (path, stamp)
+            if path not in index or index[path][0] != stamp:
+                stale.append(fname)
+
+        if len(stale) > 1 and self_or_cls.threads > 1:
+            pool = ThreadPool(min(self_or_cls.threads, len(stale)))
+            try:
+                scanned = pool.map(self_or_cls._scan, stale)
+            finally:
+                pool.close()
+        else:
+            scanned = [self_or_cls._scan(fname) for fname in stale]
+
+        for fname, record in zip(stale, scanned):
+            path, stamp = stamps[fname]
+            index[path] = (stamp, record)
+        if stale and self_or_cls.index is not None:
+            with open(self_or_cls.index, 'wb') as f:
+                pickle.dump(index, f, protocol=2)
+        return {fname: index[path][1] for fname, (path, _) in stamps.items()}
+
     @bothmethod
     def collect(self_or_cls, files, drop=[], metadata=True):
         """
@@ -425,6 +499,10 @@ class Unpickler(Importer):
         supplied additional key dimensions may be supplied as long as
         they do not clash with the file metadata. Any key dimension
         may be dropped by name by supplying a drop argument.
+
+        The metadata and entries of all files are read up front using
+        the scan method, which may make use of multiple threads and a
+        cached metadata index.
         """
         aslist = not isinstance(files, (NdMapping, Element))
         if isinstance(files, Element):
@@ -434,16 +512,20 @@ class Unpickler(Importer):
             file_kdims = files.kdims
         drop_extra = files.drop if isinstance(files, Collator) else []
 
-        mdata_dims = []
+        fnames = [fname[0] if isinstance(fname, tuple) else fname
+                  for fname in files.values()]
+        scanned = self_or_cls.scan(fnames)
+        mdata_dims = set()
         if metadata:
-            fnames = [fname[0] if isinstance(fname, tuple) else fname
-                      for fname in files.values()]
-            mdata_dims = {kdim for fname in fnames
-                          for kdim in self_or_cls.key(fname).keys()}
+            for fname in fnames:
+                mdata = scanned[fname][0]
+                if mdata is None:
+                    raise Exception("No metadata available")
+                mdata_dims |= set(mdata.keys())
         file_dims = set(files.dimensions('key', label=True))
-        added_dims = set(mdata_dims) - file_dims
-        overlap_dims = file_dims & set(mdata_dims)
-        kwargs = dict(kdims=file_kdims + sorted(added_dims),
+        added_dims = sorted(mdata_dims - file_dims)
+        overlap_dims = file_dims & mdata_dims
+        kwargs = dict(kdims=file_kdims + added_dims,
                       vdims=['filename', 'entries'],
                       value_transform=self_or_cls.loader,
                       drop=drop_extra + drop)
@@ -451,7 +533,8 @@ class Unpickler(Importer):
 
         for key, fname in files.data.items():
             fname = fname[0] if isinstance(fname, tuple) else fname
-            mdata = self_or_cls.key(fname) if metadata else {}
+            mdata, entries = scanned[fname]
+            mdata = mdata if metadata else {}
             for odim in overlap_dims:
                 kval = key[files.get_dimension_index(odim)]
                 if kval != mdata[odim]:
@@ -459,9 +542,7 @@ class Unpickler(Importer):
                                    "value for dimension %s" % odim)
             mkey = tuple(mdata.get(d, None) for d in added_dims)
             key = mkey if aslist else key + mkey
-            if isinstance(fname, tuple) and len(fname) == 1:
-                (fname,) = fname
-            for entry in self_or_cls.entries(fname):
+            for entry in entries:
                 layout_data[entry][key] = (fname, [entry])
         return Layout(layout_data.items())
 
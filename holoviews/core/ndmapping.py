@@ -110,6 +110,7 @@ class MultiDimensionalMapping(Dimensioned):
         self._cached_index_types = [d.type for d in self.kdims]
         self._cached_index_values = {d.name:d.values for d in self.kdims}
         self._cached_categorical = any(d.values for d in self.kdims)
+        self._cached_categories = {d.name: d.categories for d in self.kdims}
 
         if initial_items is None: initial_items = []
         if isinstance(initial_items, tuple):
@@ -168,8 +169,8 @@ class MultiDimensionalMapping(Dimensioned):
             valid_vals = []
 
         for dim, val in valid_vals:
-            vals = self._cached_index_values[dim.name]
-            if vals and val is not None and val not in vals:
+            categories = self._cached_categories[dim.name]
+            if categories is not None and val is not None and val not in categories:
                 raise KeyError('%s dimension value %s not in'
                                ' specified dimension values.' % (dim, repr(val)))
 
@@ -439,13 +440,16 @@ class MultiDimensionalMapping(Dimensioned):
         if datatype is None:
             datatype = ['dataframe' if pd else 'dictionary']
 
-        tables = []
-        for key, value in self.data.items():
-            value = value.table(datatype=datatype, **kwargs)
-            for idx, (dim, val) in enumerate(zip(self.kdims, key)):
-                value = value.add_dimension(dim, idx, val)
-            tables.append(value)
-        return value.interface.concatenate(tables)
+        # Concatenate the tables first and add the key dimensions to
+        # the concatenated table rather than to each table
+        tables = [value.table(datatype=datatype, **kwargs)
+                  for value in self.data.values()]
+        lengths = [len(table) for table in tables]
+        table = tables[-1].interface.concatenate(tables)
+        for idx, dim in enumerate(self.kdims):
+            keys = [key[idx] for key in self.data.keys()]
+            table = table.add_dimension(dim, idx, np.repeat(keys, lengths))
+        return table
 
 
     def dframe(self):
@@ -593,10 +597,13 @@ class NdMapping(MultiDimensionalMapping):
             conditions = self._generate_conditions(map_slice)
             items = self.data.items()
             for cidx, (condition, dim) in enumerate(zip(conditions, self.kdims)):
-                values = self._cached_index_values.get(dim.name, None)
-                items = [(k, v) for k, v in items
-                         if condition(values.index(k[cidx])
-                                      if values else k[cidx])]
+                categories = self._cached_categories.get(dim.name)
+                if categories is None:
+                    items = [(k, v) for k, v in items if condition(k[cidx])]
+                else:
+                    codes = categories.encode([k[cidx] for k, _ in items])
+                    items = [item for item, code in zip(items, codes)
+                             if code >= 0 and condition(code)]
             sliced_items = []
             for k, v in items:
                 val_slice = self._dataslice(v, data_slice)
@@ -612,10 +619,10 @@ class NdMapping(MultiDimensionalMapping):
         """
         Expands slices containing steps into a list.
         """
-        keys = list(self.data.keys())
         expanded = []
         for idx, ind in enumerate(indices):
             if isinstance(ind, slice) and ind.step is not None:
+                keys = self.data.keys()
                 dim_ind = slice(ind.start, ind.stop)
                 if dim_ind == slice(None):
                     condition = self._all_condition()
@@ -648,10 +655,10 @@ class NdMapping(MultiDimensionalMapping):
         for dim, dim_slice in zip(self.kdims, map_slice):
             if isinstance(dim_slice, slice):
                 start, stop = dim_slice.start, dim_slice.stop
-                if dim.values:
-                    values = self._cached_index_values[dim.name]
-                    dim_slice = slice(None if start is None else values.index(start),
-                                      None if stop is None else values.index(stop))
+                categories = self._cached_categories[dim.name]
+                if categories is not None:
+                    dim_slice = slice(None if start is None else categories.code(start),
+                                      None if stop is None else categories.code(stop))
                 if dim_slice == slice(None):
                     conditions.append(self._all_condition())
                 elif start is None:
@@ -661,9 +668,9 @@ class NdMapping(MultiDimensionalMapping):
                 else:
                     conditions.append(self._range_condition(dim_slice))
             elif isinstance(dim_slice, (set, list)):
-                if dim.values:
-                    dim_slice = [self._cached_index_values[dim.name].index(dim_val)
-                                 for dim_val in dim_slice]
+                categories = self._cached_categories[dim.name]
+                if categories is not None:
+                    dim_slice = [categories.code(dim_val) for dim_val in dim_slice]
                 conditions.append(self._values_condition(dim_slice))
             elif dim_slice is Ellipsis:
                 conditions.append(self._all_condition())
@@ -672,8 +679,9 @@ class NdMapping(MultiDimensionalMapping):
             elif isinstance(dim_slice, (tuple)):
                 raise IndexError("Keys may only be selected with sets or lists, not tuples.")
             else:
-                if dim.values:
-                    dim_slice = self._cached_index_values[dim.name].index(dim_slice)
+                categories = self._cached_categories[dim.name]
+                if categories is not None:
+                    dim_slice = categories.code(dim_slice)
                 conditions.append(self._value_condition(dim_slice))
         return conditions
 
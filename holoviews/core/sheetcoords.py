@@ -289,6 +289,38 @@ class SheetCoordinateSystem(object):
         return self.matrixidx2sheet(*self.sheet2matrixidx(x,y))
 
 
+    def sheet2matrixidx_array(self,x,y):
+        """
+        Array version of sheet2matrixidx(), converting any sequences
+        of sheet coordinates x and y into arrays of integer row and
+        column indices in a single vectorized pass.
+        """
+        r,c = self.sheet2matrix(np.asarray(x,dtype=float),
+                                np.asarray(y,dtype=float))
+        return np.floor(r).astype(int), np.floor(c).astype(int)
+
+
+    def closest_cell_centers(self,x,y):
+        """
+        Array version of closest_cell_center(), returning arrays of
+        the x and y sheet coordinates of the cell centers closest to
+        the supplied sequences of sheet coordinates.
+        """
+        return self.matrixidx2sheet(*self.sheet2matrixidx_array(x,y))
+
+
+    def sheet2matrix_bilinear(self,x,y):
+        """
+        Given sequences of sheet coordinates, return the row and
+        column indices of the four cells surrounding each point along
+        with the weights to bilinearly interpolate between the values
+        at the cell centers. See bilinear_weights() for details.
+        """
+        r,c = self.sheet2matrix(np.asarray(x,dtype=float),
+                                np.asarray(y,dtype=float))
+        return bilinear_weights(r-0.5, c-0.5, self.shape)
+
+
     def sheetcoordinates_of_matrixidx(self):
         """
         Return x,y where x is a vector of sheet coordinates
@@ -300,6 +332,28 @@ class SheetCoordinateSystem(object):
 
 
 
+def bilinear_weights(float_row,float_col,shape):
+    """
+    Given arrays of continuous matrix coordinates, where integer
+    coordinates fall on the cell centers, return the row and column
+    indices of the four surrounding cells as arrays of shape (4,N)
+    along with the corresponding bilinear interpolation weights.
+    Coordinates outside the cell centers are clamped to the nearest
+    center along each axis.
+    """
+    rows,cols = shape[:2]
+    r = np.clip(float_row, 0, rows-1)
+    c = np.clip(float_col, 0, cols-1)
+    r0 = np.minimum(np.floor(r).astype(int), max(rows-2, 0))
+    c0 = np.minimum(np.floor(c).astype(int), max(cols-2, 0))
+    r1 = np.minimum(r0+1, rows-1)
+    c1 = np.minimum(c0+1, cols-1)
+    dr, dc = r-r0, c-c0
+    weights = np.array([(1-dr)*(1-dc), (1-dr)*dc, dr*(1-dc), dr*dc])
+    return np.array([r0, r0, r1, r1]), np.array([c0, c1, c0, c1]), weights
+
+
+
 class Slice(np.ndarray):
     """
     Represents a slice of a SheetCoordinateSystem; i.e., an array
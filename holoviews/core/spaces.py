@@ -433,6 +433,8 @@ class Callable(param.Parameterized):
     def __call__(self, *args, **kwargs):
         inputs = [i for i in self.inputs if isinstance(i, DynamicMap)]
         streams = [s for i in inputs for s in get_nested_streams(i)]
+        if not all(s._memoize for s in streams):
+            return self.callable(*args, **kwargs)
         values = tuple(tuple(sorted(s.contents.items())) for s in streams)
         key = args + tuple(sorted(kwargs.items())) + values
 
@@ -588,7 +590,10 @@ class DynamicMap(HoloMap):
         kwarg_items = [s.contents.items() for s in self.streams]
         flattened = [(k,v) for kws in kwarg_items for (k,v) in kws
                      if k not in kdims]
-        retval = self.callback(*args, **dict(flattened))
+        if all(s._memoize for s in self.streams):
+            retval = self.callback(*args, **dict(flattened))
+        else:
+            retval = self.callback.callable(*args, **dict(flattened))
         return self._style(retval)
 
 
@@ -1,4 +1,5 @@
 import os, sys, warnings, operator
+import importlib
 import numbers
 import itertools
 import string, fnmatch
@@ -16,18 +17,62 @@ try:
 except:
     from collections import OrderedDict
 
-datetime_types = (np.datetime64, dt.datetime)
-
 try:
-    import pandas as pd # noqa (optional import)
-    datetime_types = datetime_types + (pd.tslib.Timestamp,)
-except ImportError:
-    pd = None
+    from importlib.util import find_spec
+except ImportError: # Python 2
+    from pkgutil import find_loader as find_spec
 
-try:
-    import dask.dataframe as dd
-except ImportError:
-    dd = None
+
+class LazyModule(object):
+    """
+    Proxy for an optional dependency, which is only imported once
+    one of its attributes is accessed. The proxy evaluates to True
+    if the module is installed without importing it, while the
+    imported method reports whether the module has been imported
+    already, which allows checking whether an object could be an
+    instance of a type defined by the module without importing it.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._available = None
+
+    def imported(self):
+        if self._module is None and self._name in sys.modules:
+            self._module = sys.modules[self._name]
+        return self._module is not None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return getattr(self._load(), attr)
+
+    def __bool__(self):
+        if self._available is None:
+            try:
+                self._available = (self.imported() or
+                                   find_spec(self._name.split('.')[0]) is not None)
+            except (ImportError, ValueError):
+                self._available = False
+        return self._available
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self._name)
+
+
+# Pandas Timestamps are datetime subclasses
+datetime_types = (np.datetime64, dt.datetime)
+
+pd = LazyModule('pandas')
+dd = LazyModule('dask.dataframe')
 
 
 
@@ -62,7 +107,7 @@ class HashableJSON(json.JSONEncoder):
             return hash(frozenset(obj))
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
-        if pd and isinstance(obj, (pd.Series, pd.DataFrame)):
+        if pd.imported() and isinstance(obj, (pd.Series, pd.DataFrame)):
             return repr(sorted(list(obj.to_dict().items())))
         elif isinstance(obj, self.string_hashable):
             return str(obj)
@@ -113,12 +158,14 @@ def process_ellipses(obj, key, vdim_selection=False):
     if isinstance(key, np.ndarray) and key.dtype.kind == 'b':
         return key
     wrapped_key = wrap_tuple(key)
-    if wrapped_key.count(Ellipsis)== 0:
+    # Compare by identity to support array keys
+    ellipses = [k is Ellipsis for k in wrapped_key]
+    if sum(ellipses) == 0:
         return key
-    if wrapped_key.count(Ellipsis)!=1:
+    if sum(ellipses) != 1:
         raise Exception("Only one ellipsis allowed at a time.")
     dim_count = len(obj.dimensions())
-    index = wrapped_key.index(Ellipsis)
+    index = ellipses.index(True)
     head = wrapped_key[:index]
     tail = wrapped_key[index+1:]
 
@@ -461,7 +508,7 @@ def max_range(ranges):
         with warnings.catch_warnings():
             warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
             values = [r for r in ranges for v in r if v is not None]
-            if pd and all(isinstance(v, pd.tslib.Timestamp) for r in values for v in r):
+            if pd.imported() and all(isinstance(v, pd.Timestamp) for r in values for v in r):
                 values = [(v1.to_datetime64(), v2.to_datetime64()) for v1, v2 in values]
             arr = np.array(values)
             if arr.dtype.kind in 'OSU':
@@ -637,6 +684,59 @@ def merge_dimensions(dimensions_list):
     return [d(values=dvalues.get(d.name, [])) for d in dimensions]
 
 
+class CategoryTable(object):
+    """
+    A CategoryTable encodes the values of a categorical Dimension as
+    integer codes indexing into its ordered list of categories, so
+    categorical values may be sorted, compared and grouped as small
+    integers rather than by looking up their position in a list.
+    """
+
+    def __init__(self, categories):
+        self.categories = list(categories)
+        self.index = {}
+        for i, category in enumerate(self.categories):
+            self.index.setdefault(category, i)
+        self._lookup = None
+
+    def __len__(self):
+        return len(self.categories)
+
+    def __contains__(self, value):
+        try:
+            return value in self.index
+        except TypeError:
+            return False
+
+    def code(self, value):
+        """
+        Returns the code of a single value, raising a ValueError if
+        the value is not one of the categories.
+        """
+        try:
+            return self.index[value]
+        except (KeyError, TypeError):
+            raise ValueError('%r is not one of the categories.' % (value,))
+
+    def encode(self, values):
+        """
+        Returns an array of the codes of the supplied values, values
+        which are not one of the categories are assigned a code of -1.
+        """
+        if pd.imported() and isinstance(values, np.ndarray) and values.ndim == 1:
+            if self._lookup is None:
+                codes = np.array(list(self.index.values())+[-1], dtype=np.int64)
+                self._lookup = (pd.Index(list(self.index.keys())), codes)
+            index, codes = self._lookup
+            return codes[index.get_indexer(values)]
+        index = self.index
+        return np.array([index.get(v, -1) for v in values], dtype=np.int64)
+
+    def decode(self, codes):
+        "Returns the categories corresponding to the supplied codes."
+        return [self.categories[c] for c in codes]
+
+
 def dimension_sort(odict, kdims, vdims, categorical, key_index, cached_values):
     """
     Sorts data by key using usual Python tuple sorting semantics
@@ -648,13 +748,14 @@ def dimension_sort(odict, kdims, vdims, categorical, key_index, cached_values):
     indexes = [(dimensions[i], int(i not in range(ndims)),
                     i if i in range(ndims) else i-ndims)
                 for i in key_index]
-    cached_values = {d: [None]+vals for d, vals in cached_values.items()}
+    tables = {d: CategoryTable([None]+vals) for d, vals in cached_values.items()
+              if vals and not isinstance(vals, basestring)}
 
     if len(set(key_index)) != len(key_index):
         raise ValueError("Cannot sort on duplicated dimensions")
     elif categorical:
-       sortkws['key'] = lambda x: tuple(cached_values[dim.name].index(x[t][d])
-                                        if dim.values else x[t][d]
+       sortkws['key'] = lambda x: tuple(tables[dim.name].code(x[t][d])
+                                        if dim.name in tables else x[t][d]
                                         for i, (dim, t, d) in enumerate(indexes))
     elif key_index != list(range(len(kdims+vdims))):
         sortkws['key'] = lambda x: tuple(x[t][d] for _, t, d in indexes)
@@ -811,42 +912,6 @@ def layer_groups(ordering, length=2):
    return group_orderings
 
 
-def group_select(selects, length=None, depth=None):
-    """
-    Given a list of key tuples to select, groups them into sensible
-    chunks to avoid duplicating indexing operations.
-    """
-    if length == None and depth == None:
-        length = depth = len(selects[0])
-    getter = operator.itemgetter(depth-length)
-    if length > 1:
-        selects = sorted(selects, key=getter)
-        grouped_selects = defaultdict(dict)
-        for k, v in itertools.groupby(selects, getter):
-            grouped_selects[k] = group_select(list(v), length-1, depth)
-        return grouped_selects
-    else:
-        return list(selects)
-
-
-def iterative_select(obj, dimensions, selects, depth=None):
-    """
-    Takes the output of group_select selecting subgroups iteratively,
-    avoiding duplicating select operations.
-    """
-    ndims = len(dimensions)
-    depth = depth if depth is not None else ndims
-    items = []
-    if isinstance(selects, dict):
-        for k, v in selects.items():
-            items += iterative_select(obj.select(**{dimensions[ndims-depth]: k}),
-                                      dimensions, v, depth-1)
-    else:
-        for s in selects:
-            items.append((s, obj.select(**{dimensions[-1]: s[-1]})))
-    return items
-
-
 def get_spec(obj):
    """
    Gets the spec from any labeled data object.
@@ -875,8 +940,8 @@ def is_dataframe(data):
     """
     Checks whether the supplied data is DatFrame type.
     """
-    return((pd is not None and isinstance(data, pd.DataFrame)) or
-          (dd is not None and isinstance(data, dd.DataFrame)))
+    return((pd.imported() and isinstance(data, pd.DataFrame)) or
+           (dd.imported() and isinstance(data, dd.DataFrame)))
 
 
 def get_param_values(data):
@@ -1023,24 +1088,6 @@ def iterkeys(obj):
     return iter(obj.keys()) if sys.version_info.major == 3 else obj.iterkeys()
 
 
-def get_unique_keys(ndmapping, dimensions):
-    inds = [ndmapping.get_dimension_index(dim) for dim in dimensions]
-    getter = operator.itemgetter(*inds)
-    return unique_iterator(getter(key) if len(inds) > 1 else (key[inds[0]],)
-                           for key in ndmapping.data.keys())
-
-
-def unpack_group(group, getter):
-    for k, v in group.iterrows():
-        obj = v.values[0]
-        key = getter(k)
-        if hasattr(obj, 'kdims'):
-            yield (key, obj)
-        else:
-            obj = tuple(v)
-            yield (wrap_tuple(key), obj)
-
-
 def capitalize(string):
     """
     Capitalizes the first letter of a string.
@@ -1085,55 +1132,50 @@ def make_path_unique(path, counts):
 
 class ndmapping_groupby(param.ParameterizedFunction):
     """
-    Apply a groupby operation to an NdMapping, using pandas to improve
-    performance (if available).
+    Apply a groupby operation to an NdMapping, grouping the keys in a
+    single pass without constructing intermediate data structures.
     """
 
     def __call__(self, ndmapping, dimensions, container_type,
                  group_type, sort=False, **kwargs):
-        try:
-            import pandas # noqa (optional import)
-            groupby = self.groupby_pandas
-        except:
-            groupby = self.groupby_python
-        return groupby(ndmapping, dimensions, container_type,
-                       group_type, sort=sort, **kwargs)
+        return self.groupby_keys(ndmapping, dimensions, container_type,
+                                 group_type, sort=sort, **kwargs)
 
     @param.parameterized.bothmethod
-    def groupby_pandas(self_or_cls, ndmapping, dimensions, container_type,
-                       group_type, sort=False, **kwargs):
+    def groupby_keys(self_or_cls, ndmapping, dimensions, container_type,
+                     group_type, sort=False, **kwargs):
+        """
+        Groups the items of the NdMapping by hashing the key values
+        along the supplied dimensions, maintaining the order in which
+        groups and the items within each group first appear. As the
+        groups are already ordered by appearance the sort argument
+        has no further effect.
+        """
         if 'kdims' in kwargs:
             idims = [ndmapping.get_dimension(d) for d in kwargs['kdims']]
         else:
             idims = [dim for dim in ndmapping.kdims if dim not in dimensions]
 
-        all_dims = [d.name for d in ndmapping.kdims]
+        ginds = [ndmapping.get_dimension_index(dim) for dim in dimensions]
         inds = [ndmapping.get_dimension_index(dim) for dim in idims]
+        group_getter = operator.itemgetter(*ginds) if ginds else lambda x: tuple()
         getter = operator.itemgetter(*inds) if inds else lambda x: tuple()
 
-        multi_index = pd.MultiIndex.from_tuples(ndmapping.keys(), names=all_dims)
-        df = pd.DataFrame(list(map(wrap_tuple, ndmapping.values())), index=multi_index)
+        groups = OrderedDict()
+        for key, value in ndmapping.data.items():
+            if hasattr(value, 'kdims'):
+                item = (getter(key), value)
+            else:
+                item = (wrap_tuple(getter(key)), wrap_tuple(value))
+            gkey = group_getter(key)
+            if gkey in groups:
+                groups[gkey].append(item)
+            else:
+                groups[gkey] = [item]
 
         kwargs = dict(dict(get_param_values(ndmapping), kdims=idims), **kwargs)
-        groups = ((wrap_tuple(k), group_type(OrderedDict(unpack_group(group, getter)), **kwargs))
-                   for k, group in df.groupby(level=[d.name for d in dimensions]))
-
-        if sort:
-            selects = list(get_unique_keys(ndmapping, dimensions))
-            groups = sorted(groups, key=lambda x: selects.index(x[0]))
-        return container_type(groups, kdims=dimensions)
-
-    @param.parameterized.bothmethod
-    def groupby_python(self_or_cls, ndmapping, dimensions, container_type,
-                       group_type, sort=False, **kwargs):
-        idims = [dim for dim in ndmapping.kdims if dim not in dimensions]
-        dim_names = [dim.name for dim in dimensions]
-        selects = get_unique_keys(ndmapping, dimensions)
-        selects = group_select(list(selects))
-        groups = [(k, group_type((v.reindex(idims) if hasattr(v, 'kdims')
-                                  else [((), (v,))]), **kwargs))
-                  for k, v in iterative_select(ndmapping, dim_names, selects)]
-        return container_type(groups, kdims=dimensions)
+        return container_type([(wrap_tuple(k), group_type(OrderedDict(items), **kwargs))
+                               for k, items in groups.items()], kdims=dimensions)
 
 
 def cartesian_product(arrays, flat=True, copy=False):
@@ -17,7 +17,10 @@ methods on all objects as comparison opertors only return Booleans and
 thus would not supply any information regarding *why* two elements are
 considered different.
 """
+import hashlib
+
 import numpy as np
+import param
 from unittest.util import safe_repr
 from unittest import TestCase
 from numpy.testing import assert_array_equal, assert_array_almost_equal
@@ -26,6 +29,7 @@ from . import *    # noqa (All Elements need to support comparison)
 from ..core import (Element, Empty, AdjointLayout, Overlay, Dimension,
                     HoloMap, Dimensioned, Layout, NdLayout, NdOverlay,
                     GridSpace, DynamicMap, GridMatrix)
+from ..core.boundingregion import BoundingBox
 from ..core.options import Options, Cycle
 from ..interface.pandas import DFrame as PandasDFrame
 from ..interface.pandas import DataFrameView
@@ -95,6 +99,16 @@ class Comparison(ComparisonInterface):
     Comparison.assertEqual(matrix1, matrix2)
     """
 
+    # Whether elements in NdMappings are first compared by a hash of
+    # their type and parameters along with their exact data, only
+    # comparing them in detail if they differ. Useful when detailed
+    # comparisons of the elements are expensive.
+    content_hashing = False
+
+    # Number of values compared at a time by compare_arrays, allowing
+    # comparisons of large arrays to exit on the first mismatch
+    array_chunk_size = 1000000
+
     @classmethod
     def register(cls):
 
@@ -216,6 +230,10 @@ class Comparison(ComparisonInterface):
 
     @classmethod
     def compare_arrays(cls, arr1, arr2, msg='Arrays'):
+        if (isinstance(arr1, np.ndarray) and isinstance(arr2, np.ndarray)
+            and arr1.shape == arr2.shape and arr1.dtype.kind in 'biuf'
+            and arr2.dtype.kind in 'biuf'):
+            return cls._compare_array_chunks(arr1, arr2, msg)
         try:
             assert_array_equal(arr1, arr2)
         except:
@@ -224,6 +242,82 @@ class Comparison(ComparisonInterface):
             except AssertionError as e:
                 raise cls.failureException(msg + str(e)[11:])
 
+    @classmethod
+    def _compare_array_chunks(cls, arr1, arr2, msg='Arrays'):
+        """
+        Compares two numeric arrays of the same shape a chunk at a
+        time, only computing the approximate comparison for chunks
+        which are not exactly equal and exiting on the first chunk
+        that does not match.
+        """
+        flat1, flat2 = np.ravel(arr1), np.ravel(arr2)
+        for start in range(0, max(flat1.size, 1), cls.array_chunk_size):
+            chunk1 = flat1[start:start+cls.array_chunk_size]
+            chunk2 = flat2[start:start+cls.array_chunk_size]
+            if np.array_equal(chunk1, chunk2):
+                continue
+            elif chunk1.dtype.kind == 'f' or chunk2.dtype.kind == 'f':
+                nans = np.isnan(chunk1)
+                if ((nans == np.isnan(chunk2)).all() and
+                    np.array_equal(chunk1[~nans], chunk2[~nans])):
+                    continue
+            try:
+                assert_array_almost_equal(chunk1, chunk2)
+            except AssertionError as e:
+                if flat1.size > cls.array_chunk_size:
+                    msg = '%s (flattened from index %d)' % (msg, start)
+                raise cls.failureException(msg + str(e)[11:])
+
+    @classmethod
+    def _content_hash(cls, obj):
+        """
+        Computes a hash of the type and parameters of an Element,
+        along with a list of the arrays holding its data. Returns
+        None if any component cannot be hashed reliably.
+        """
+        digest, arrays = hashlib.sha1(), []
+        def update(value):
+            if isinstance(value, np.ndarray):
+                if value.dtype.kind not in 'biufmM':
+                    return False
+                digest.update(repr((value.dtype.str, value.shape)).encode('utf-8'))
+                arrays.append(value)
+            elif isinstance(value, BoundingBox):
+                return update(('BoundingBox',)+value.lbrt())
+            elif isinstance(value, (param.Parameterized, Dimension)):
+                digest.update(type(value).__name__.encode('utf-8'))
+                return update(sorted((k, v) for k, v in value.get_param_values()
+                                     if k != 'name' or isinstance(value, Dimension)))
+            elif isinstance(value, (list, tuple)):
+                digest.update(('%s%d' % (type(value).__name__, len(value))).encode('utf-8'))
+                return all(update(v) for v in value)
+            elif isinstance(value, dict):
+                digest.update(('dict%d' % len(value)).encode('utf-8'))
+                return all(update(k) and update(v) for k, v in value.items())
+            elif value is None or isinstance(value, (bool, str, type(u''), int, float,
+                                                     np.number, np.bool_)):
+                digest.update(('%s:%r' % (type(value).__name__, value)).encode('utf-8'))
+            else:
+                return False
+            return True
+        if not isinstance(obj, Element) or not update([obj, obj.data]):
+            return None
+        return digest.hexdigest(), arrays
+
+    @classmethod
+    def _identical(cls, el1, el2):
+        """
+        Whether two Elements are identical, i.e. they have the same
+        type, parameters and exactly equal data arrays. Comparing the
+        arrays directly is cheaper than hashing their contents.
+        """
+        if not cls.content_hashing or type(el1) is not type(el2):
+            return False
+        hash1, hash2 = cls._content_hash(el1), cls._content_hash(el2)
+        if hash1 is None or hash2 is None or hash1[0] != hash2[0]:
+            return False
+        return all(np.array_equal(a1, a2) for a1, a2 in zip(hash1[1], hash2[1]))
+
     @classmethod
     def bounds_check(cls, el1, el2, msg=None):
         if el1.bounds.lbrt() != el2.bounds.lbrt():
@@ -317,18 +411,21 @@ class Comparison(ComparisonInterface):
     @classmethod
     def compare_ndmappings(cls, el1, el2, msg='NdMappings'):
         cls.compare_dimensioned(el1, el2)
-        if len(el1.keys()) != len(el2.keys()):
+        keys1, keys2 = el1.keys(), el2.keys()
+        if len(keys1) != len(keys2):
             raise cls.failureException("%s have different numbers of keys." % msg)
 
-        if set(el1.keys()) != set(el2.keys()):
-            diff1 = [el for el in el1.keys() if el not in el2.keys()]
-            diff2 = [el for el in el2.keys() if el not in el1.keys()]
+        keyset1, keyset2 = set(keys1), set(keys2)
+        if keyset1 != keyset2:
+            diff1 = [el for el in keys1 if el not in keyset2]
+            diff2 = [el for el in keys2 if el not in keyset1]
             raise cls.failureException("%s have different sets of keys. " % msg
                                        + "In first, not second %s. " % diff1
                                        + "In second, not first: %s." % diff2)
 
         for element1, element2 in zip(el1, el2):
-            cls.assertEqual(element1, element2)
+            if not cls._identical(element1, element2):
+                cls.assertEqual(element1, element2)
 
     @classmethod
     def compare_holomap(cls, el1, el2, msg='HoloMaps'):
@@ -17,6 +17,90 @@ import param
 from ..core import Dimension, Element2D
 
 
+class PackedPaths(object):
+    """
+    PackedPaths stores a sequence of paths as a single contiguous NxD
+    coordinate buffer along with an offsets array of length P+1,
+    where the coordinates of path i are given by
+    coords[offsets[i]:offsets[i+1]]. Optionally an array of P values
+    may be supplied, associating a value with each path.
+
+    PackedPaths behaves like a list of NxD arrays, returning views
+    onto the coordinate buffer when indexed or iterated over, which
+    allows Path types to use it in place of a list transparently
+    while avoiding the overhead of storing a large number of small
+    arrays.
+    """
+
+    def __init__(self, coords, offsets, values=None):
+        self.coords = np.asarray(coords)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.values = None if values is None else np.asarray(values)
+        if len(self.offsets) == 0 or self.offsets[0] != 0:
+            raise ValueError("PackedPaths offsets must start at zero.")
+        if self.offsets[-1] != len(self.coords):
+            raise ValueError("PackedPaths offsets must end at the "
+                             "number of coordinates.")
+        if self.values is not None and len(self.values) != len(self):
+            raise ValueError("PackedPaths must supply one value per path.")
+
+
+    @classmethod
+    def from_paths(cls, paths, values=None):
+        """
+        Packs a list of NxD arrays into a PackedPaths object.
+        """
+        paths = [np.asarray(p) for p in paths]
+        lengths = [len(p) for p in paths]
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        coords = np.concatenate(paths) if paths else np.empty((0, 2))
+        return cls(coords, offsets, values)
+
+
+    @property
+    def lengths(self):
+        "The number of coordinates in each path."
+        return np.diff(self.offsets)
+
+
+    def split(self, index=None):
+        """
+        Returns a list of views onto the coordinate buffer, one for
+        each path, optionally selecting a single column by index.
+        """
+        if not len(self):
+            return []
+        coords = self.coords if index is None else self.coords[:, index]
+        return np.split(coords, self.offsets[1:-1])
+
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+    def __iter__(self):
+        for start, end in zip(self.offsets[:-1], self.offsets[1:]):
+            yield self.coords[start:end]
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise IndexError("PackedPaths does not support strided slicing.")
+            stop = max(start, stop)
+            offsets = self.offsets[start:stop+1]
+            values = None if self.values is None else self.values[start:stop]
+            return PackedPaths(self.coords[offsets[0]:offsets[-1]],
+                               offsets-offsets[0], values)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PackedPaths index out of range.")
+        return self.coords[self.offsets[index]:self.offsets[index+1]]
+
+
+
 class Path(Element2D):
     """
     The Path Element contains a list of Paths stored as Nx2 numpy
@@ -27,6 +111,8 @@ class Path(Element2D):
     3) A tuple containing an array of length N with the x-values and a
        second array of shape NxP, where P is the number of paths.
     4) A list of tuples each containing separate x and y values.
+    5) A PackedPaths object holding all the paths in a single
+       contiguous coordinate buffer.
     """
 
     kdims = param.List(default=[Dimension('x'), Dimension('y')],
@@ -37,7 +123,9 @@ class Path(Element2D):
     group = param.String(default="Path", constant=True)
 
     def __init__(self, data, **params):
-        if isinstance(data, tuple):
+        if isinstance(data, PackedPaths):
+            pass
+        elif isinstance(data, tuple):
             x, y = map(np.asarray, data)
             if y.ndim == 1:
                 y = np.atleast_2d(y).T
@@ -82,6 +170,8 @@ class Path(Element2D):
         dim_idx = self.get_dimension_index(dimension)
         if dim_idx >= len(self.dimensions()):
             return super(Path, self).dimension_values(dimension)
+        if isinstance(self.data, PackedPaths):
+            return self.data.coords[:, dim_idx]
         values = []
         for contour in self.data:
             values.append(contour[:, dim_idx])
@@ -111,6 +201,8 @@ class Contours(Path):
     def dimension_values(self, dim):
         dimension = self.get_dimension(dim, strict=True)
         if dimension in self.vdims:
+            if isinstance(self.data, PackedPaths) and self.data.values is not None:
+                return np.repeat(self.data.values, self.data.lengths)
             return np.array([self.level])
         return super(Contours, self).dimension_values(dim)
 
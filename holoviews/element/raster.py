@@ -10,17 +10,12 @@ from ..core.data import ArrayInterface, DictInterface
 from ..core import (Dimension, NdMapping, Element2D,
                     Overlay, Element, Dataset)
 from ..core.boundingregion import BoundingRegion, BoundingBox
-from ..core.sheetcoords import SheetCoordinateSystem, Slice
+from ..core.sheetcoords import SheetCoordinateSystem, Slice, bilinear_weights
 from ..core.util import pd
 from .chart import Curve
 from .tabular import Table
 from .util import compute_edges, toarray, categorical_aggregate2d
 
-try:
-    from ..core.data import PandasInterface
-except ImportError:
-    PandasInterface = None
-
 
 class Raster(Element2D):
     """
@@ -69,6 +64,8 @@ class Raster(Element2D):
             raise KeyError("%r is the only selectable value dimension" % self.vdims[0].name)
 
         slc_types = [isinstance(sl, slice) for sl in slices[:2]]
+        if not any(slc_types) and not all(np.isscalar(sl) for sl in slices[:2]):
+            return self._sample_values(*slices[:2])
         data = self.data.__getitem__(slices[:2][::-1])
         if all(slc_types):
             return self.clone(data, extents=None)
@@ -83,6 +80,34 @@ class Raster(Element2D):
         return int(round(coord[1])), int(round(coord[0]))
 
 
+    def _coords2matrix(self, xs, ys):
+        return (np.round(np.asarray(ys)).astype(int),
+                np.round(np.asarray(xs)).astype(int))
+
+
+    def _interpolation_weights(self, xs, ys):
+        return bilinear_weights(np.asarray(ys, dtype=float),
+                                np.asarray(xs, dtype=float),
+                                self._zdata.shape)
+
+
+    def _sample_values(self, xs, ys, interpolate=False):
+        """
+        Looks up the values at arrays of x- and y-coordinates in a
+        single vectorized pass, optionally interpolating bilinearly
+        between the values of the four closest cells.
+        """
+        data = toarray(self._zdata)
+        if not interpolate:
+            return data[self._coords2matrix(xs, ys)]
+        rows, cols, weights = self._interpolation_weights(xs, ys)
+        values = data[rows, cols]
+        if values.ndim > weights.ndim:
+            weights = weights[..., np.newaxis]
+        weighted = np.where(weights > 0, values*weights, 0)
+        return weighted.sum(axis=0)
+
+
     @classmethod
     def collapse_data(cls, data_list, function, kdims=None, **kwargs):
         if isinstance(function, np.ufunc):
@@ -91,7 +116,7 @@ class Raster(Element2D):
             return function(np.dstack(data_list), axis=-1, **kwargs)
 
 
-    def sample(self, samples=[], **sample_values):
+    def sample(self, samples=[], interpolate=False, **sample_values):
         """
         Sample the Raster along one or both of its dimensions,
         returning a reduced dimensionality type, which is either
@@ -99,23 +124,38 @@ class Raster(Element2D):
         and a new_xaxis is provided the sample will be the value
         of the sampled unit indexed by the value in the new_xaxis
         tuple.
+
+        Samples along both dimensions may be supplied as a list of
+        coordinate tuples, an (N, 2) array or a tuple of x- and
+        y-coordinate arrays and are looked up in a single vectorized
+        pass. If interpolate is enabled the sampled values are
+        bilinearly interpolated between the closest cells.
         """
-        if isinstance(samples, tuple):
-            X, Y = samples
-            samples = zip(X, Y)
         params = dict(self.get_param_values(onlychanged=True),
                       vdims=self.vdims)
         params.pop('extents', None)
         params.pop('bounds', None)
         if len(sample_values) == self.ndims or len(samples):
-            if not len(samples):
-                samples = zip(*[c if isinstance(c, list) else [c] for _, c in
-                               sorted([(self.get_dimension_index(k), v) for k, v in
-                                       sample_values.items()])])
-            table_data = [c+(self._zdata[self._coord2matrix(c)],)
-                          for c in samples]
+            if isinstance(samples, tuple):
+                xs, ys = samples
+            elif len(samples):
+                xs, ys = zip(*samples)
+            else:
+                xs, ys = [c if isinstance(c, list) else [c] for _, c in
+                          sorted([(self.get_dimension_index(k), v) for k, v in
+                                  sample_values.items()])]
+            xs, ys = np.asarray(xs), np.asarray(ys)
+            if len(xs) != len(ys):
+                if 1 not in (len(xs), len(ys)):
+                    raise ValueError('Raster sampling requires the same number of '
+                                     'x- and y-coordinates, got %d x-coordinates '
+                                     'and %d y-coordinates.' % (len(xs), len(ys)))
+                # A single coordinate is sampled along all the others
+                xs, ys = np.broadcast_arrays(xs, ys)
+            values = self._sample_values(xs, ys, interpolate)
+            columns = [xs, ys] + ([values] if values.ndim == 1 else list(values.T))
             params['kdims'] = self.kdims
-            return Table(table_data, **params)
+            return Table(tuple(columns), **params)
         else:
             dimension, sample_coord = list(sample_values.items())[0]
             if isinstance(sample_coord, slice):
@@ -341,6 +381,26 @@ class QuadMesh(Raster):
                      for i in [1, 0])
 
 
+    def _coords2matrix(self, xs, ys):
+        if not self._grid:
+            raise NotImplementedError("Sampling of non-grid based QuadMesh"
+                                      "currently not supported")
+        return (np.digitize(ys, self.data[1])-1,
+                np.digitize(xs, self.data[0])-1)
+
+
+    def _interpolation_weights(self, xs, ys):
+        if not self._grid:
+            raise NotImplementedError("Sampling of non-grid based QuadMesh"
+                                      "currently not supported")
+        # Convert to continuous indices relative to the cell centers
+        indices = []
+        for coords, edges in [(ys, self.data[1]), (xs, self.data[0])]:
+            centers = (edges[1:]+edges[:-1])/2.
+            indices.append(np.interp(coords, centers, np.arange(len(centers))))
+        return bilinear_weights(indices[0], indices[1], self.data[2].shape)
+
+
     def range(self, dimension, data_range=True):
         idx = self.get_dimension_index(dimension)
         if data_range and idx in [0, 1]:
@@ -467,7 +527,7 @@ class Image(SheetCoordinateSystem, Raster):
                 if np.isscalar(v):
                     coords.append((0, v) if idx else (v, 0))
                 else:
-                    if isinstance(coords, tuple):
+                    if not coords:
                         coords = [(0, c) if idx else (c, 0) for c in v]
                     if len(coords) not in [0, len(v)]:
                         raise ValueError("Length of samples must match")
@@ -477,14 +537,19 @@ class Image(SheetCoordinateSystem, Raster):
                 getter.append(idx)
         else:
             getter = [0, 1]
+        if isinstance(coords, np.ndarray):
+            xs, ys = self.closest_cell_centers(coords[:, 0], coords[:, 1])
+            return np.column_stack([xs, ys])
         getter = itemgetter(*sorted(getter))
-        coords = list(coords)
-        if len(coords) == 1:
+        coords = coords if isinstance(coords, tuple) else list(coords)
+        if len(coords) == 1 and isinstance(coords[0], tuple):
             coords = coords[0]
         if isinstance(coords, tuple):
             return getter(self.closest_cell_center(*coords))
-        else:
-            return [getter(self.closest_cell_center(*el)) for el in coords]
+        elif not coords:
+            return []
+        xs, ys = self.closest_cell_centers(*zip(*coords))
+        return [getter(c) for c in zip(xs, ys)]
 
 
     def __getitem__(self, coords):
@@ -505,7 +570,9 @@ class Image(SheetCoordinateSystem, Raster):
 
         coords = coords[:2]
         if not any([isinstance(el, slice) for el in coords]):
-            return self.data[self.sheet2matrixidx(*coords)]
+            if all(np.isscalar(c) for c in coords):
+                return self.data[self.sheet2matrixidx(*coords)]
+            return self._sample_values(*coords)
         if all([isinstance(c, slice) for c in coords]):
             l, b, r, t = self.bounds.lbrt()
             xcoords, ycoords = coords
@@ -551,6 +618,14 @@ class Image(SheetCoordinateSystem, Raster):
         return self.sheet2matrixidx(*coord)
 
 
+    def _coords2matrix(self, xs, ys):
+        return self.sheet2matrixidx_array(xs, ys)
+
+
+    def _interpolation_weights(self, xs, ys):
+        return self.sheet2matrix_bilinear(xs, ys)
+
+
     def dimension_values(self, dim, expanded=True, flat=True):
         """
         The set of samples available along a particular dimension.
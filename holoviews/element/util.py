@@ -6,23 +6,11 @@ import numpy as np
 from ..core import Dataset, OrderedDict
 from ..core.operation import ElementOperation
 from ..core.util import (is_nan, sort_topologically, one_to_one,
-                         cartesian_product, is_cyclic)
+                         cartesian_product, is_cyclic, pd, LazyModule)
+from .path import PackedPaths
 
-try:
-    import pandas as pd
-    from ..core.data import PandasInterface
-except:
-    pd = None
-
-try:
-    import dask
-except:
-    dask = None
-
-try:
-    import xarray as xr
-except:
-    xr = None
+dask_array = LazyModule('dask.array')
+xr = LazyModule('xarray')
 
 
 def toarray(v, index_value=False):
@@ -31,7 +19,7 @@ def toarray(v, index_value=False):
     necessary. If index_value is True, a value is returned instead of
     an array holding a single value.
     """
-    if dask and isinstance(v, dask.array.Array):
+    if dask_array.imported() and isinstance(v, dask_array.Array):
         arr =  v.compute()
         return arr[()] if index_value else arr
     else:
@@ -56,7 +44,7 @@ def reduce_fn(x):
     """
     Aggregation function to get the first non-zero value.
     """
-    values = x.values if pd and isinstance(x, pd.Series) else x
+    values = x.values if pd.imported() and isinstance(x, pd.Series) else x
     for v in values:
         if not is_nan(v):
             return v
@@ -142,6 +130,7 @@ class categorical_aggregate2d(ElementOperation):
         concat_data = obj.interface.concatenate([dense_data, obj], datatype=[dtype])
         reindexed = concat_data.reindex([xdim, ydim], vdims)
         if pd:
+            from ..core.data.pandas import PandasInterface
             df = PandasInterface.as_dframe(reindexed)
             df = df.groupby([xdim, ydim], sort=False).first().reset_index()
             agg = reindexed.clone(df)
@@ -174,3 +163,504 @@ class categorical_aggregate2d(ElementOperation):
         obj = Dataset(obj, datatype=[dtype])
         xcoords, ycoords = self._get_coords(obj)
         return self._aggregate_dataset(obj, xcoords, ycoords)
+
+
+#==========================#
+# Marching squares contours #
+#==========================#
+
+# Corners of a grid cell in (column, row) index space ordered
+# top-left, top-right, bottom-right and bottom-left, where edge i
+# connects corner i to corner i+1.
+_CELL_CORNERS = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=float)
+
+
+def _segment_table():
+    """
+    Builds a lookup table of the line segments crossing a grid cell
+    for each of the 16 possible combinations of corners lying above
+    the contour level. The table is indexed by the case plus 16 if
+    the cell center lies above the level, which resolves the
+    ambiguous saddle cases. Each segment is given as a pair of cell
+    edges oriented such that lower values lie to its left.
+    """
+    table = -np.ones((32, 2, 2), dtype=np.int64)
+    midpoints = (_CELL_CORNERS + np.roll(_CELL_CORNERS, -1, axis=0))/2.
+    for key in range(32):
+        above = [bool(key & (1 << c)) for c in range(4)]
+        center = key >= 16
+        crossing = [e for e in range(4) if above[e] != above[(e+1) % 4]]
+        if len(crossing) == 2:
+            segments = [(crossing, 0)]
+        elif len(crossing) == 4:
+            segments = [([(c-1) % 4, c], c) for c in range(4)
+                        if above[c] != center]
+        else:
+            segments = []
+        for i, ((e0, e1), ref) in enumerate(segments):
+            a, b, r = midpoints[e0], midpoints[e1], _CELL_CORNERS[ref]
+            cross = (b[0]-a[0])*(r[1]-a[1]) - (b[1]-a[1])*(r[0]-a[0])
+            if (cross > 0) == above[ref]:
+                e0, e1 = e1, e0
+            table[key, i] = (e0, e1)
+    return table
+
+def _triangle_table():
+    """
+    Builds a lookup table of the line segment crossing the triangle
+    formed by the three valid corners of a grid cell with a single
+    missing corner. The table is indexed by the missing corner times
+    16 plus the combination of corners lying above the contour level.
+    The segment is given as a pair of cell edges, where edge 4 is the
+    diagonal of the cell, oriented as in the cell lookup table.
+    """
+    table = -np.ones((64, 2), dtype=np.int64)
+    midpoints = np.vstack([(_CELL_CORNERS + np.roll(_CELL_CORNERS, -1, axis=0))/2.,
+                           [(0.5, 0.5)]])
+    for key in range(64):
+        missing = key // 16
+        above = [bool(key & (1 << c)) for c in range(4)]
+        corners = [(missing+i) % 4 for i in (1, 2, 3)]
+        sides = [(corners[0], corners[1], corners[0]),
+                 (corners[1], corners[2], corners[1]),
+                 (corners[2], corners[0], 4)]
+        crossing = [e for c0, c1, e in sides if above[c0] != above[c1]]
+        if len(crossing) != 2:
+            continue
+        ref = [c for c in corners if sum(above[o] == above[c] for o in corners) == 1][0]
+        e0, e1 = crossing
+        a, b, r = midpoints[e0], midpoints[e1], _CELL_CORNERS[ref]
+        cross = (b[0]-a[0])*(r[1]-a[1]) - (b[1]-a[1])*(r[0]-a[0])
+        if (cross > 0) == above[ref]:
+            e0, e1 = e1, e0
+        table[key] = (e0, e1)
+    return table
+
+_SEGMENT_TABLE = _segment_table()
+_SEGMENT_COUNTS = (_SEGMENT_TABLE[:, :, 0] >= 0).sum(axis=1)
+_TRIANGLE_TABLE = _triangle_table()
+
+# Number of node ids reserved for each grid sample on the boundary of
+# a filled contour, allowing a sample at which two separate regions of
+# valid cells touch to be visited once per region.
+_SAMPLE_SLOTS = 5
+
+
+def _grid_coords(x, y, z):
+    """
+    Broadcasts the x- and y-coordinates of the grid samples to the
+    shape of the z-array.
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if x.ndim == 1 and y.ndim == 1:
+        x, y = np.meshgrid(x, y)
+    if not (x.shape == y.shape == z.shape):
+        raise ValueError("Contour coordinates must match the shape "
+                         "of the value array.")
+    return x, y
+
+
+def _num_edges(shape):
+    """
+    Returns the number of edge ids of a grid, counting the edges
+    along the rows and columns and two diagonals per cell.
+    """
+    ny, nx = shape
+    return ny*(nx-1) + (ny-1)*nx + 2*(ny-1)*(nx-1)
+
+
+def _edge_endpoints(edges, shape):
+    """
+    Returns the flat indices of the two grid samples connected by
+    each edge. Edges are numbered by first enumerating all edges
+    along the rows followed by all edges along the columns and
+    finally the diagonals of each cell, running from the top-left to
+    the bottom-right corner and from the top-right to the bottom-left
+    corner.
+    """
+    ny, nx = shape
+    nrow_edges = ny*(nx-1)
+    nedges = nrow_edges + (ny-1)*nx
+    row_edge = edges < nrow_edges
+    i, j = np.divmod(edges, nx-1)
+    start = np.where(row_edge, i*nx+j, edges-nrow_edges)
+    end = start + np.where(row_edge, 1, nx)
+    diagonal = edges >= nedges
+    cell, direction = np.divmod(edges-nedges, 2)
+    ci, cj = np.divmod(cell, nx-1)
+    start = np.where(diagonal, ci*nx+cj+direction, start)
+    end = np.where(diagonal, (ci+1)*nx+cj+1-direction, end)
+    return start, end
+
+
+def _cell_corners(array):
+    """
+    Returns the values of a 2D array at the top-left, top-right,
+    bottom-right and bottom-left corner of each grid cell as a flat
+    array per corner.
+    """
+    return [array[:-1, :-1].ravel(), array[:-1, 1:].ravel(),
+            array[1:, 1:].ravel(), array[1:, :-1].ravel()]
+
+
+def _cell_edges(shape, cells):
+    """
+    Returns the ids of the top, right, bottom and left edge of the
+    supplied cells along with the id of their first diagonal.
+    """
+    ny, nx = shape
+    nrow_edges = ny*(nx-1)
+    nedges = nrow_edges + (ny-1)*nx
+    rows, cols = np.divmod(cells, nx-1)
+    top, left = rows*(nx-1)+cols, nrow_edges+rows*nx+cols
+    return np.column_stack([top, left+1, top+nx-1, left, nedges+2*cells])
+
+
+def _missing_corners(z):
+    """
+    Returns the number of missing corners of each grid cell and the
+    index of the first missing corner.
+    """
+    missing = np.column_stack(_cell_corners(np.isnan(z)))
+    return missing.sum(axis=1), missing.argmax(axis=1)
+
+
+def _isoline_segments(z, level):
+    """
+    Computes the oriented segments of the isoline at the supplied
+    level as pairs of edge ids along with the flat index of the cell
+    each segment crosses. Like the corner masking in matplotlib,
+    cells with a single missing corner are contoured across the
+    triangle formed by the remaining corners, while cells with more
+    than one missing corner are skipped.
+    """
+    with np.errstate(invalid='ignore'):
+        above = [c > level for c in _cell_corners(z)]
+        center = sum(_cell_corners(z))/4. > level
+    cases = above[0]*1 + above[1]*2 + above[2]*4 + above[3]*8
+    nmissing, missing = _missing_corners(z)
+    key = np.where(nmissing == 0, cases + center*16, 0)
+
+    cells = np.flatnonzero(_SEGMENT_COUNTS[key])
+    key = key[cells]
+    cell_edges = _cell_edges(z.shape, cells)
+    starts, ends, indices = [], [], []
+    for i in range(2):
+        idx = np.flatnonzero(_SEGMENT_COUNTS[key] > i)
+        local = _SEGMENT_TABLE[key[idx], i]
+        starts.append(cell_edges[idx, local[:, 0]])
+        ends.append(cell_edges[idx, local[:, 1]])
+        indices.append(cells[idx])
+
+    triangles = np.flatnonzero(nmissing == 1)
+    local = _TRIANGLE_TABLE[missing[triangles]*16 + cases[triangles]]
+    crossed = local[:, 0] >= 0
+    triangles, local = triangles[crossed], local[crossed]
+    cell_edges = _cell_edges(z.shape, triangles)
+    # The diagonal connects the two corners adjacent to the missing one
+    cell_edges[:, 4] += 1 - missing[triangles] % 2
+    idx = np.arange(len(triangles))
+    starts.append(cell_edges[idx, local[:, 0]])
+    ends.append(cell_edges[idx, local[:, 1]])
+    indices.append(triangles)
+    return np.concatenate(starts), np.concatenate(ends), np.concatenate(indices)
+
+
+def _interpolation_weights(start, end, level):
+    """
+    Computes the fraction along each edge at which the values cross
+    the level, placing the crossing on the finite end of edges
+    connected to an infinite value.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = (level-start)/(end-start)
+    t = np.where(np.isfinite(start), t, 1)
+    return np.where(np.isfinite(end), t, 0)
+
+
+def _cell_sides(z):
+    """
+    Returns the sides of all cells and triangles taking part in the
+    contouring as the flat indices of the start and end sample, the
+    edge id and the cell of each side. The sides of each cell are
+    oriented in the same rotational direction, keeping the interior
+    of the cell on their left.
+    """
+    ny, nx = z.shape
+    corners = np.column_stack(_cell_corners(np.arange(ny*nx).reshape(ny, nx)))
+    nmissing, missing = _missing_corners(z)
+    full = np.flatnonzero(nmissing == 0)
+    cell_edges = _cell_edges(z.shape, full)
+    starts = [corners[full, k] for k in range(4)]
+    ends = [corners[full, (k+1) % 4] for k in range(4)]
+    edges = [cell_edges[:, k] for k in range(4)]
+    cells = [full]*4
+
+    triangles = np.flatnonzero(nmissing == 1)
+    first = missing[triangles]
+    cell_edges = _cell_edges(z.shape, triangles)
+    cell_edges[:, 4] += 1 - first % 2
+    idx = np.arange(len(triangles))
+    c1, c2, c3 = [(first+i) % 4 for i in (1, 2, 3)]
+    for c0, c1, e in [(c1, c2, c1), (c2, c3, c2), (c3, c1, 4)]:
+        starts.append(corners[triangles, c0])
+        ends.append(corners[triangles, c1])
+        edges.append(cell_edges[idx, e])
+        cells.append(triangles)
+    return [np.concatenate(a) for a in (starts, ends, edges, cells)]
+
+
+def _sample_slots(starts, ends, edges, cells, boundary, npoints):
+    """
+    Assigns a slot to the start and end sample of each cell side.
+    Where separate regions of valid cells touch at a sample, each
+    side entering the sample along the boundary is paired with the
+    boundary side leaving it around the same region, and each pair
+    is assigned its own slot so the regions are traced separately.
+    """
+    start_slots = np.zeros(len(starts), dtype=np.int64)
+    end_slots = np.zeros(len(ends), dtype=np.int64)
+    pinched = np.flatnonzero(np.bincount(starts[boundary], minlength=npoints) > 1)
+    if not len(pinched):
+        return start_slots, end_slots
+    by_end, by_start = np.argsort(ends), np.argsort(starts)
+    end_bounds = np.searchsorted(ends[by_end], [pinched, pinched+1])
+    start_bounds = np.searchsorted(starts[by_start], [pinched, pinched+1])
+    for i in range(len(pinched)):
+        incoming = by_end[end_bounds[0, i]:end_bounds[1, i]]
+        outgoing = by_start[start_bounds[0, i]:start_bounds[1, i]]
+        for slot, side in enumerate(incoming[boundary[incoming]]):
+            # Rotate through the cells around the sample until the
+            # side leaving the sample lies on the boundary
+            cell = cells[side]
+            while True:
+                leaving = outgoing[cells[outgoing] == cell][0]
+                if boundary[leaving]:
+                    break
+                cell = cells[incoming[edges[incoming] == edges[leaving]][0]]
+            end_slots[side] = start_slots[leaving] = slot+1
+    return start_slots, end_slots
+
+
+def _boundary_segments(z, lower, upper):
+    """
+    Computes the oriented segments along the boundary of the cells
+    and triangles taking part in the contouring which lie between
+    the lower and upper level, keeping the interior on their left.
+    Nodes are numbered like the isoline nodes of the lower and upper
+    level, followed by the slots of the grid samples.
+    """
+    nedges = _num_edges(z.shape)
+    starts, ends, edges, cells = _cell_sides(z)
+    boundary = np.bincount(edges, minlength=nedges)[edges] == 1
+    start_slots, end_slots = _sample_slots(starts, ends, edges, cells,
+                                           boundary, z.size)
+    starts, ends, edges, cells = (starts[boundary], ends[boundary],
+                                  edges[boundary], cells[boundary])
+    start_slots, end_slots = start_slots[boundary], end_slots[boundary]
+    start_nodes = 2*nedges + starts*_SAMPLE_SLOTS + start_slots
+    end_nodes = 2*nedges + ends*_SAMPLE_SLOTS + end_slots
+
+    zf = z.ravel()
+    zs, ze = zf[starts], zf[ends]
+    sides = np.arange(len(starts))
+    event_sides, event_ts, event_nodes = [sides], [np.zeros(len(sides))], [start_nodes]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for i, level in enumerate([lower, upper]):
+            crossing = (zs > level) != (ze > level)
+            event_sides.append(sides[crossing])
+            event_ts.append(_interpolation_weights(zs[crossing], ze[crossing], level))
+            event_nodes.append(i*nedges + edges[crossing])
+    event_sides, event_ts, event_nodes = [np.concatenate(e) for e in
+                                          (event_sides, event_ts, event_nodes)]
+    order = np.lexsort((event_ts, event_sides))
+    event_sides, event_ts, event_nodes = (event_sides[order], event_ts[order],
+                                          event_nodes[order])
+
+    last = np.roll(event_sides, -1) != event_sides
+    if len(last):
+        last[-1] = True
+    next_ts = np.where(last, 1, np.roll(event_ts, -1))
+    next_nodes = np.where(last, end_nodes[event_sides], np.roll(event_nodes, -1))
+    t = (event_ts+next_ts)/2.
+    zstart, zend = zs[event_sides], ze[event_sides]
+    with np.errstate(invalid='ignore'):
+        values = np.where(t == 0, zstart, np.where(t == 1, zend,
+                                                   zstart + t*(zend-zstart)))
+        inside = (values > lower) & (values <= upper)
+    return event_nodes[inside], next_nodes[inside], cells[event_sides[inside]]
+
+
+def _rank_paths(pred):
+    """
+    Ranks the nodes of a set of linked lists by their distance from
+    the first node of their list using pointer jumping, where pred
+    holds the preceding node of each node or len(pred) for the first
+    node. Returns the first node of the list each node belongs to,
+    the rank of each node and a mask of the nodes which could not be
+    ranked because they are part of a cycle.
+    """
+    n = len(pred)
+    pred = np.append(pred, n)
+    parent = np.where(pred[:n] == n, np.arange(n), pred[:n])
+    rank = (pred[:n] != n).astype(np.int64)
+    active = np.flatnonzero(pred[parent] != n)
+    while len(active):
+        ancestors = parent[active]
+        rank[active] += rank[ancestors]
+        parent[active] = parent[ancestors]
+        # The number of unranked nodes strictly decreases until only
+        # the nodes on cycles remain
+        unranked = active[pred[parent[active]] != n]
+        if len(unranked) == len(active):
+            break
+        active = unranked
+    cyclic = np.zeros(n, dtype=bool)
+    cyclic[active] = True
+    return parent, rank, cyclic
+
+
+def _cycle_minimum(succ):
+    """
+    Finds the smallest node on each cycle of a set of nodes which
+    are all part of a cycle, given the successor of each node.
+    """
+    jump, smallest = succ, np.arange(len(succ))
+    while True:
+        updated = np.minimum(smallest, smallest[jump])
+        if np.array_equal(updated, smallest):
+            return smallest
+        smallest, jump = updated, jump[jump]
+
+
+def _chain_segments(starts, ends, keys, nnodes):
+    """
+    Joins oriented segments sharing nodes into paths, returning the
+    ordered node ids of all paths and the offsets of each path. The
+    joining is performed by pointer jumping so that it is vectorized
+    over all paths. Paths are ordered by the key of their first
+    segment, and closed paths repeat their first node at the end.
+    """
+    used = np.zeros(nnodes, dtype=bool)
+    used[starts] = True
+    used[ends] = True
+    nodes = np.flatnonzero(used)
+    n = len(nodes)
+    if not n:
+        return nodes, np.zeros(1, dtype=np.int64)
+    index = np.cumsum(used)-1
+    src, dst = index[starts], index[ends]
+    nodekeys = np.zeros(n, dtype=np.int64)
+    nodekeys[src] = keys
+    pred = np.full(n, n, dtype=np.int64)
+    pred[dst] = src
+    parent, rank, cyclic = _rank_paths(pred)
+
+    # Break each cycle at its smallest node and rank the cycles
+    heads = np.zeros(0, dtype=np.int64)
+    if cyclic.any():
+        cycle_nodes = np.flatnonzero(cyclic)
+        local = np.cumsum(cyclic)-1
+        succ = np.empty(len(cycle_nodes), dtype=np.int64)
+        succ[local[src[cyclic[src]]]] = local[dst[cyclic[src]]]
+        smallest = _cycle_minimum(succ)
+        heads = np.flatnonzero(smallest == np.arange(len(succ)))
+        cycle_pred = local[pred[cycle_nodes]]
+        cycle_pred[heads] = len(cycle_nodes)
+        cycle_parent, cycle_rank, _ = _rank_paths(cycle_pred)
+        parent[cycle_nodes] = cycle_nodes[cycle_parent]
+        rank[cycle_nodes] = cycle_rank
+        heads = cycle_nodes[heads]
+        pred[heads] = n
+
+    first = np.flatnonzero(pred == n)
+    first = first[np.argsort(nodekeys[first], kind='mergesort')]
+    ordinal = np.empty(n, dtype=np.int64)
+    ordinal[first] = np.arange(len(first))
+    path_index = ordinal[parent]
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(path_index))])
+    sequence = np.empty(n, dtype=np.int64)
+    sequence[offsets[path_index]+rank] = np.arange(n)
+
+    closed = np.zeros(n, dtype=bool)
+    closed[heads] = True
+    closed = closed[first]
+    sequence = np.insert(sequence, offsets[1:][closed], first[closed])
+    offsets = offsets + np.concatenate([[0], np.cumsum(closed)])
+    return nodes[sequence], offsets
+
+
+def _contour_paths(x, y, z, starts, ends, keys, levels):
+    """
+    Orients the segments to the coordinate system of the grid,
+    joins them into paths and interpolates the coordinates of each
+    node, where nodes are numbered by the isoline edge crossings at
+    each of the levels followed by the grid samples.
+    """
+    ny, nx = z.shape
+    det = ((x[0, 1]-x[0, 0])*(y[1, 0]-y[0, 0]) -
+           (y[0, 1]-y[0, 0])*(x[1, 0]-x[0, 0]))
+    if det < 0:
+        starts, ends = ends, starts
+    nedges = _num_edges(z.shape)
+    nnodes = len(levels)*nedges + ny*nx*_SAMPLE_SLOTS
+    nodes, offsets = _chain_segments(starts, ends, keys, nnodes)
+    xf, yf, zf = x.ravel(), y.ravel(), z.ravel()
+    level_index, edges = np.divmod(nodes, nedges)
+    crossing = level_index < len(levels)
+    start, end = _edge_endpoints(edges[crossing], z.shape)
+    level = np.asarray(levels, dtype=float)[level_index[crossing]]
+    t = _interpolation_weights(zf[start], zf[end], level)
+
+    coords = np.empty((len(nodes), 2))
+    coords[crossing, 0] = xf[start] + t*(xf[end]-xf[start])
+    coords[crossing, 1] = yf[start] + t*(yf[end]-yf[start])
+    samples = (nodes[~crossing] - len(levels)*nedges) // _SAMPLE_SLOTS
+    coords[~crossing, 0] = xf[samples]
+    coords[~crossing, 1] = yf[samples]
+    return PackedPaths(coords, offsets)
+
+
+def isolines(x, y, z, level):
+    """
+    Computes the contour lines of a 2D array of values at the
+    supplied level using the marching squares algorithm, returning
+    a PackedPaths object. The x- and y-coordinates of the samples may
+    be supplied as 1D arrays matching the columns and rows of the
+    z-array or as 2D arrays matching its shape. Each path is
+    oriented such that lower values lie to its left and closed paths
+    repeat their first coordinate. Missing values are handled like
+    the default corner masking in matplotlib, contouring the triangle
+    formed by the valid corners of cells with one missing corner.
+    """
+    z = np.asarray(z, dtype=float)
+    x, y = _grid_coords(x, y, z)
+    if z.shape[0] < 2 or z.shape[1] < 2:
+        return PackedPaths(np.empty((0, 2)), [0])
+    starts, ends, cells = _isoline_segments(z, level)
+    return _contour_paths(x, y, z, starts, ends, cells, [level])
+
+
+def isobands(x, y, z, lower, upper):
+    """
+    Computes the filled contour polygons enclosing the values of a
+    2D array lying between the lower and upper level, returning a
+    PackedPaths object. The coordinates are supplied as for the
+    isolines function. Each polygon is oriented such that the
+    enclosed region lies to its left, which means holes are returned
+    as separate polygons winding in the opposite direction. Missing
+    values are masked as in the isolines function, excluding cells
+    with more than one missing corner from the polygons.
+    """
+    z = np.asarray(z, dtype=float)
+    x, y = _grid_coords(x, y, z)
+    if z.shape[0] < 2 or z.shape[1] < 2:
+        return PackedPaths(np.empty((0, 2)), [0])
+    nedges = _num_edges(z.shape)
+    lstarts, lends, lcells = _isoline_segments(z, lower)
+    ustarts, uends, ucells = _isoline_segments(z, upper)
+    pstarts, pends, pcells = _boundary_segments(z, lower, upper)
+    starts = np.concatenate([lends, ustarts+nedges, pstarts])
+    ends = np.concatenate([lstarts, uends+nedges, pends])
+    cells = np.concatenate([lcells, ucells, pcells])
+    return _contour_paths(x, y, z, starts, ends, cells, [lower, upper])
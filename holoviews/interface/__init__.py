@@ -1,16 +1,15 @@
 from ..core import Dimensioned, AttrTree
+from ..core.util import LazyModule
 
-try:
-    import pandas
+# Availability checks, the libraries are only imported on first use
+pandas = LazyModule('pandas')
+seaborn = LazyModule('seaborn')
+
+if pandas:
     from .pandas import DFrame # noqa (API import)
-except:
-    pandas = None
 
-try:
-    import seaborn
+if pandas and seaborn:
     from .seaborn import *     # noqa (API import)
-except:
-    seaborn = None
 
 from .collector import *       # noqa (API import)
 
@@ -2,7 +2,11 @@
 AttributeTree, Collector and related classes offer optional functionality
 for holding and collecting DataView objects.
 """
+import os
 import uuid
+import timeit
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
@@ -11,7 +15,7 @@ import param
 from ..core import Dimension, ViewableElement, UniformNdMapping,\
  GridSpace, AttrTree, Layout, HoloMap
 from ..core.util import ProgressIndicator
-from ..core.io import Reference
+from ..core.io import Reference, Pickler, Unpickler
 
 Time = Dimension("Time", type=param.Dynamic.time_fn.time_type)
 
@@ -292,6 +296,15 @@ class Collect(object):
             return attrtree
 
         val = self._get_result(attrtree, time, times)
+        return self._update(attrtree, val, time)
+
+
+    def _update(self, attrtree, val, time):
+        """
+        Merges the result of the hook into the supplied Layout,
+        allowing the result to be computed separately, e.g. in a
+        different thread.
+        """
         if val is None:  return attrtree
 
         if self.mode == 'merge':
@@ -476,6 +489,8 @@ class Collector(AttrTree):
         fixed_error = 'Cannot set %r as Collector specification disabled after first call.'
         self.__dict__['_fixed_error'] = fixed_error
         self.__dict__['progress_label'] = 'Completion'
+        # Time taken in seconds by each task at each step
+        self.__dict__['timings'] = OrderedDict()
 
 
     @property
@@ -514,7 +529,30 @@ class Collector(AttrTree):
         return task
 
 
-    def __call__(self, attrtree=Layout(), times=[], strict=False):
+    def __call__(self, attrtree=Layout(), times=[], strict=False, threads=1,
+                 checkpoint=None, checkpoint_interval=1, resume=False):
+        """
+        Runs the scheduled tasks at each of the supplied times,
+        accumulating the results in the supplied Layout.
+
+        Consecutive Collect tasks do not depend on each other and
+        may be computed concurrently in the specified number of
+        threads, while Analyze tasks are run in order since they may
+        depend on the results of the preceding tasks.
+
+        If a checkpoint filename is supplied, the accumulated Layout
+        is saved to a .hvz archive every checkpoint_interval steps.
+        When resume is enabled and the checkpoint exists, collection
+        continues from the last checkpointed time. The time taken by
+        each task at each step is recorded in the timings dictionary.
+        """
+        if checkpoint is not None:
+            checkpoint = Pickler._filename(checkpoint)
+        if resume and checkpoint is not None and os.path.isfile(checkpoint):
+            attrtree, checkpoint_time = self.load_checkpoint(checkpoint)
+            times = [t for t in times if t > checkpoint_time]
+            if not times:
+                return attrtree
 
         current_time = self.time_fn()
         if times != sorted(times):
@@ -536,8 +574,10 @@ class Collector(AttrTree):
                          if update_progress else self.interval_hook)
 
         self._schedule_tasks(times, strict)
+        self.timings.clear()
         (self.fixed, attrtree.fixed) = (False, False)
 
+        pool = ThreadPool(threads) if threads > 1 else None
         try:
             for i, t in enumerate(np.diff(times)):
                 interval_hook(float(t))
@@ -545,27 +585,126 @@ class Collector(AttrTree):
                 # An empty attrtree buffer stops analysis repeatedly
                 # computing results over the entire accumulated map
                 attrtree_buffer = Layout()
-                for task in self._scheduled_tasks:
-                    try:
-                        if isinstance(task, Analyze) and task.mapwise:
-                            task(attrtree, self.time_fn(), times)
-                        else:
-                            task(attrtree_buffer, self.time_fn(), times)
-                            attrtree.update(attrtree_buffer)
-                    except Exception as e:
-                        param.main.warning("Task %s at time %s failed with following "
-                                           "exception and was skipped:\n%s",
-                                           task, self.time_fn(), e)
+                for stage in self._task_stages():
+                    self._run_stage(stage, attrtree, attrtree_buffer, times, pool)
                     if update_progress:
                         interval_hook.percent_range = (completion[i],
                                                        completion[i+1])
+                attrtree.update(attrtree_buffer)
                 interval_hook(0)
 
+                if checkpoint is not None and ((i+1) % checkpoint_interval == 0
+                                               or i == len(times)-2):
+                    self.save_checkpoint(attrtree, checkpoint)
+
             (self.fixed, attrtree.fixed) = (True, True)
             return attrtree
         except KeyboardInterrupt:
             (self.fixed, attrtree.fixed) = (True, True)
             return attrtree
+        finally:
+            if pool is not None:
+                pool.close()
+
+
+    def _task_stages(self):
+        """
+        Splits the scheduled tasks into stages, grouping consecutive
+        Collect tasks, which may be computed concurrently, while each
+        Analyze task forms its own stage.
+        """
+        stages = []
+        for task in self._scheduled_tasks:
+            if (stages and not isinstance(task, Analyze) and
+                not isinstance(stages[-1][0], Analyze)):
+                stages[-1].append(task)
+            else:
+                stages.append([task])
+        return stages
+
+
+    def _timed_result(self, task, attrtree, time, times):
+        """
+        Computes the result of the task, returning it along with the
+        time taken or the exception that was raised.
+        """
+        start = timeit.default_timer()
+        try:
+            if task.times and time not in task.times:
+                result = None
+            else:
+                result = task._get_result(attrtree, time, times)
+            return result, None, timeit.default_timer()-start
+        except Exception as e:
+            return None, e, timeit.default_timer()-start
+
+
+    def _run_stage(self, stage, attrtree, attrtree_buffer, times, pool):
+        """
+        Runs a stage of tasks, computing the results concurrently if a
+        thread pool is supplied and merging them in order.
+        """
+        time = self.time_fn()
+        mapwise = isinstance(stage[0], Analyze) and stage[0].mapwise
+        if mapwise:
+            # Mapwise analysis operates on the accumulated map
+            attrtree.update(attrtree_buffer)
+        target = attrtree if mapwise else attrtree_buffer
+        run = lambda task: self._timed_result(task, target, time, times)
+        if pool is None or len(stage) == 1:
+            results = [run(task) for task in stage]
+        else:
+            results = pool.map(run, stage)
+
+        for task, (result, error, duration) in zip(stage, results):
+            if error is None:
+                try:
+                    task._update(target, result, time)
+                except Exception as e:
+                    error = e
+            if error is not None:
+                param.main.warning("Task %s at time %s failed with following "
+                                   "exception and was skipped:\n%s",
+                                   task, time, error)
+            path = '.'.join(task.path) if isinstance(task.path, tuple) else str(task)
+            self.timings.setdefault(path, []).append(duration)
+
+
+    def save_checkpoint(self, attrtree, filename):
+        """
+        Saves the accumulated Layout along with the current time to a
+        .hvz archive. The archive is written to a temporary file, which
+        is renamed over any previous checkpoint, replacing it atomically
+        except on Windows under Python 2.
+        """
+        if not len(attrtree.data):
+            return
+        base, ext = os.path.splitext(filename)
+        tmp = base + '.tmp' + ext
+        Pickler.save(attrtree, tmp, info={'collector_time': self.time_fn()})
+        if hasattr(os, 'replace'):
+            os.replace(tmp, filename)
+        else:
+            # Python 2 only renames over existing files on POSIX
+            if os.name == 'nt' and os.path.isfile(filename):
+                os.remove(filename)
+            os.rename(tmp, filename)
+
+
+    @classmethod
+    def load_checkpoint(cls, filename):
+        """
+        Loads a Layout saved by save_checkpoint, returning it along
+        with the time at which the checkpoint was saved.
+        """
+        attrtree = Layout()
+        for entry in Unpickler.entries(filename):
+            component = Unpickler.load(filename, entries=[entry])
+            if entry.endswith('(L)'):
+                entry = entry[:-3]
+                component = list(component.data.values())[0]
+            attrtree.set_path(tuple(entry.split('.')), component)
+        return attrtree, Unpickler.info(filename)['collector_time']
 
 
     def verify_times(self, times, strict=False):
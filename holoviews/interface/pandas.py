@@ -11,17 +11,12 @@ from __future__ import absolute_import
 
 import numpy as np
 
-try:
-    import pandas as pd
-    from ..core.data import PandasInterface
-except:
-    pd = None
-    PandasInterface = None
-
 import param
 
 from ..core import ViewableElement, NdMapping, Dataset, NdOverlay,\
     NdLayout, GridSpace, HoloMap
+from ..core.data import Interface
+from ..core.util import pd
 from ..element import (Chart, Table, Curve, Scatter, Bars, Points,
                        VectorField, HeatMap, Scatter3D, Surface)
 
@@ -67,7 +62,7 @@ class DataFrameView(Dataset):
 
     def __init__(self, data, dimensions={}, kdims=None, clone_override=False,
                  index=None, columns=None, dtype=None, copy=True, **params):
-        if pd is None:
+        if not pd:
             raise Exception("Pandas is required for the Pandas interface.")
         if not isinstance(data, pd.DataFrame):
             data = pd.DataFrame(data, index=index, columns=columns, dtype=dtype)
@@ -87,7 +82,7 @@ class DataFrameView(Dataset):
                 dims[list(data.columns).index(name)] = dim
 
         ViewableElement.__init__(self, data, kdims=dims, **params)
-        self.interface = PandasInterface
+        self.interface = Interface.load('dataframe')
         self.data.columns = self.dimensions('key', True)
 
 
@@ -20,9 +20,10 @@ import datashader.transfer_functions as tf
 
 from ..core import (ElementOperation, Element, Dimension, NdOverlay,
                     Overlay, CompositeOverlay, Dataset)
-from ..core.data import PandasInterface, DaskInterface
+from ..core.data.pandas import PandasInterface
+from ..core.data.dask import DaskInterface
 from ..core.util import get_param_values, basestring
-from ..element import GridImage, Image, Path, Curve, Contours, RGB
+from ..element import GridImage, Image, Path, Curve, Contours, RGB, PackedPaths
 from ..streams import RangeXY
 
 
@@ -133,11 +134,14 @@ class aggregate(ElementOperation):
         x, y = obj.dimensions(label=True)[:2]
         if isinstance(obj, Path):
             glyph = 'line'
-            for p in obj.data:
-                df = pd.DataFrame(p, columns=obj.dimensions('key', True))
-                if isinstance(obj, Contours) and obj.vdims and obj.level:
-                    df[obj.vdims[0].name] = p.level
-                paths.append(df)
+            if isinstance(obj.data, PackedPaths):
+                paths.append(cls._packed_dframe(obj))
+            else:
+                for p in obj.data:
+                    df = pd.DataFrame(p, columns=obj.dimensions('key', True))
+                    if isinstance(obj, Contours) and obj.vdims and obj.level:
+                        df[obj.vdims[0].name] = obj.level
+                    paths.append(df)
         elif isinstance(obj, CompositeOverlay):
             for key, el in obj.data.items():
                 x, y, element, glyph = cls.get_agg_data(el)
@@ -171,6 +175,25 @@ class aggregate(ElementOperation):
         return x, y, Dataset(df, kdims=kdims, vdims=vdims), glyph
 
 
+    @classmethod
+    def _packed_dframe(cls, obj):
+        """
+        Converts a Path type backed by PackedPaths into a single
+        DataFrame, separating the paths by rows of NaNs.
+        """
+        packed = obj.data
+        breaks = packed.offsets[1:-1]
+        coords = np.insert(packed.coords.astype('float64'), breaks, np.NaN, axis=0)
+        df = pd.DataFrame(coords, columns=obj.dimensions('key', True))
+        if isinstance(obj, Contours) and obj.vdims:
+            if packed.values is not None:
+                values = np.repeat(packed.values.astype('float64'), packed.lengths)
+                df[obj.vdims[0].name] = np.insert(values, breaks, np.NaN)
+            elif obj.level:
+                df[obj.vdims[0].name] = obj.level
+        return df
+
+
     def _process(self, element, key=None):
         agg_fn = self.p.aggregator
         category = agg_fn.column if isinstance(agg_fn, ds.count_cat) else None
@@ -3,25 +3,28 @@ Collection of either extremely generic or simple ElementOperation
 examples.
 """
 
+import weakref
+import zlib
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
 import numpy as np
 
 import param
 from param import _is_number
 
 from ..core import (ElementOperation, NdOverlay, Overlay, GridMatrix,
-                    HoloMap, Dataset, Element, Collator)
-from ..core.data import ArrayInterface, DictInterface
-from ..core.util import find_minmax, group_sanitizer, label_sanitizer, pd
+                    HoloMap, DynamicMap, Dataset, Element, Collator)
+from ..core.data import DictInterface
+from ..core.util import find_minmax, group_sanitizer, label_sanitizer
 from ..element.chart import Histogram, Scatter
+from ..core.boundingregion import BoundingBox
 from ..element.raster import Raster, Image, RGB, QuadMesh
 from ..element.path import Contours, Polygons
-from ..element.util import categorical_aggregate2d
-from ..streams import RangeXY
+from ..element.util import categorical_aggregate2d, isolines, isobands
+from ..streams import RangeXY, PlotSize
 
-column_interfaces = [ArrayInterface, DictInterface]
-if pd:
-    from ..core.data import PandasInterface
-    column_interfaces.append(PandasInterface)
+column_interfaces = ['array', 'dictionary', 'dataframe']
 
 
 def identity(x,k): return x
@@ -400,7 +403,10 @@ class contours(ElementOperation):
     lines for a given set of contour levels.
 
     The return is an NdOverlay with a Contours layer for each given
-    level, overlaid on top of the input Image.
+    level, overlaid on top of the input Image. The contours are
+    computed using a vectorized marching squares algorithm, which
+    does not depend on matplotlib and allows the frames of a HoloMap
+    to be processed concurrently.
     """
 
     output_type = Overlay
@@ -412,46 +418,65 @@ class contours(ElementOperation):
         The group assigned to the output contours.""")
 
     filled = param.Boolean(default=False, doc="""
-        Whether to generate filled contours""")
+        Whether to generate filled contours, returning a Polygons
+        layer for the band between each consecutive pair of levels.""")
 
     overlaid = param.Boolean(default=True, doc="""
         Whether to overlay the contour on the supplied Element.""")
 
-    def _process(self, element, key=None):
+    threads = param.Integer(default=1, bounds=(1, None), doc="""
+        Number of threads used to compute the contours of the frames
+        of a HoloMap concurrently.""")
+
+    def __call__(self, element, **params):
+        self.p = param.ParamOverrides(self, params)
+        concurrent = (type(element) is HoloMap and self.p.dynamic is not True
+                      and self.p.threads > 1 and len(element) > 1)
+        if not concurrent:
+            return super(contours, self).__call__(element, **params)
+        pool = ThreadPool(min(self.p.threads, len(element)))
         try:
-            from matplotlib import pyplot as plt
-        except ImportError:
-            raise ImportError("contours operation requires matplotlib.")
-        figure_handle = plt.figure()
-        extent = element.range(0) + element.range(1)[::-1]
+            processed = pool.map(lambda item: self._process(item[1], key=item[0]),
+                                 element.items())
+        finally:
+            pool.close()
+        return element.clone(list(zip(element.keys(), processed)))
+
+
+    def _grid(self, element):
+        """
+        Returns the x- and y-coordinates of the samples along with
+        the 2D array of values to be contoured.
+        """
+        if isinstance(element, QuadMesh):
+            return (element.dimension_values(0, False),
+                    element.dimension_values(1, False),
+                    element.data[2])
+        (x0, x1), (y0, y1) = element.range(0), element.range(1)
+        ys, xs = element.data.shape[:2]
+        if type(element) is Raster:
+            y0, y1 = y1, y0
+        return (np.linspace(x0, x1, xs), np.linspace(y1, y0, ys),
+                element.data)
+
+
+    def _process(self, element, key=None):
+        x, y, z = self._grid(element)
+        levels = self.p.levels
         if self.p.filled:
-            contour_fn = plt.contourf
             contour_type = Polygons
+            paths = [isobands(x, y, z, lower, upper)
+                     for lower, upper in zip(levels[:-1], levels[1:])]
         else:
-            contour_fn = plt.contour
             contour_type = Contours
-        if type(element) is Raster:
-            data = [np.flipud(element.data)]
-        elif isinstance(element, Raster):
-            data = [element.data]
-        
-        elif isinstance(element, QuadMesh):
-            data = (element.dimension_values(0, False),
-                    element.dimension_values(1, False),
-                    element.data[2])
-        contour_set = contour_fn(*data, extent=extent,
-                                 levels=self.p.levels)
+            paths = [isolines(x, y, z, level) for level in levels]
 
         contours = NdOverlay(None, kdims=['Levels'])
-        for level, cset in zip(self.p.levels, contour_set.collections):
-            paths = []
-            for path in cset.get_paths():
-                paths.extend(np.split(path.vertices, np.where(path.codes==1)[0][1:]))
-            contours[level] = contour_type(paths, level=level, group=self.p.group,
+        for level, packed in zip(levels, paths):
+            contours[level] = contour_type(packed, level=level, group=self.p.group,
                                            label=element.label, kdims=element.kdims,
                                            vdims=element.vdims)
 
-        plt.close(figure_handle)
         if self.p.overlaid:
             contours = element * contours
         return contours
@@ -494,42 +519,130 @@ class histogram(ElementOperation):
     style_prefix = param.String(default=None, allow_None=None, doc="""
       Used for setting a common style for histograms in a HoloMap or AdjointLayout.""")
 
-    def _process(self, view, key=None):
+    chunksize = param.Integer(default=1000000, allow_None=True, doc="""
+      Maximum number of samples binned at a time, limiting the size
+      of temporary arrays. Partitioned data such as dask DataFrames
+      is always binned one partition at a time.""")
+
+    def __call__(self, element, **params):
+        self.p = param.ParamOverrides(self, params)
+        self._shared_limits = None
+        if (isinstance(element, HoloMap) and not isinstance(element, DynamicMap)
+            and self.p.dynamic is not True and not self.p.individually
+            and self.p.bin_range is None and len(element)):
+            # Compute the bin range once for all frames
+            limits = [self._limits(el) for el in element.values()]
+            lows, highs, positive = zip(*limits)
+            self._shared_limits = (min(lows), max(highs), min(positive))
+        try:
+            return super(histogram, self).__call__(element, **params)
+        finally:
+            self._shared_limits = None
+
+
+    def _dimensions(self, view):
         if self.p.dimension:
             selected_dim = self.p.dimension
         else:
             selected_dim = [d.name for d in view.vdims + view.kdims][0]
-        data = np.array(view.dimension_values(selected_dim))
-        if self.p.nonzero:
-            mask = data > 0
-            data = data[mask]
         if self.p.weight_dimension:
-            weights = np.array(view.dimension_values(self.p.weight_dimension))
-            if self.p.nonzero:
-                weights = weights[mask]
+            return [selected_dim, self.p.weight_dimension]
+        return [selected_dim]
+
+
+    def _chunks(self, view):
+        """
+        Iterates over the data and weights to be binned in chunks,
+        dropping NaNs and, if requested, non-positive values.
+        """
+        dims = self._dimensions(view)
+        if isinstance(view, Dataset):
+            chunks = view.interface.chunks(view, dims, self.p.chunksize)
+        else:
+            chunks = [tuple(view.dimension_values(d) for d in dims)]
+        for chunk in chunks:
+            data = np.asarray(chunk[0])
+            mask = data > 0 if self.p.nonzero else ~np.isnan(data)
+            weights = np.asarray(chunk[1])[mask] if len(chunk) > 1 else None
+            yield data[mask], weights
+
+
+    def _limits(self, view):
+        """
+        Computes the finite minimum, maximum and the smallest
+        positive value of the data in a single pass.
+        """
+        low, high, positive = np.inf, -np.inf, np.inf
+        for data, _ in self._chunks(view):
+            data = data[np.isfinite(data)]
+            if not len(data):
+                continue
+            low, high = min(low, data.min()), max(high, data.max())
+            if self.p.log and (data > 0).any():
+                positive = min(positive, data[data > 0].min())
+        return low, high, positive
+
+
+    def _edges(self, view):
+        if self._shared_limits is not None:
+            limits = self._shared_limits
+        elif self.p.bin_range is None or self.p.log:
+            limits = self._limits(view)
+        if self.p.bin_range is not None:
+            hist_range = self.p.bin_range
+        elif limits[0] > limits[1]:
+            hist_range = (0, 0)
         else:
-            weights = None
-        hist_range = find_minmax((np.nanmin(data), np.nanmax(data)), (0, -float('inf')))\
-            if self.p.bin_range is None else self.p.bin_range
+            hist_range = find_minmax(limits[:2], (0, -float('inf')))
 
         # Avoids range issues including zero bin range and empty bins
         if hist_range == (0, 0):
             hist_range = (0, 1)
-        data = data[np.invert(np.isnan(data))]
         if self.p.log:
-            bin_min = max([abs(hist_range[0]), data[data>0].min()])
-            edges = np.logspace(np.log10(bin_min), np.log10(hist_range[1]),
-                                self.p.num_bins+1)
-        else:
-            edges = np.linspace(hist_range[0], hist_range[1], self.p.num_bins + 1)
-        normed = False if self.p.mean_weighted and self.p.weight_dimension else self.p.normed
+            bin_min = max([abs(hist_range[0]), limits[2]])
+            return np.logspace(np.log10(bin_min), np.log10(hist_range[1]),
+                               self.p.num_bins+1)
+        return np.linspace(hist_range[0], hist_range[1], self.p.num_bins + 1)
+
+
+    def _bincount(self, view, edges):
+        """
+        Bins the data in a single pass over the chunks, returning
+        the (weighted) counts and the unweighted counts per bin.
+        Uniform bins are computed directly from the bin width
+        while logarithmic bins require a binary search.
+        """
+        nbins = len(edges)-1
+        low, high = edges[0], edges[-1]
+        hist, counts = np.zeros(nbins, dtype=int), np.zeros(nbins, dtype=int)
+        for data, weights in self._chunks(view):
+            inrange = (data >= low) & (data <= high)
+            data = data[inrange]
+            if weights is not None:
+                weights = weights[inrange]
+            if self.p.log:
+                idx = np.searchsorted(edges, data, side='right')-1
+                idx[idx == nbins] -= 1
+            else:
+                # Correct for floating point error as in np.histogram
+                idx = ((data-low)*(nbins/float(high-low))).astype(np.intp)
+                idx[idx == nbins] -= 1
+                idx[data < edges[idx]] -= 1
+                idx[(data >= edges[idx+1]) & (idx != nbins-1)] += 1
+            hist = hist + np.bincount(idx, weights, minlength=nbins)
+            counts += np.bincount(idx, minlength=nbins)
+        return hist, counts
+
+
+    def _process(self, view, key=None):
+        selected_dim = self._dimensions(view)[0]
+        edges = self._edges(view)
         try:
-            hist, edges = np.histogram(data[np.isfinite(data)], normed=normed,
-                                       range=hist_range, weights=weights, bins=edges)
-            if not normed and self.p.weight_dimension and self.p.mean_weighted:
-                hist_mean, _ = np.histogram(data[np.isfinite(data)], normed=normed,
-                                            range=hist_range, bins=self.p.num_bins)
-                hist /= hist_mean
+            hist, counts = self._bincount(view, edges)
+            if self.p.weight_dimension and self.p.mean_weighted:
+                hist = hist / counts
+            elif self.p.normed:
+                hist = hist / (np.diff(edges) * hist.sum())
         except:
             hist = np.zeros(self.p.num_bins)
 
@@ -578,7 +691,7 @@ class decimate(ElementOperation):
     def _process_layer(self, element, key=None):
         if not isinstance(element, Dataset):
             raise ValueError("Cannot downsample non-Dataset types.")
-        if element.interface not in column_interfaces:
+        if element.interface.datatype not in column_interfaces:
             element = plot.current_frame.clone(datatype=['dataframe', 'dictionary'])
 
         xstart, xend = self.p.x_range if self.p.x_range else element.range(0)
@@ -592,7 +705,7 @@ class decimate(ElementOperation):
         if len(sliced) > self.p.max_samples:
             prng = np.random.RandomState(self.p.random_seed)
             length = len(sliced)
-            if element.interface is PandasInterface:
+            if element.interface.datatype == 'dataframe':
                 data = sliced.data.sample(self.p.max_samples,
                                           random_state=prng)
             else:
@@ -608,6 +721,190 @@ class decimate(ElementOperation):
         return element.map(self._process_layer, Element)
 
 
+class regrid(ElementOperation):
+    """
+    Regrids Image, RGB and grid based QuadMesh Elements so that the
+    portion of the data visible in the current view, defined by the
+    x_range and y_range, contains at most width x height samples.
+    The data is downsampled by power of two factors using the
+    specified aggregator, ignoring NaNs, so that the cells of each
+    downsampled level line up with the original cells. The
+    downsampled arrays are cached, so that repeatedly zooming in and
+    out only requires slicing an already computed level of the
+    resulting image pyramid. By default
+    the operation returns a DynamicMap with RangeXY and PlotSize
+    streams allowing dynamic regridding.
+    """
+
+    aggregator = param.ObjectSelector(default='mean',
+                                      objects=['mean', 'nearest', 'max', 'min'], doc="""
+        The method used to combine the samples falling into a single
+        downsampled cell.""")
+
+    cache_size = param.Integer(default=10, bounds=(0, None), doc="""
+        Maximum number of downsampled arrays cached across calls.""")
+
+    dynamic = param.Boolean(default=True, doc="""
+       Enables dynamic processing by default.""")
+
+    height = param.Integer(default=400, doc="""
+       The maximum number of samples along the y-axis.""")
+
+    width = param.Integer(default=400, doc="""
+       The maximum number of samples along the x-axis.""")
+
+    streams = param.List(default=[RangeXY, PlotSize], doc="""
+        List of streams that are applied if dynamic=True, allowing
+        for dynamic interaction with the plot.""")
+
+    x_range  = param.NumericTuple(default=None, length=2, doc="""
+       The x_range as a tuple of min and max x-value. Auto-ranges
+       if set to None.""")
+
+    y_range  = param.NumericTuple(default=None, length=2, doc="""
+       The y_range as a tuple of min and max y-value. Auto-ranges
+       if set to None.""")
+
+    # Downsampled arrays indexed by array id, factors and aggregator,
+    # holding a reference to the array and a checksum of its contents
+    _cache = OrderedDict()
+
+    _reducers = {'mean': np.add, 'max': np.fmax, 'min': np.fmin}
+
+    @classmethod
+    def _factor(cls, start, stop, max_samples):
+        """
+        Smallest power of two factor such that the downsampled cells
+        covering the window between start and stop number at most
+        max_samples.
+        """
+        if stop-start <= max_samples or max_samples < 1:
+            return 1
+        factor = int(2**np.ceil(np.log2((stop-start)/float(max_samples))))
+        # Windows not aligned to the factor may straddle an extra cell
+        while int(np.ceil(stop/float(factor))) - start//factor > max_samples:
+            factor *= 2
+        return factor
+
+    def _reduce(self, array, xfactor, yfactor):
+        """
+        Downsamples the supplied array along the first two axes by
+        the supplied factors using the aggregator, caching the result.
+        Cached arrays are only reused if the checksum of the array is
+        unchanged, since the data may be modified in place.
+        """
+        if xfactor == 1 and yfactor == 1:
+            return array
+        method = self.p.aggregator
+        key = (id(array), xfactor, yfactor, method)
+        checksum = zlib.crc32(np.ascontiguousarray(array).view(np.uint8))
+        cached = self._cache.get(key)
+        if cached is not None and cached[0]() is array and cached[1] == checksum:
+            return cached[2]
+
+        reduced = self._downsample(array, xfactor, yfactor, method)
+        if self.p.cache_size:
+            self._cache[key] = (weakref.ref(array), checksum, reduced)
+            while len(self._cache) > self.p.cache_size:
+                self._cache.popitem(last=False)
+        return reduced
+
+    def _downsample(self, array, xfactor, yfactor, method):
+        """
+        Downsamples the supplied array along the first two axes by
+        the supplied factors using the aggregator, ignoring NaNs.
+        """
+        if method == 'nearest':
+            return array[::yfactor, ::xfactor]
+
+        ufunc = self._reducers[method]
+        rows = np.arange(0, array.shape[0], yfactor)
+        cols = np.arange(0, array.shape[1], xfactor)
+        if method != 'mean':
+            return ufunc.reduceat(ufunc.reduceat(array, rows, axis=0), cols, axis=1)
+
+        data = array.astype('float64')
+        valid = ~np.isnan(data)
+        data[~valid] = 0
+        total = ufunc.reduceat(ufunc.reduceat(data, rows, axis=0), cols, axis=1)
+        counts = ufunc.reduceat(ufunc.reduceat(valid.astype('float64'), rows, axis=0),
+                                cols, axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return total/counts
+
+    def _window(self, edges, lower, upper):
+        "Returns the start and stop indices of the cells within a range"
+        start = np.searchsorted(edges, lower, side='right')-1
+        stop = np.searchsorted(edges, upper, side='left')
+        return int(np.clip(start, 0, len(edges)-2)), int(np.clip(stop, 1, len(edges)-1))
+
+    def _downsampled_window(self, start, stop, factor):
+        """
+        Returns the start and stop indices of the window in an array
+        downsampled by the factor.
+        """
+        return start//factor, int(np.ceil(stop/float(factor)))
+
+    def _regrid_image(self, element):
+        l, b, r, t = element.bounds.lbrt()
+        array = element.data
+        rows, cols = array.shape[:2]
+        xedges = np.linspace(l, r, cols+1)
+        yedges = np.linspace(b, t, rows+1)
+        x0, x1 = self.p.x_range if self.p.x_range else (l, r)
+        y0, y1 = self.p.y_range if self.p.y_range else (b, t)
+        c0, c1 = self._window(xedges, x0, x1)
+        # Image arrays are stored with the top row first
+        ys, ye = self._window(yedges, y0, y1)
+        r0, r1 = rows-ye, rows-ys
+
+        xfactor = self._factor(c0, c1, self.p.width)
+        yfactor = self._factor(r0, r1, self.p.height)
+        if xfactor == 1 and yfactor == 1 and (c0, c1, r0, r1) == (0, cols, 0, rows):
+            return element
+        reduced = self._reduce(array, xfactor, yfactor)
+        c0, c1 = self._downsampled_window(c0, c1, xfactor)
+        r0, r1 = self._downsampled_window(r0, r1, yfactor)
+        data = reduced[r0:r1, c0:c1]
+        if isinstance(element, RGB) and data.dtype != array.dtype:
+            data = data.astype(array.dtype)
+        bounds = BoundingBox(points=((xedges[c0*xfactor], yedges[rows-min(r1*yfactor, rows)]),
+                                     (xedges[min(c1*xfactor, cols)], yedges[rows-r0*yfactor])))
+        return element.clone(data, bounds=bounds)
+
+    def _regrid_quadmesh(self, element):
+        xedges, yedges, array = element.data
+        if (not element._grid or np.any(np.diff(xedges) < 0) or
+            np.any(np.diff(yedges) < 0)):
+            return element
+        rows, cols = array.shape
+        x0, x1 = self.p.x_range if self.p.x_range else (xedges[0], xedges[-1])
+        y0, y1 = self.p.y_range if self.p.y_range else (yedges[0], yedges[-1])
+        c0, c1 = self._window(xedges, x0, x1)
+        r0, r1 = self._window(yedges, y0, y1)
+
+        xfactor = self._factor(c0, c1, self.p.width)
+        yfactor = self._factor(r0, r1, self.p.height)
+        if xfactor == 1 and yfactor == 1 and (c0, c1, r0, r1) == (0, cols, 0, rows):
+            return element
+        reduced = self._reduce(array, xfactor, yfactor)
+        xs = np.append(xedges[:-1:xfactor], xedges[-1])
+        ys = np.append(yedges[:-1:yfactor], yedges[-1])
+        c0, c1 = self._downsampled_window(c0, c1, xfactor)
+        r0, r1 = self._downsampled_window(r0, r1, yfactor)
+        return element.clone((xs[c0:c1+1], ys[r0:r1+1], reduced[r0:r1, c0:c1]))
+
+    def _process_layer(self, element, key=None):
+        if isinstance(element, Image):
+            return self._regrid_image(element)
+        elif isinstance(element, QuadMesh):
+            return self._regrid_quadmesh(element)
+        return element
+
+    def _process(self, element, key=None):
+        return element.map(self._process_layer, Element)
+
+
 class interpolate_curve(ElementOperation):
     """
     Resamples a Curve using the defined interpolation method, e.g.
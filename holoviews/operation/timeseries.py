@@ -3,7 +3,7 @@ import numpy as np
 import pandas as pd
 
 from ..core import ElementOperation, Element
-from ..core.data import PandasInterface
+from ..core.data.pandas import PandasInterface
 from ..element import Scatter
 
 
@@ -9,6 +9,7 @@ from ...element import (Curve, Points, Scatter, Image, Raster, Path,
                         Table, ItemTable, Area, HSV, QuadMesh, GridImage,
                         VectorField)
 from ...core.options import Options, Cycle
+from ...core.util import pd
 
 try:
     from ...interface import DFrame
@@ -91,12 +92,9 @@ Store.register(associations,
 AdjointLayoutPlot.registry[Histogram] = SideHistogramPlot
 AdjointLayoutPlot.registry[Spikes] = SideSpikesPlot
 
-try:
-    import pandas # noqa (Conditional import)
+if pd:
     Store.register({BoxWhisker: BoxPlot,
                     Bars: BarPlot}, 'bokeh')
-except ImportError:
-    pass
 
 point_size = np.sqrt(6) # Matches matplotlib default
 Cycle.default_cycles['default_colors'] =  ['#30a2da', '#fc4f30', '#e5ae38',
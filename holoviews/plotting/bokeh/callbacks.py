@@ -7,7 +7,8 @@ from bokeh.models import CustomJS
 from ...core import OrderedDict
 from ...streams import (Stream, PositionXY, RangeXY, Selection1D, RangeX,
                         RangeY, PositionX, PositionY, Bounds, Tap,
-                        DoubleTap, MouseEnter, MouseLeave, PlotSize)
+                        DoubleTap, MouseEnter, MouseLeave, PlotSize,
+                        Scheduler)
 from ..comms import JupyterCommJS
 from .util import bokeh_version
 
@@ -76,7 +77,11 @@ class MessageCallback(object):
         return filtered_msg
 
 
-    def on_msg(self, msg):
+    def _stream_msgs(self, msg):
+        """
+        Generates the filtered and processed message for each stream
+        along with the metadata identifying the originating handles.
+        """
         for stream in self.streams:
             handle_ids = self.handle_ids[stream]
             ids = list(handle_ids.values())
@@ -84,9 +89,15 @@ class MessageCallback(object):
             processed_msg = self._process_msg(filtered_msg)
             if not processed_msg:
                 continue
+            metadata = {h: {'id': hid, 'events': self.on_events}
+                        for h, hid in handle_ids.items()}
+            yield stream, processed_msg, metadata
+
+
+    def on_msg(self, msg):
+        for stream, processed_msg, metadata in self._stream_msgs(msg):
             stream.update(trigger=False, **processed_msg)
-            stream._metadata = {h: {'id': hid, 'events': self.on_events}
-                                for h, hid in handle_ids.items()}
+            stream._metadata = metadata
         Stream.trigger(self.streams)
         for stream in self.streams:
             stream._metadata = {}
@@ -328,6 +339,11 @@ class ServerCallback(MessageCallback):
     Stream(s) attached to the callback.
     """
 
+    def __init__(self, plot, streams, source, **params):
+        super(ServerCallback, self).__init__(plot, streams, source, **params)
+        self.scheduler = Scheduler()
+
+
     @classmethod
     def resolve_attr_spec(cls, spec, cb_obj, model=None):
         """
@@ -389,7 +405,7 @@ class ServerCallback(MessageCallback):
             for attr, path in self.attributes.items():
                 model_obj = self.plot_handles.get(self.models[0])
                 msg[attr] = self.resolve_attr_spec(path, event, model_obj)
-            self.on_msg(msg)
+            self.schedule_msg(msg)
         self.plot.document.add_timeout_callback(self.process_on_event, 50)
 
 
@@ -409,10 +425,33 @@ class ServerCallback(MessageCallback):
             cb_obj = self.plot_handles.get(obj_handle)
             msg[attr] = self.resolve_attr_spec(path, cb_obj)
 
-        self.on_msg(msg)
+        self.schedule_msg(msg)
         self.plot.document.add_timeout_callback(self.process_on_change, 50)
 
 
+    def schedule_msg(self, msg):
+        """
+        Submits the message to the scheduler, which coalesces it with
+        any pending events on the streams, and processes due events.
+        """
+        for stream, processed_msg, metadata in self._stream_msgs(msg):
+            self.scheduler.submit(stream, metadata, **processed_msg)
+        self.process_scheduled()
+
+
+    def process_scheduled(self):
+        """
+        Triggers the streams with due events, adding a timeout to
+        process events delayed by debouncing or throttling.
+        """
+        self.scheduler.process()
+        delay = self.scheduler.next_due()
+        if (delay is not None and self.process_scheduled not in
+            self.plot.document._session_callbacks):
+            self.plot.document.add_timeout_callback(self.process_scheduled,
+                                                    max(int(delay*1000), 1))
+
+
     def set_server_callback(self, handle):
         """
         Set up on_change events for bokeh server interactions.
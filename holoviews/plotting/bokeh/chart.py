@@ -99,31 +99,32 @@ class PointPlot(LegendPlot, ColorbarPlot):
 
 
     def get_batched_data(self, element, ranges=None, empty=False):
-        data = defaultdict(list)
+        data, style_data = defaultdict(list), defaultdict(list)
         zorders = self._updated_zorders(element)
         styles = self.lookup_options(element.last, 'style')
         styles = styles.max_cycles(len(self.ordering))
-        for (key, el), zorder in zip(element.data.items(), zorders):
-            self.set_param(**self.lookup_options(el, 'plot').options)
+        lengths = []
+        for (key, el), zorder in zip(self._batched_items(element), zorders):
             eldata, elmapping = self.get_data(el, ranges, empty)
             for k, eld in eldata.items():
                 data[k].append(eld)
+            lengths.append(len(list(eldata.values())[0]))
 
-            # Apply static styles
-            nvals = len(list(eldata.values())[0])
-            style = styles[zorder]
-            sdata, smapping = expand_batched_style(style, self._batched_style_opts,
-                                                   elmapping, nvals)
+            # Collect static styles, expanded below once for all elements
+            sdata, smapping = expand_batched_style(styles[zorder], self._batched_style_opts,
+                                                   elmapping, nvals=1)
             elmapping.update(smapping)
             for k, v in sdata.items():
-                data[k].append(v)
-
-            if any(isinstance(t, HoverTool) for t in self.state.tools):
-                for dim, k in zip(element.dimensions(), key):
-                    sanitized = dimension_sanitizer(dim.name)
-                    data[sanitized].append([k]*nvals)
+                style_data[k].append(v[0])
 
         data = {k: np.concatenate(v) for k, v in data.items()}
+        for k, v in style_data.items():
+            data[k] = np.repeat(v, lengths)
+        if any(isinstance(t, HoverTool) for t in self.state.tools):
+            keys = list(element.data.keys())
+            for i, dim in enumerate(element.kdims):
+                sanitized = dimension_sanitizer(dim.name)
+                data[sanitized] = np.repeat([k[i] for k in keys], lengths)
         filter_batched_data(data, elmapping)
         return data, elmapping
 
@@ -257,8 +258,7 @@ class CurvePlot(ElementPlot):
         styles = self.lookup_options(overlay.last, 'style')
         styles = styles.max_cycles(len(self.ordering))
 
-        for (key, el), zorder in zip(overlay.data.items(), zorders):
-            self.set_param(**self.lookup_options(el, 'plot').options)
+        for (key, el), zorder in zip(self._batched_items(overlay), zorders):
             eldata, elmapping = self.get_data(el, ranges, empty)
             for k, eld in eldata.items():
                 data[k].append(eld)
@@ -579,14 +579,28 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         Get factors for categorical axes.
         """
         xdim, ydim = element.dimensions()[:2]
-        xvals, yvals = [element.dimension_values(i, False)
-                        for i in range(2)]
+        xvals, yvals = [self._sort_factors(d, element.dimension_values(d, False))
+                        for d in (xdim, ydim)]
         coords = ([x if xvals.dtype.kind in 'SU' else xdim.pprint_value(x) for x in xvals],
                   [y if yvals.dtype.kind in 'SU' else ydim.pprint_value(y) for y in yvals])
         if self.invert_axes: coords = coords[::-1]
         return coords
 
 
+    @classmethod
+    def _sort_factors(cls, dimension, values):
+        """
+        Orders the values along a categorical Dimension by their code
+        in its CategoryTable, placing undeclared values last.
+        """
+        categories = dimension.categories
+        if categories is None:
+            return values
+        codes = categories.encode(values)
+        codes[codes < 0] = len(categories)
+        return values[np.argsort(codes, kind='mergesort')]
+
+
     def _process_legend(self):
         """
         Disables legends if show_legend is disabled.
@@ -6,6 +6,7 @@ import param
 from bokeh.models import HoverTool
 
 from ...core import util
+from ...element import PackedPaths
 from ..util import map_colors
 from .element import ElementPlot, ColorbarPlot, line_properties, fill_properties
 from .util import (get_cmap, rgb2hex, expand_batched_style,
@@ -31,10 +32,23 @@ class PathPlot(ElementPlot):
 
     def get_data(self, element, ranges=None, empty=False):
         xidx, yidx = (1, 0) if self.invert_axes else (0, 1)
-        xs = [] if empty else [path[:, xidx] for path in element.data]
-        ys = [] if empty else [path[:, yidx] for path in element.data]
+        xs, ys = self._split_paths(element, xidx, yidx, empty)
         return dict(xs=xs, ys=ys), dict(self._mapping)
 
+    def _split_paths(self, element, xidx, yidx, empty=False):
+        """
+        Returns lists of the x- and y-coordinates of each path in
+        the element, using views onto the coordinate buffer if the
+        paths are packed.
+        """
+        if empty:
+            return [], []
+        elif isinstance(element.data, PackedPaths):
+            return element.data.split(xidx), element.data.split(yidx)
+        xs = [path[:, xidx] for path in element.data]
+        ys = [path[:, yidx] for path in element.data]
+        return xs, ys
+
     def get_batched_data(self, element, ranges=None, empty=False):
         data = defaultdict(list)
 
@@ -42,8 +56,7 @@ class PathPlot(ElementPlot):
         styles = self.lookup_options(element.last, 'style')
         styles = styles.max_cycles(len(self.ordering))
 
-        for (key, el), zorder in zip(element.data.items(), zorders):
-            self.set_param(**self.lookup_options(el, 'plot').options)
+        for (key, el), zorder in zip(self._batched_items(element), zorders):
             self.overlay_dims = dict(zip(element.kdims, key))
             eldata, elmapping = self.get_data(el, ranges, empty)
             for k, eld in eldata.items():
@@ -78,18 +91,25 @@ class PolygonPlot(ColorbarPlot, PathPlot):
         return dims, {}
 
     def get_data(self, element, ranges=None, empty=False):
-        xs = [] if empty else [path[:, 0] for path in element.data]
-        ys = [] if empty else [path[:, 1] for path in element.data]
+        xs, ys = self._split_paths(element, 0, 1, empty)
         data = dict(xs=ys, ys=xs) if self.invert_axes else dict(xs=xs, ys=ys)
+        path_values = None
+        if isinstance(element.data, PackedPaths):
+            path_values = element.data.values
+        if path_values is None:
+            values = [element.level for _ in range(len(xs))]
+        else:
+            values = path_values
 
         style = self.style[self.cyclic_index]
         mapping = dict(self._mapping)
 
-        if element.vdims and element.level is not None:
+        if element.vdims and (element.level is not None or
+                              path_values is not None):
             cdim = element.vdims[0]
             dim_name = util.dimension_sanitizer(cdim.name)
             cmapper = self._get_colormapper(cdim, element, ranges, style)
-            data[dim_name] = [] if empty else [element.level for _ in range(len(xs))]
+            data[dim_name] = [] if empty else values
             mapping['fill_color'] = {'field': dim_name,
                                      'transform': cmapper}
 
@@ -98,6 +118,6 @@ class PolygonPlot(ColorbarPlot, PathPlot):
             for k, v in self.overlay_dims.items():
                 dim = util.dimension_sanitizer(k.name)
                 data[dim] = [v for _ in range(len(xs))]
-            data[dim_name] = [element.level for _ in range(len(xs))]
+            data[dim_name] = values
 
         return data, mapping
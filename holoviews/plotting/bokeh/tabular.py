@@ -4,6 +4,7 @@ import param
 
 from ...core import Dataset
 from ...element import ItemTable
+from ...streams import Stream, TablePage
 from ..plot import GenericElementPlot
 from .plot import BokehPlot
 from .util import bokeh_version
@@ -14,6 +15,18 @@ class TablePlot(BokehPlot, GenericElementPlot):
 
     width = param.Number(default=400)
 
+    page_size = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        Number of rows to display at once. If set, the table is paged
+        and only the rows on the current page are formatted and sent
+        to the frontend, where the page, sort column and selection are
+        controlled by a TablePage stream. A TablePage stream whose
+        source is the displayed object may also be supplied to enable
+        paging.""")
+
+    page_margin = param.Integer(default=0, bounds=(0, None), doc="""
+        Number of additional rows before and after the current page
+        to send along with the page.""")
+
     style_opts = ['row_headers', 'selectable', 'editable',
                   'sortable', 'fit_columns', 'width', 'height']
 
@@ -25,14 +38,80 @@ class TablePlot(BokehPlot, GenericElementPlot):
         element_ids = self.hmap.traverse(lambda x: id(x), [Dataset, ItemTable])
         self.static = len(set(element_ids)) == 1 and len(self.keys) == len(self.hmap)
         self.callbacks = [] # Callback support on tables not implemented
+        self.page_stream = self._get_page_stream(element)
+        self._page_cache = None
+        if self.page_stream is not None:
+            self.page_stream.add_subscriber(self._refresh_page)
+            if self.comm is None and params.get('keys') is None:
+                self.comm = self.renderer.comms[self.renderer.mode][0](self)
+
+
+    def _get_page_stream(self, element):
+        """
+        Returns the TablePage stream attached to the displayed object,
+        creating one if a page_size is set.
+        """
+        for source in (element, self.hmap.last):
+            for stream in Stream.registry.get(id(source), []):
+                if isinstance(stream, TablePage):
+                    return stream
+        if self.page_size is not None:
+            return TablePage(page_size=self.page_size)
+
+
+    def _refresh_page(self, **kwargs):
+        """
+        Updates the table with the page requested by the TablePage
+        stream, pushing the new data if the plot has been displayed.
+        """
+        if not self.drawn:
+            return
+        self.handles.pop('previous_id', None)
+        self.update_frame(self.current_key)
+        if self.comm is not None and self.document is not None:
+            self.push()
+
+
+    def _page_rows(self, element):
+        """
+        Filters and sorts the element according to the TablePage
+        stream, caching the result so that paging does not repeat
+        the query, and returns the table along with the row slice.
+        """
+        stream = self.page_stream
+        query = (stream.sort_by, stream.selection)
+        cache = self._page_cache
+        if cache is None or cache[0] is not element or cache[1] != query:
+            table = element
+            if stream.selection:
+                table = table.select(**stream.selection)
+            if stream.sort_by:
+                table = table.sort(stream.sort_by)
+            self._page_cache = (element, query, table)
+        table = self._page_cache[2]
+        start = max(stream.page*stream.page_size - self.page_margin, 0)
+        stop = (stream.page+1)*stream.page_size + self.page_margin
+        return table, slice(start, stop)
 
 
     def get_data(self, element, ranges=None, empty=False):
         dims = element.dimensions()
-        return ({d.name: [] if empty else
-                 [d.pprint_value(v) for v in element.dimension_values(d)]
-                 for d in dims},
-                {d.name: d.name for d in dims})
+        mapping = {d.name: d.name for d in dims}
+        if empty:
+            return {d.name: [] for d in dims}, mapping
+        elif self.page_stream is None or not isinstance(element, Dataset):
+            return ({d.name: [d.pprint_value(v) for v in element.dimension_values(d)]
+                     for d in dims}, mapping)
+
+        # Only format the values on the current page
+        table, rows = self._page_rows(element)
+        data = {}
+        for d in dims:
+            values = table.dimension_values(d)
+            if not self.page_stream.ascending:
+                values = values[::-1]
+            data[d.name] = [d.pprint_value(v) for v in values[rows]]
+        return data, mapping
 
 
     def initialize_plot(self, ranges=None, plot=None, plots=None, source=None):
@@ -68,7 +147,7 @@ class TablePlot(BokehPlot, GenericElementPlot):
         Returns a list of the plot objects to update.
         """
         handles = []
-        if self.static and not self.dynamic:
+        if self.static and not self.dynamic and self.page_stream is None:
             return handles
 
         previous_id = self.handles.get('previous_id', None)
@@ -118,6 +118,7 @@ class ElementPlot(GenericElementPlot, MPLPlot):
     _has_axes = True
 
     def __init__(self, element, **params):
+        self.current_ranges = None
         super(ElementPlot, self).__init__(element, **params)
         check = self.hmap.last
         if isinstance(check, CompositeOverlay):
@@ -433,6 +434,7 @@ class ElementPlot(GenericElementPlot, MPLPlot):
         using the last available frame.
         """
         reused = isinstance(self.hmap, DynamicMap) and self.overlaid
+        previous_frame, previous_ranges = self.current_frame, self.current_ranges
         if not reused and element is None:
             element = self._get_frame(key)
         else:
@@ -441,6 +443,14 @@ class ElementPlot(GenericElementPlot, MPLPlot):
 
         if element is not None:
             self.set_param(**self.lookup_options(element, 'plot').options)
+            ranges = self.compute_ranges(self.hmap, key, ranges)
+            if not self.adjoined:
+                ranges = util.match_spec(element, ranges)
+            self.current_ranges = ranges
+            # Skip updating the artists of static frames
+            if (not self.dynamic and len(self.hmap) == 1 and
+                element is previous_frame and ranges == previous_ranges):
+                return
         axis = self.handles['axis']
 
         axes_visible = element is not None or self.overlaid
@@ -455,10 +465,6 @@ class ElementPlot(GenericElementPlot, MPLPlot):
         if element is None:
             return
 
-        ranges = self.compute_ranges(self.hmap, key, ranges)
-        if not self.adjoined:
-            ranges = util.match_spec(element, ranges)
-
         label = element.label if self.show_legend else ''
         style = dict(label=label, zorder=self.zorder, **self.style[self.cyclic_index])
         axis_kwargs = self.update_handles(key, axis, element, ranges, style)
@@ -475,6 +481,7 @@ class ElementPlot(GenericElementPlot, MPLPlot):
 
         ranges = self.compute_ranges(self.hmap, key, ranges)
         ranges = util.match_spec(element, ranges)
+        self.current_ranges = ranges
 
         style = dict(zorder=self.zorder, **self.style[self.cyclic_index])
         if self.show_legend:
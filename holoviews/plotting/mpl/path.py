@@ -3,6 +3,7 @@ from matplotlib.collections import PatchCollection, LineCollection
 import numpy as np
 import param
 
+from ...element import PackedPaths
 from .element import ElementPlot, ColorbarPlot
 
 
@@ -16,7 +17,10 @@ class PathPlot(ElementPlot):
 
     def get_data(self, element, ranges, style):
         paths = element.data
-        if self.invert_axes:
+        if isinstance(paths, PackedPaths):
+            coords = paths.coords[:, ::-1] if self.invert_axes else paths.coords
+            paths = PackedPaths(coords, paths.offsets).split()
+        elif self.invert_axes:
             paths = [p[:, ::-1] for p in paths]
         return (paths,), style, {}
 
@@ -49,20 +53,34 @@ class PolygonPlot(ColorbarPlot):
                   'hatch', 'linestyle', 'joinstyle', 'fill', 'capstyle']
 
 
-    def get_data(self, element, ranges, style):
+    def _path_values(self, element):
+        """
+        Returns the values associated with each path, supplied
+        either per path by a PackedPaths object or by the level.
+        """
+        if isinstance(element.data, PackedPaths) and element.data.values is not None:
+            return element.data.values
         value = element.level
+        if value is not None and np.isfinite(value):
+            return np.array([value]*len(element.data))
+        return None
+
+
+    def get_data(self, element, ranges, style):
         vdim = element.vdims[0]
-        polys = []
+        values = self._path_values(element)
+        polys, nonempty = [], []
         for segments in element.data:
+            nonempty.append(bool(segments.shape[0]))
             if segments.shape[0]:
                 if self.invert_axes:
                     segments = segments[:, ::-1]
                 polys.append(Polygon(segments))
 
-        if value is not None and np.isfinite(value):
+        if values is not None:
             self._norm_kwargs(element, ranges, style, vdim)
             style['clim'] = style.pop('vmin'), style.pop('vmax')
-            style['array'] = np.array([value]*len(polys))
+            style['array'] = values[np.array(nonempty, dtype=bool)]
         return (polys,), style, {}
 
     def init_artists(self, ax, plot_args, plot_kwargs):
@@ -74,15 +92,15 @@ class PolygonPlot(ColorbarPlot):
 
 
     def update_handles(self, key, axis, element, ranges, style):
-        value = element.level
         vdim = element.vdims[0]
+        values = self._path_values(element)
         collection = self.handles['artist']
         if any(not np.array_equal(data, poly.get_xy()) for data, poly in
                zip(element.data, self.handles['polys'])):
             return super(PolygonPlot, self).update_handles(key, axis, element, ranges, style)
-        elif value is not None and np.isfinite(value):
+        elif values is not None:
             self._norm_kwargs(element, ranges, style, vdim)
-            collection.set_array(np.array([value]*len(element.data)))
+            collection.set_array(values)
             collection.set_clim((style['vmin'], style['vmax']))
             if 'norm' in style:
                 collection.norm = style['norm']
@@ -7,6 +7,8 @@ import matplotlib as mpl
 from mpl_toolkits.mplot3d import Axes3D  # noqa (For 3D plots)
 from matplotlib import pyplot as plt
 from matplotlib import gridspec, animation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.transforms import Bbox
 import param
 from ...core import (OrderedDict, HoloMap, AdjointLayout, NdLayout,
                      GridSpace, Element, CompositeOverlay, Empty,
@@ -219,6 +221,118 @@ class MPLPlot(DimensionedPlot):
         return anim
 
 
+    def frames(self, start=0, stop=None, dpi=None, blit=True):
+        """
+        Generator yielding the rendered RGBA buffer of each frame
+        between the start and stop indices, which may be streamed
+        directly to a video encoder. The artists of the plot are
+        updated in place for each frame and if blit is enabled only
+        the axes that changed are redrawn on top of a cached figure
+        background, falling back to redrawing the full figure if
+        every axis or any figure level artist changed.
+        """
+        figure = self.initialize_plot()
+        if dpi is not None:
+            figure.set_dpi(dpi)
+        canvas = figure.canvas
+        if not isinstance(canvas, FigureCanvasAgg):
+            canvas = FigureCanvasAgg(figure)
+        blit = blit and len(figure.get_children()) > 2
+        background = self._figure_background(canvas) if blit else None
+        extents = {}
+        for i, key in enumerate(self.keys[start:stop]):
+            self.update_frame(key)
+            if not (i and blit and self._blit(canvas, background, extents)):
+                canvas.draw()
+            yield canvas.buffer_rgba()
+        if self._close_figures: plt.close(figure)
+
+
+    def _figure_background(self, canvas):
+        """
+        Renders and returns a copy of the figure without any of the
+        artists drawn on top of the figure patch.
+        """
+        figure = canvas.figure
+        artists = [a for a in figure.get_children() if a is not figure.patch]
+        visible = [a.get_visible() for a in artists]
+        for artist in artists:
+            artist.set_visible(False)
+        canvas.draw()
+        background = canvas.copy_from_bbox(figure.bbox)
+        for artist, vis in zip(artists, visible):
+            artist.set_visible(vis)
+        return background
+
+
+    def _artist_extent(self, artist, renderer):
+        """
+        Returns the padded bounding box of all pixels a figure level
+        artist may draw on, which for axes includes the ticks, labels,
+        titles, legends and annotations.
+        """
+        if not isinstance(artist, mpl.axes.Axes):
+            return artist.get_window_extent(renderer).padded(2)
+        stale = artist.stale
+        bboxes = [artist.get_tightbbox(renderer)]
+        for child in artist.texts + [artist.get_legend()]:
+            if child is not None and child.get_visible():
+                bboxes.append(child.get_window_extent(renderer))
+        # Computing the tick layout marks the axis as stale
+        artist.stale = stale
+        return Bbox.union(bboxes).padded(2)
+
+
+    def _blit(self, canvas, background, extents):
+        """
+        Redraws the stale figure level artists (usually axes) along
+        with any artists overlapping them on top of the restored
+        figure background, using and updating the supplied dictionary
+        of artist extents. Returns False if the figure should be
+        redrawn in full instead.
+        """
+        figure = canvas.figure
+        artists = [a for a in figure.get_children() if a is not figure.patch]
+        redraw = [a for a in artists if a.stale]
+        if len(redraw) == len(artists):
+            extents.clear()
+            return False
+
+        renderer = canvas.get_renderer()
+        if any(a not in extents for a in artists):
+            # Extents are only computed once blitting may be used
+            canvas.draw()
+            extents.clear()
+            extents.update({a: self._artist_extent(a, renderer) for a in artists})
+            return True
+
+        for artist in redraw:
+            extent = self._artist_extent(artist, renderer)
+            extents[artist] = Bbox.union([extents[artist], extent])
+
+        # Any artist overlapping a region being cleared has to be redrawn
+        while True:
+            overlapping = [a for a in artists if a not in redraw and
+                           any(extents[a].overlaps(extents[r]) for r in redraw)]
+            if not overlapping:
+                break
+            redraw += overlapping
+
+        # Background regions are indexed from the top left corner
+        height = figure.bbox.height
+        for artist in redraw:
+            r = Bbox.intersection(extents[artist], figure.bbox)
+            if r is None:
+                continue
+            bbox = (np.floor(r.x0), np.floor(height-r.y1), np.ceil(r.x1), np.ceil(height-r.y0))
+            canvas.restore_region(background, bbox, (0, 0))
+        for artist in sorted(redraw, key=lambda a: (a.get_zorder(), artists.index(a))):
+            artist.draw(renderer)
+        for artist in redraw:
+            extents[artist] = self._artist_extent(artist, renderer)
+        return True
+
+
     def update(self, key):
         if len(self) == 1 and key == 0 and not self.drawn:
             return self.initialize_plot()
@@ -1,7 +1,8 @@
 import sys
+import subprocess
+import threading
 
 from io import BytesIO
-from tempfile import NamedTemporaryFile
 from contextlib import contextmanager
 from itertools import chain
 
@@ -26,6 +27,12 @@ class OutputWarning(param.Parameterized):pass
 outputwarning = OutputWarning(name='Warning')
 
 
+def _read_pipe(pipe, chunks):
+    "Reads a pipe until it is closed, collecting the chunks in a list"
+    for chunk in iter(lambda: pipe.read(65536), b''):
+        chunks.append(chunk)
+
+
 class MPLRenderer(Renderer):
     """
     Exporter used to render data from matplotlib, either to a stream
@@ -62,9 +69,9 @@ class MPLRenderer(Renderer):
     # <format name> : (animation writer, format,  anim_kwargs, extra_args)
     ANIMATION_OPTS = {
         'webm': ('ffmpeg', 'webm', {},
-                 ['-vcodec', 'libvpx', '-b', '1000k']),
+                 ['-vcodec', 'libvpx', '-b', '1000k', '-pix_fmt', 'yuv420p']),
         'mp4': ('ffmpeg', 'mp4', {'codec': 'libx264'},
-                 ['-pix_fmt', 'yuv420p']),
+                 ['-pix_fmt', 'yuv420p', '-movflags', 'frag_keyframe+empty_moov']),
         'gif': ('imagemagick', 'gif', {'fps': 10}, []),
         'scrubber': ('html', None, {'fps': 5}, None)
     }
@@ -104,8 +111,7 @@ class MPLRenderer(Renderer):
             if sys.version_info[0] == 3 and mpl.__version__[:-2] in ['1.2', '1.3']:
                 raise Exception("<b>Python 3 matplotlib animation support broken &lt;= 1.3</b>")
             with mpl.rc_context(rc=plot.fig_rcparams):
-                anim = plot.anim(fps=self.fps)
-            data = self._anim_data(anim, fmt)
+                data = self._anim_data(plot, fmt)
 
         data = self._apply_post_render_hooks(data, obj, fmt)
         return data, {'file-ext':fmt,
@@ -219,21 +225,70 @@ class MPLRenderer(Renderer):
         return data
 
 
-    def _anim_data(self, anim, fmt):
+    def _anim_command(self, fmt, width, height):
+        """
+        Returns the command line of the animation writer for the
+        given format, which reads raw RGBA frames of the specified
+        size from stdin and writes the encoded animation to stdout.
+        """
+        (writer, fmt, anim_kwargs, extra_args) = self.ANIMATION_OPTS[fmt]
+        fps = max([int(self.fps), 1]) if self.fps is not None else anim_kwargs.get('fps', 20)
+        size = '%dx%d' % (width, height)
+        if writer == 'ffmpeg':
+            cmd = [mpl.rcParams['animation.ffmpeg_path'], '-loglevel', 'error',
+                   '-f', 'rawvideo', '-vcodec', 'rawvideo', '-s', size,
+                   '-pix_fmt', 'rgba', '-r', str(fps), '-i', 'pipe:0']
+            if 'codec' in anim_kwargs:
+                cmd += ['-vcodec', anim_kwargs['codec']]
+            return cmd + extra_args + ['-f', fmt, 'pipe:1']
+        elif writer == 'imagemagick':
+            return ([mpl.rcParams['animation.convert_path'], '-size', size,
+                     '-depth', '8', '-delay', str(100./fps), '-loop', '0',
+                     'rgba:-'] + extra_args + ['%s:-' % fmt])
+        raise ValueError("No animation writer available for %r format" % fmt)
+
+
+    def _anim_data(self, plot, fmt):
         """
-        Render a matplotlib animation object and return the corresponding data.
+        Render the frames of a plot and stream the raw RGBA buffers
+        directly into the pipe of the animation writer, returning the
+        encoded animation data.
         """
-        (writer, _, anim_kwargs, extra_args) = self.ANIMATION_OPTS[fmt]
-        if extra_args != []:
-            anim_kwargs = dict(anim_kwargs, extra_args=extra_args)
-
-        if self.fps is not None: anim_kwargs['fps'] = max([int(self.fps), 1])
-        if self.dpi is not None: anim_kwargs['dpi'] = self.dpi
-        if not hasattr(anim, '_encoded_video'):
-            with NamedTemporaryFile(suffix='.%s' % fmt) as f:
-                anim.save(f.name, writer=writer, **anim_kwargs)
-                video = open(f.name, "rb").read()
-        return video
+        frames = plot.frames(dpi=self.dpi)
+        frame = next(frames)
+        width, height = plot.state.canvas.get_width_height()
+        cmd = self._anim_command(fmt, width, height)
+        try:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE)
+        except OSError:
+            raise Exception("Animation writer %r could not be found, ensure "
+                            "it is installed to export %s animations."
+                            % (cmd[0], fmt))
+
+        # Drain the output pipes while frames are being written
+        output, errors = [], []
+        readers = [threading.Thread(target=_read_pipe, args=(pipe, chunks))
+                   for pipe, chunks in [(proc.stdout, output), (proc.stderr, errors)]]
+        for reader in readers:
+            reader.daemon = True
+            reader.start()
+        try:
+            proc.stdin.write(frame)
+            for frame in frames:
+                proc.stdin.write(frame)
+        except IOError:
+            pass
+        finally:
+            proc.stdin.close()
+            for reader in readers:
+                reader.join()
+            proc.wait()
+        if proc.returncode:
+            raise Exception("Animation writer %r failed with:\n\n%s"
+                            % (cmd[0], b''.join(errors).decode('utf-8', 'replace')))
+        return b''.join(output)
 
 
     def _compute_bbox(self, fig, kw):
@@ -2,13 +2,9 @@ from __future__ import absolute_import
 
 import matplotlib.pyplot as plt
 
-try:
-    import seaborn.apionly as sns
-except:
-    sns = None
-
 import param
 
+from ...core.util import LazyModule
 from ...interface.pandas import DFrame, DataFrameView
 from ...interface.seaborn import Regression, TimeSeries, Bivariate, Distribution
 from ...interface.seaborn import DFrame as SNSFrame
@@ -17,6 +13,8 @@ from .element import ElementPlot
 from .pandas import DFrameViewPlot
 from .plot import MPLPlot, AdjoinedPlot, mpl_rc_context
 
+sns = LazyModule('seaborn.apionly')
+
 
 class SeabornPlot(ElementPlot):
     """
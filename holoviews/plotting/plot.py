@@ -620,7 +620,27 @@ class GenericElementPlot(DimensionedPlot):
         specs = [util.get_overlay_spec(overlay, key, el)
                  for key, el in overlay.data.items()]
         self.ordering = sorted(set(self.ordering+specs))
-        return [self.ordering.index(spec) for spec in specs]
+        zorders = {spec: i for i, spec in enumerate(self.ordering)}
+        return [zorders[spec] for spec in specs]
+
+
+    def _batched_items(self, overlay):
+        """
+        Iterates over the items of a batched overlay, applying the
+        plot options of each element before it is yielded. Options
+        are only looked up once for each distinct type, group, label
+        and id and are only applied when they differ from the options
+        of the preceding element.
+        """
+        options, previous = {}, None
+        for key, el in overlay.data.items():
+            spec = (type(el), el.group, el.label, el.id)
+            if spec not in options:
+                options[spec] = self.lookup_options(el, 'plot').options
+            if spec != previous:
+                self.set_param(**options[spec])
+                previous = spec
+            yield key, el
 
 
     def _get_frame(self, key):
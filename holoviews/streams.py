@@ -4,10 +4,15 @@ generate and respond to events, originating either in Python on the
 server-side or in Javascript in the Jupyter notebook (client-side).
 """
 
+import time
+import threading
+
 import param
+import numpy as np
 from numbers import Number
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from .core import util
+from .core.data.dictionary import SharedColumns
 
 
 class Stream(param.Parameterized):
@@ -32,6 +37,10 @@ class Stream(param.Parameterized):
     # e.g. Stream._callbacks['bokeh'][Stream] = Callback
     _callbacks = defaultdict(dict)
 
+    # Whether callbacks driven by the stream may be memoized on the
+    # stream contents, disabled for streams carrying large data
+    _memoize = True
+
     @classmethod
     def trigger(cls, streams):
         """
@@ -61,7 +70,8 @@ class Stream(param.Parameterized):
             stream.deactivate()
 
 
-    def __init__(self, rename={}, source=None, subscribers=[], linked=False, **params):
+    def __init__(self, rename={}, source=None, subscribers=[], linked=False,
+                 debounce=None, throttle=None, **params):
         """
         The rename argument allows multiple streams with similar event
         state to be used by remapping parameter names.
@@ -72,6 +82,11 @@ class Stream(param.Parameterized):
 
         Some streams are configured to automatically link to the source
         plot, to disable this set linked=False
+
+        When events are delivered via a Scheduler, debounce specifies
+        the time in seconds without new events before the stream is
+        triggered and throttle the minimum time in seconds between
+        consecutive triggers.
         """
         self._source = source
         self._subscribers = []
@@ -79,6 +94,8 @@ class Stream(param.Parameterized):
             self.add_subscriber(subscriber)
 
         self.linked = linked
+        self.debounce = debounce
+        self.throttle = throttle
         self._rename = self._validate_rename(rename)
 
         # The metadata may provide information about the currently
@@ -132,7 +149,9 @@ class Stream(param.Parameterized):
         params = {k:v for k,v in self.get_param_values() if k != 'name'}
         return self.__class__(rename=mapping,
                               source=self._source,
-                              linked=self.linked, **params)
+                              linked=self.linked,
+                              debounce=self.debounce,
+                              throttle=self.throttle, **params)
 
 
     def deactivate(self):
@@ -223,6 +242,128 @@ class Stream(param.Parameterized):
         return repr(self)
 
 
+class Scheduler(object):
+    """
+    A Scheduler coalesces events submitted for a number of streams,
+    triggering each stream at most once per call to process with the
+    latest parameter values submitted for it. Events submitted while
+    a previous batch is still being processed, e.g. while a slow
+    DynamicMap callback is running, replace any pending event for the
+    same stream, so superseded events are dropped rather than queued.
+
+    The debounce and throttle attributes of a stream, or the defaults
+    supplied to the Scheduler, delay triggering a stream until no new
+    events have been submitted for the debounce period and until the
+    throttle period has passed since it was last triggered.
+    """
+
+    def __init__(self, debounce=None, throttle=None, timer=time.time):
+        self.debounce = debounce
+        self.throttle = throttle
+        self.timer = timer
+        self.events = 0
+        self.dropped = 0
+        self.triggered = 0
+        self._pending = OrderedDict()
+        self._last_submitted = {}
+        self._last_triggered = {}
+        self._processing = False
+        self._lock = threading.Lock()
+
+
+    @property
+    def queue_depth(self):
+        "Number of streams with a pending event."
+        return len(self._pending)
+
+
+    @property
+    def stats(self):
+        "Dictionary of the event counts recorded by the scheduler."
+        return dict(events=self.events, dropped=self.dropped,
+                    triggered=self.triggered, queue_depth=self.queue_depth)
+
+
+    def submit(self, stream, metadata=None, **kwargs):
+        """
+        Submits an event updating the supplied (unrenamed) stream
+        parameters, merging it with any pending event for the stream.
+        The optional metadata is made available on the stream while
+        it is triggered.
+        """
+        with self._lock:
+            now = self.timer()
+            self.events += 1
+            if stream in self._pending:
+                pending, _ = self._pending.pop(stream)
+                self.dropped += 1
+                kwargs = dict(pending, **kwargs)
+            self._pending[stream] = (kwargs, metadata)
+            self._last_submitted[stream] = now
+
+
+    def _delay(self, stream, now):
+        """
+        Returns the time remaining before a pending event on the
+        supplied stream may be processed.
+        """
+        debounce = stream.debounce if stream.debounce is not None else self.debounce
+        throttle = stream.throttle if stream.throttle is not None else self.throttle
+        delay = 0
+        if debounce:
+            delay = max(delay, self._last_submitted[stream] + debounce - now)
+        if throttle and stream in self._last_triggered:
+            delay = max(delay, self._last_triggered[stream] + throttle - now)
+        return delay
+
+
+    def next_due(self):
+        """
+        Returns the time in seconds until the next pending event may be
+        processed or None if no events are pending.
+        """
+        with self._lock:
+            if not self._pending:
+                return None
+            now = self.timer()
+            return max(0, min(self._delay(s, now) for s in self._pending))
+
+
+    def process(self):
+        """
+        Applies the pending events which are due and triggers the
+        corresponding streams in a single batch. Returns the list of
+        streams that were triggered, which is empty if no events were
+        due or another batch is still being processed.
+        """
+        with self._lock:
+            if self._processing:
+                return []
+            now = self.timer()
+            due = [s for s in self._pending if self._delay(s, now) <= 0]
+            events = [(s,)+self._pending.pop(s) for s in due]
+            self._processing = bool(events)
+        if not events:
+            return []
+
+        try:
+            for stream, kwargs, metadata in events:
+                stream.update(trigger=False, **kwargs)
+                stream._metadata = metadata or {}
+            Stream.trigger(due)
+        finally:
+            for stream in due:
+                stream._metadata = {}
+            with self._lock:
+                now = self.timer()
+                for stream in due:
+                    self._last_triggered[stream] = now
+                self.triggered += len(due)
+                self._processing = False
+        return due
+
+
+
 class LinkedStream(Stream):
     """
     A LinkedStream indicates is automatically linked to plot interactions
@@ -366,6 +507,203 @@ class Selection1D(LinkedStream):
         Indices into a 1D datastructure.""")
 
 
+class TablePage(Stream):
+    """
+    A stream controlling which page of rows a paged table displays.
+    Before paging, the rows may be filtered by a selection, supplied
+    in the form accepted by Dataset.select, and sorted by a column.
+    """
+
+    page = param.Integer(default=0, bounds=(0, None), constant=True, doc="""
+        Index of the displayed page.""")
+
+    page_size = param.Integer(default=100, bounds=(1, None), constant=True, doc="""
+        Number of rows on each page.""")
+
+    sort_by = param.String(default=None, allow_None=True, constant=True, doc="""
+        Name of the column the rows are sorted by.""")
+
+    ascending = param.Boolean(default=True, constant=True, doc="""
+        Whether the rows are displayed in ascending order.""")
+
+    selection = param.Dict(default={}, constant=True, doc="""
+        Selection applied to the rows before sorting and paging.""")
+
+
+class RingBuffer(object):
+    """
+    A fixed-capacity columnar buffer holding the most recent rows
+    appended to it. Each column is allocated with twice the capacity
+    so that the retained rows always form a contiguous block, which
+    allows the buffer contents to be returned as views rather than
+    copies. Once the end of the allocated arrays is reached the
+    retained rows are moved back to the start, which amortizes to a
+    constant cost per appended row.
+
+    If an index column and an expiry are supplied, rows whose index
+    value is more than the expiry older than the latest row are
+    dropped, assuming the index increases monotonically.
+    """
+
+    def __init__(self, length, index=None, expiry=None):
+        if expiry is not None and index is None:
+            raise ValueError('RingBuffer requires an index column to '
+                             'expire rows.')
+        self.length = length
+        self.index = index
+        self.expiry = expiry
+        self._columns = None
+        self._start = 0
+        self._stop = 0
+
+
+    def __len__(self):
+        return self._stop - self._start
+
+
+    @classmethod
+    def _chunk_columns(cls, chunk):
+        """
+        Converts a DataFrame or dictionary of columns into an
+        OrderedDict of 1D arrays of equal length.
+        """
+        if util.is_dataframe(chunk):
+            columns = [(c, chunk[c].values) for c in chunk.columns]
+        elif isinstance(chunk, dict):
+            columns = [(k, np.atleast_1d(np.asarray(v))) for k, v in chunk.items()]
+        else:
+            raise TypeError('RingBuffer expects data chunks to be supplied as '
+                            'a DataFrame or dictionary of columns, not %s.'
+                            % type(chunk).__name__)
+        if len(set(len(v) for _, v in columns)) > 1:
+            raise ValueError('RingBuffer data chunks must have columns '
+                             'of equal length.')
+        return OrderedDict(columns)
+
+
+    def append(self, chunk):
+        """
+        Appends a chunk of rows supplied as a DataFrame or dictionary
+        of columns, dropping the oldest rows once the capacity is
+        exceeded.
+        """
+        columns = self._chunk_columns(chunk)
+        if self._columns is None:
+            self._columns = OrderedDict(
+                (k, np.empty(self.length*2, dtype=object if v.dtype.kind in 'SUO'
+                             else v.dtype)) for k, v in columns.items())
+        elif list(columns) != list(self._columns):
+            raise ValueError('RingBuffer data chunks must supply the columns '
+                             '%s, found %s.' % (list(self._columns), list(columns)))
+        rows = len(next(iter(columns.values()))) if columns else 0
+        if rows > self.length:
+            columns = OrderedDict((k, v[-self.length:]) for k, v in columns.items())
+            rows = self.length
+        if not rows:
+            return
+
+        if self._stop + rows > self.length*2:
+            keep = min(len(self), self.length - rows)
+            for arr in self._columns.values():
+                arr[:keep] = arr[self._stop-keep:self._stop]
+            self._start, self._stop = 0, keep
+        for k, arr in self._columns.items():
+            arr[self._stop:self._stop+rows] = columns[k]
+        self._stop += rows
+        self._start = max(self._start, self._stop - self.length)
+        if self.expiry is not None:
+            self._expire()
+
+
+    def _expire(self):
+        index = self._columns[self.index][self._start:self._stop]
+        cutoff = index[-1] - self.expiry
+        self._start += int(np.searchsorted(index, cutoff, side='left'))
+
+
+    def view(self):
+        """
+        Returns SharedColumns holding views onto the rows held by the
+        buffer, which elements wrap without copying. The views share
+        memory with the buffer and are only valid until the next chunk
+        is appended.
+        """
+        if self._columns is None:
+            return SharedColumns()
+        return SharedColumns((k, arr[self._start:self._stop])
+                             for k, arr in self._columns.items())
+
+
+
+class Buffer(Stream):
+    """
+    A stream carrying data, which accumulates the chunks supplied via
+    the update method in a RingBuffer of fixed length. The data
+    parameter holds views onto the rows currently in the buffer as a
+    dictionary of columns, allowing a DynamicMap to render a
+    continuously growing stream of data in constant memory, e.g.:
+
+        buffer = Buffer(pd.DataFrame({'x': [], 'y': []}), length=1000)
+        dmap = DynamicMap(Curve, kdims=[], streams=[buffer])
+        buffer.update(data=pd.DataFrame({'x': [0, 1], 'y': [3, 2]}))
+
+    The initial data, which may be empty, declares the columns and
+    types of all subsequent chunks.
+    """
+
+    data = param.Parameter(default=None, constant=True, doc="""
+        Dictionary of views onto the columns of the buffered rows.""")
+
+    length = param.Integer(default=1000, bounds=(1, None), constant=True, doc="""
+        Maximum number of rows held by the buffer.""")
+
+    index = param.String(default=None, allow_None=True, constant=True, doc="""
+        Name of the monotonically increasing column rows are expired on.""")
+
+    expiry = param.Parameter(default=None, constant=True, doc="""
+        Rows whose index value is further than the expiry behind the
+        latest row are dropped, e.g. a number or a timedelta.""")
+
+    # Memoizing would require hashing the buffered data on every update
+    _memoize = False
+
+    def __init__(self, data=None, **params):
+        super(Buffer, self).__init__(**params)
+        self._buffer = RingBuffer(self.length, self.index, self.expiry)
+        if data is not None:
+            self._buffer.append(data)
+        self._set_stream_parameters(data=self._buffer.view())
+
+
+    @property
+    def contents(self):
+        return {self._rename.get('data', 'data'): self.data}
+
+
+    def update(self, trigger=True, **kwargs):
+        """
+        Appends the chunk of data supplied as a DataFrame or
+        dictionary of columns to the buffer.
+
+        If trigger is enabled, the trigger classmethod is invoked on
+        this Stream instance to execute its subscribers.
+        """
+        if set(kwargs) - {'data'}:
+            raise KeyError('Buffer may only be updated with data, the '
+                           'remaining parameters are fixed.')
+        if kwargs.get('data') is not None:
+            self._buffer.append(kwargs['data'])
+            self._set_stream_parameters(data=self._buffer.view())
+        if trigger:
+            self.trigger([self])
+
+
+    def __repr__(self):
+        cls_name = self.__class__.__name__
+        return '%s(length=%d, rows=%d)' % (cls_name, self.length, len(self._buffer))
+
+
+
 class ParamValues(Stream):
     """
     A Stream based on the parameter values of some other parameterized
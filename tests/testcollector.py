@@ -1,11 +1,16 @@
+import os
 import pickle
+import shutil
+import tempfile
 from collections import OrderedDict
 
 import numpy as np
+import param
 
 from holoviews import Image, Layout
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.interface.collector import ViewRef
+from holoviews.interface.collector import ViewRef, Collector
+from holoviews.operation.element import transform
 
 
 class LayoutTest(ComparisonTestCase):
@@ -136,3 +141,68 @@ class ViewRefTest(ComparisonTestCase):
         self.assertEqual(ref.specification, [('Example', 'Path1'), ('Example', 'Path2')])
         self.assertEqual(ref.specification, ref2.specification)
 
+
+
+
+class CollectorSource(object):
+    "Simple object collected by the CollectorTest"
+
+    def __init__(self, scale):
+        self.scale = scale
+
+
+class CollectorTest(ComparisonTestCase):
+
+    def setUp(self):
+        param.Dynamic.time_fn.__enter__()
+        param.Dynamic.time_fn(0)
+        Collector.for_type(CollectorSource, self._hook)
+        self.tmpdir = tempfile.mkdtemp()
+        self.collector = Collector()
+        self.collector.Data.A = self.collector.collect(CollectorSource(1))
+        self.collector.Data.B = self.collector.collect(CollectorSource(2))
+        self.collector.Data.C = self.collector.analyze(self.collector.ref.Data.A,
+                                                       transform, operator=lambda x: x*3)
+        super(CollectorTest, self).setUp()
+
+    def tearDown(self):
+        param.Dynamic.time_fn.__exit__(None)
+        Collector.type_hooks.pop(CollectorSource)
+        shutil.rmtree(self.tmpdir)
+
+    @staticmethod
+    def _hook(obj):
+        return Image(np.ones((2, 2))*obj.scale*param.Dynamic.time_fn())
+
+    def test_collector_threaded(self):
+        serial = self.collector(Layout(), times=[1, 2, 3])
+        param.Dynamic.time_fn(0)
+        threaded = self.collector(Layout(), times=[1, 2, 3], threads=3)
+        for path in [('Data', 'A'), ('Data', 'B'), ('Data', 'C')]:
+            self.assertEqual(threaded.data[path], serial.data[path])
+        self.assertEqual(threaded.Data.C[3].data, np.ones((2, 2))*9)
+
+    def test_collector_timings(self):
+        self.collector(Layout(), times=[1, 2])
+        self.assertEqual(list(self.collector.timings.keys()),
+                         ['Data.A', 'Data.B', 'Data.C'])
+        self.assertEqual(len(self.collector.timings['Data.C']), 2)
+
+    def test_collector_checkpoint_resume(self):
+        checkpoint = os.path.join(self.tmpdir, 'collected')
+        self.collector(Layout(), times=[1, 2], checkpoint=checkpoint)
+        attrtree, time = Collector.load_checkpoint(checkpoint+'.hvz')
+        self.assertEqual(time, 2)
+        self.assertEqual(attrtree.Data.B.keys(), [1, 2])
+        resumed = self.collector(Layout(), times=[1, 2, 3, 4],
+                                 checkpoint=checkpoint, resume=True)
+        self.assertEqual(resumed.Data.A.keys(), [1, 2, 3, 4])
+        self.assertEqual(resumed.Data.B[4], Image(np.ones((2, 2))*8))
+
+    def test_collector_checkpoint_replaced(self):
+        checkpoint = os.path.join(self.tmpdir, 'collected')
+        self.collector(Layout(), times=[1, 2], checkpoint=checkpoint)
+        self.collector(Layout(), times=[1, 2, 3], checkpoint=checkpoint, resume=True)
+        self.assertEqual(os.listdir(self.tmpdir), ['collected.hvz'])
+        attrtree, time = Collector.load_checkpoint(checkpoint+'.hvz')
+        self.assertEqual(time, 3)
@@ -6,7 +6,7 @@ import numpy as np
 
 from holoviews.core import BoundingBox, Dimension
 from holoviews.core.element import HoloMap
-from holoviews.element.comparison import ComparisonTestCase
+from holoviews.element.comparison import Comparison, ComparisonTestCase
 from holoviews import Image
 
 
@@ -169,3 +169,26 @@ class RasterMapComparisonTest(RasterMapTestCase):
         except AssertionError as e:
             if not str(e).startswith('Image not almost equal to 6 decimals\n'):
                 raise self.failureException("Image mismatch error not raised.")
+
+
+    def test_content_hashing_equal(self):
+        content_hashing = Comparison.content_hashing
+        try:
+            Comparison.content_hashing = True
+            hmap = HoloMap({k: Image(v.data.copy(), v.bounds)
+                            for k, v in self.map1_1D.items()}, kdims=['int'])
+            self.assertEqual(self.map1_1D, hmap)
+        finally:
+            Comparison.content_hashing = content_hashing
+
+    def test_content_hashing_element_mismatch(self):
+        content_hashing = Comparison.content_hashing
+        try:
+            Comparison.content_hashing = True
+            self.assertEqual(self.map1_1D, self.map4_1D)
+            raise AssertionError("Pane mismatch in array data not raised.")
+        except AssertionError as e:
+            if not str(e).startswith('Image not almost equal to 6 decimals\n'):
+                raise self.failureException("Image mismatch error not raised.")
+        finally:
+            Comparison.content_hashing = content_hashing
@@ -6,7 +6,7 @@ Int, float, numpy array and BoundingBox comparisons are tested.
 
 import numpy as np
 from holoviews.core import BoundingBox
-from holoviews.element.comparison import ComparisonTestCase
+from holoviews.element.comparison import Comparison, ComparisonTestCase
 
 
 class SimpleComparisonTest(ComparisonTestCase):
@@ -82,6 +82,28 @@ class SimpleComparisonTest(ComparisonTestCase):
             if not str(e).startswith("Arrays not almost equal to 6 decimals"):
                             raise self.failureException("Float array mismatch error not raised.")
 
+    def test_arrays_equal_chunked(self):
+        chunk_size = Comparison.array_chunk_size
+        try:
+            Comparison.array_chunk_size = 3
+            self.assertEqual(np.array([[1.0, np.NaN, 3], [4, 5, 6], [7, 8, 9]]),
+                             np.array([[1.0, np.NaN, 3], [4, 5, 6], [7, 8, 9]]))
+        finally:
+            Comparison.array_chunk_size = chunk_size
+
+    def test_arrays_unequal_chunked(self):
+        chunk_size = Comparison.array_chunk_size
+        try:
+            Comparison.array_chunk_size = 3
+            self.assertEqual(np.arange(9.).reshape(3, 3),
+                             np.arange(1, 10.).reshape(3, 3))
+            raise AssertionError("Chunked array mismatch not raised.")
+        except AssertionError as e:
+            if not str(e).startswith("Arrays (flattened from index 0) not almost equal"):
+                raise self.failureException("Chunked array mismatch error not raised.")
+        finally:
+            Comparison.array_chunk_size = chunk_size
+
     def test_bounds_equal(self):
         self.assertEqual(BoundingBox(radius=0.5),
                          BoundingBox(radius=0.5))
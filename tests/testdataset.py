@@ -2,11 +2,15 @@
 Tests for the Dataset Element types.
 """
 
+import os
+import shutil
+import tempfile
 from unittest import SkipTest
 from itertools import product
 
 import numpy as np
 from holoviews import Dataset, NdElement, HoloMap, Dimension
+from holoviews.core.data import Interface
 from holoviews.element.comparison import ComparisonTestCase
 
 from collections import OrderedDict
@@ -60,6 +64,22 @@ class HomogeneousColumnTypes(object):
     def tearDown(self):
         Dataset.datatype = self.restore_datatype
 
+    def test_dataset_clone_hm(self):
+        clone = self.dataset_hm.clone()
+        self.assertIs(clone.data, self.dataset_hm.data)
+        self.assertIs(clone.interface, self.dataset_hm.interface)
+        self.assertEqual(clone, self.dataset_hm)
+
+    def test_dataset_clone_dimensions_hm(self):
+        kdims, vdims = [Dimension('x', unit='s')], [Dimension('y', unit='m')]
+        clone = self.dataset_hm.clone(kdims=kdims, vdims=vdims, group='Clone')
+        self.assertEqual(clone.kdims, kdims)
+        self.assertEqual(clone.vdims, vdims)
+        self.assertEqual(clone.group, 'Clone')
+        self.assertEqual(self.dataset_hm.kdims, [Dimension('x')])
+        self.assertEqual(clone.dimension_values('y'),
+                         self.dataset_hm.dimension_values('y'))
+
     # Test the array constructor (homogenous data) to be supported by
     # all interfaces.
 
@@ -103,6 +123,10 @@ class HomogeneousColumnTypes(object):
         closest = self.dataset_hm.closest([0.51, 1, 9.9])
         self.assertEqual(closest, [1., 1., 10.])
 
+    def test_dataset_closest_out_of_bounds(self):
+        closest = self.dataset_hm.closest([-2, 4.5, 12])
+        self.assertEqual(closest, [0., 4., 10.])
+
     # Operations
 
     def test_dataset_sort_vdim_hm(self):
@@ -224,6 +248,21 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
     Tests for data formats that all dataset to have varied types
     """
 
+    def test_dataset_clone_missing_dimension_hm(self):
+        with self.assertRaises(Exception):
+            self.dataset_hm.clone(kdims=[Dimension('z')])
+
+    def test_dataset_clone_params_ht(self):
+        reindexed = self.table.reindex(['Gender'], ['Weight'])
+        self.assertEqual(dict(reindexed.get_param_values())['kdims'],
+                         [Dimension('Gender')])
+        self.assertIsNot(reindexed.cdims, self.table.cdims)
+
+    def test_dataset_reindex_select_list_ht(self):
+        selected = self.table.reindex(['Age'], ['Weight']).select(Age=[10, 12])
+        self.assertEqual(selected.kdims, [Dimension('Age')])
+        self.assertEqual(selected.dimension_values('Weight'), np.array([15, 10]))
+
     def init_data(self):
         self.kdims = ['Gender', 'Age']
         self.vdims = ['Weight', 'Height']
@@ -345,6 +384,14 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
         samples = self.dataset_ht.sample([0, 5, 10]).dimension_values('y')
         self.assertEqual(samples, np.array([0, 0.5, 1]))
 
+    def test_dataset_sample_multiple_dims_ht(self):
+        samples = self.table.sample([('M', 16), ('F', 10), ('F',)])
+        self.assertEqual(samples.dimension_values('Weight'), np.array([18, 10]))
+
+    def test_dataset_select_list_ht(self):
+        selected = self.table.select(Age=[10, 12, 20])
+        self.assertEqual(selected.dimension_values('Weight'), np.array([15, 10]))
+
     def test_dataset_reduce_ht(self):
         reduced = Dataset({'Age':self.age, 'Weight':self.weight, 'Height':self.height},
                           kdims=self.kdims[1:], vdims=self.vdims)
@@ -375,6 +422,22 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
                              kdims=self.alias_kdims[:1], vdims=self.alias_vdims)
         self.compare_dataset(self.alias_table.aggregate('Gender', np.mean), aggregated)
 
+    def test_dataset_aggregate_spreadfn_ht(self):
+        aggregated = self.table.aggregate(['Gender'], np.mean, np.min)
+        self.assertEqual([d.name for d in aggregated.vdims],
+                         ['Weight', 'Height', 'Weight_amin', 'Height_amin'])
+        self.assertEqual(aggregated.dimension_values('Weight'), np.array([16.5, 10]))
+        self.assertEqual(aggregated.dimension_values('Weight_amin'), np.array([15, 10]))
+        self.assertEqual(aggregated.dimension_values('Height_amin'), np.array([0.6, 0.8]))
+
+    def test_dataset_aggregate_multiple_functions_ht(self):
+        aggregated = self.table.aggregate(['Gender'], [np.mean, np.max])
+        self.assertEqual([d.name for d in aggregated.vdims],
+                         ['Weight_mean', 'Height_mean', 'Weight_amax', 'Height_amax'])
+        self.assertEqual(aggregated.dimension_values('Gender'), np.array(['M', 'F']))
+        self.assertEqual(aggregated.dimension_values('Height_mean'), np.array([0.7, 0.8]))
+        self.assertEqual(aggregated.dimension_values('Weight_amax'), np.array([18, 10]))
+
     def test_dataset_2D_aggregate_partial_ht(self):
         dataset = Dataset({'x':self.xs, 'y':self.ys, 'z':self.zs},
                           kdims=['x', 'y'], vdims=['z'])
@@ -414,6 +477,65 @@ class HeterogeneousColumnTypes(HomogeneousColumnTypes):
         self.assertEqual(grouped_dataset['F'],
                          self.alias_table.select(gender='F').reindex(['Age']))
 
+    def test_dataset_groupby_dynamic_multiple_dims(self):
+        grouped_dataset = self.table.groupby(['Gender', 'Age'], dynamic=True)
+        self.assertEqual(grouped_dataset['M', 16],
+                         self.table.select(Gender='M', Age=16).reindex([]))
+
+    def test_dataset_group_index(self):
+        index = self.table.interface.group_index(self.table, ['Gender'])
+        self.assertEqual(index.keys, [('M',), ('F',)])
+        self.assertEqual(index.get(('M',)), np.array([0, 1]))
+        self.assertEqual(index.get(('F',)), np.array([2]))
+        self.assertEqual(len(index.get(('X',))), 0)
+
+    def test_dataset_concatenate_ht(self):
+        concatenated = Interface.concatenate([self.table, self.table])
+        self.assertEqual(concatenated.dimension_values('Age'),
+                         np.array(self.age*2))
+        self.assertEqual(concatenated.dimension_values('Gender'),
+                         np.array(self.gender*2))
+
+    def test_dataset_concatenate_mixed_datatypes_ht(self):
+        other = Dataset({'Gender': ['F'], 'Age': [30], 'Weight': [20], 'Height': [1.5]},
+                        kdims=self.kdims, vdims=self.vdims, datatype=['dictionary'])
+        concatenated = Interface.concatenate([self.table, other],
+                                             datatype=self.table.interface.datatype)
+        self.assertIs(concatenated.interface, self.table.interface)
+        self.assertEqual(concatenated.dimension_values('Height'),
+                         np.array(self.height+[1.5]))
+
+    def test_dataset_concatenate_memmap_ht(self):
+        directory = tempfile.mkdtemp()
+        try:
+            concatenated = Interface.concatenate([self.table, self.table],
+                                                 memmap=directory)
+            self.assertEqual(concatenated.dimension_values('Weight'),
+                             np.array(self.weight*2))
+            self.assertTrue(os.listdir(directory))
+        finally:
+            shutil.rmtree(directory)
+
+    def test_dataset_lazy_select_reindex_aggregate(self):
+        lazy = self.table.lazy().select(Age=(10, 15)).reindex(['Gender'], ['Weight'])
+        eager = self.table.select(Age=(10, 15)).reindex(['Gender'], ['Weight'])
+        self.assertEqual(lazy.aggregate('Gender', np.mean),
+                         eager.aggregate('Gender', np.mean))
+
+    def test_dataset_lazy_deferred_until_values(self):
+        lazy = self.table.lazy().select(Gender='M').sort('Age')
+        self.assertEqual(len(lazy.data), 2)
+        self.assertEqual(lazy.data._results, {})
+        self.assertEqual(lazy.dimension_values('Age'), np.array([10, 16]))
+        self.assertEqual(len(lazy.data._results), 1)
+
+    def test_dataset_lazy_fused_selections(self):
+        lazy = self.table.lazy().select(Gender='M').sort('Age').select(Age=(12, 20))
+        stages = lazy.data.optimize()
+        self.assertEqual(len(stages), 1)
+        self.assertEqual(len(stages[0][0]), 2)
+        self.assertEqual(lazy.dimension_values('Weight'), np.array([18]))
+
     def test_dataset_add_dimensions_value_ht(self):
         table = self.dataset_ht.add_dimension('z', 1, 0)
         self.assertEqual(table.kdims[1], 'z')
@@ -531,6 +653,13 @@ class DFDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
         self.data_instance_type = pd.DataFrame
         self.init_data()
 
+    def test_dataset_select_categorical_list(self):
+        df = pd.DataFrame({'Gender': pd.Categorical(self.gender),
+                           'Weight': self.weight})
+        dataset = Dataset(df, kdims=['Gender'], vdims=['Weight'])
+        selected = dataset.select(Gender=['F', 'X'])
+        self.assertEqual(selected.dimension_values('Weight'), np.array([10]))
+
 
 class DaskDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
     """
@@ -579,6 +708,29 @@ class DictDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
         self.data_instance_type = (dict, cyODict, OrderedDict)
         self.init_data()
 
+    def test_dataset_groupby_modified_inplace(self):
+        dataset = Dataset({'x': np.array([0, 0, 1]), 'y': np.array([1, 2, 3])},
+                          kdims=['x'], vdims=['y'])
+        self.assertEqual(dataset.groupby('x')[0].dimension_values('y'), np.array([1, 2]))
+        dataset.data['x'][:] = [1, 0, 1]
+        self.assertEqual(dataset.groupby('x')[0].dimension_values('y'), np.array([2]))
+        self.assertEqual(dataset.aggregate('x', np.sum).dimension_values('y'),
+                         np.array([4, 2]))
+
+    def test_dataset_copies_dict_columns(self):
+        xs = np.array([0, 1, 2])
+        dataset = Dataset({'x': xs, 'y': np.array([1, 2, 3])}, kdims=['x'], vdims=['y'])
+        xs[:] = 0
+        self.assertEqual(dataset.dimension_values('x'), np.array([0, 1, 2]))
+
+    def test_dataset_groupby_unused_category(self):
+        dataset = Dataset({'g': ['A', 'C', 'A', 'C'], 'y': [1, 2, 3, 4]},
+                          kdims=[Dimension('g', values=['A', 'B', 'C'])], vdims=['y'])
+        aggregated = dataset.aggregate('g', np.sum)
+        self.assertEqual(aggregated.dimension_values('g'), np.array(['A', 'C']))
+        self.assertEqual(aggregated.dimension_values('y'), np.array([4, 6]))
+        groups = dataset.groupby('g', container_type=list)
+        self.assertEqual([len(group) for group in groups], [2, 2])
 
 
 class NdDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
@@ -592,6 +744,18 @@ class NdDatasetTest(HeterogeneousColumnTypes, ComparisonTestCase):
         self.data_instance_type = NdElement
         self.init_data()
 
+    def test_dataset_clone_missing_dimension_hm(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_sample_multiple_dims_ht(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_lazy_deferred_until_values(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_lazy_fused_selections(self):
+        raise SkipTest("Not supported")
+
     # Literal formats that have been previously been supported but
     # currently are only supported via NdElement.
 
@@ -650,6 +814,11 @@ class GridDatasetTest(HomogeneousColumnTypes, ComparisonTestCase):
         self.assertEqual(dataset.dimension_values('z', flat=False),
                          canonical)
 
+    def test_dataset_select_grid_list(self):
+        selected = self.dataset_grid.select(x=[1], y={0.1, 0.3})
+        self.assertEqual(selected.dimension_values('z', flat=False),
+                         np.array([[1], [5]]))
+
     def test_dataset_dim_vals_grid_kdims_xs(self):
         self.assertEqual(self.dataset_grid.dimension_values(0, expanded=False),
                          np.array([0, 1]))
@@ -861,6 +1030,30 @@ class GridDatasetTest(HomogeneousColumnTypes, ComparisonTestCase):
         for c, d in keys:
             self.assertEqual(grouped[c, d], dataset.select(c=c, d=d).reindex(['a', 'b']))
 
+    def test_dataset_groupby_all_dims(self):
+        array = np.random.rand(3, 2)
+        dataset = Dataset({'x': range(2), 'y': range(3), 'z': array, 'w': array*2},
+                          kdims=['x', 'y'], vdims=['z', 'w'])
+        grouped = dataset.groupby(['x', 'y'], container_type=dict, group_type=dict)
+        self.assertEqual(grouped[(1, 2)]['z'], array[2:, 1])
+        self.assertEqual(grouped[(1, 2)]['w'], array[2:, 1]*2)
+
+    def test_dataset_aggregate_transposed_hm(self):
+        array = np.random.rand(3, 4, 5)
+        dataset = Dataset({'x': range(5), 'y': range(4), 'z': range(3), 'Val': array},
+                          kdims=['x', 'y', 'z'], vdims=['Val'])
+        aggregated = dataset.aggregate(['y', 'x'], np.mean)
+        self.assertEqual(aggregated.kdims, ['y', 'x'])
+        self.assertEqual(aggregated.dimension_values('Val', flat=False),
+                         array.mean(axis=0).T)
+
+    def test_dataset_aggregate_ufunc_hm(self):
+        array = np.random.rand(3, 4, 5)
+        dataset = Dataset({'x': range(5), 'y': range(4), 'z': range(3), 'Val': array},
+                          kdims=['x', 'y', 'z'], vdims=['Val'])
+        self.assertEqual(dataset.aggregate(['x'], np.add).dimension_values('Val'),
+                         array.sum(axis=(0, 1)))
+
     def test_dataset_groupby_drop_dims(self):
         array = np.random.rand(3, 20, 10)
         ds = Dataset({'x': range(10), 'y': range(20), 'z': range(3), 'Val': array},
@@ -950,6 +1143,15 @@ class IrisDatasetTest(GridDatasetTest):
 
     def test_dataset_groupby_drop_dims_dynamic_with_vdim(self):
         raise SkipTest("Not supported")
+
+    def test_dataset_groupby_all_dims(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_aggregate_transposed_hm(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_aggregate_ufunc_hm(self):
+        raise SkipTest("Not supported")
     
 
 class XArrayDatasetTest(GridDatasetTest):
@@ -981,3 +1183,12 @@ class XArrayDatasetTest(GridDatasetTest):
 
     def test_dataset_sample_hm_alias(self):
         raise SkipTest("Not supported")
+
+    def test_dataset_groupby_all_dims(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_aggregate_transposed_hm(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_aggregate_ufunc_hm(self):
+        raise SkipTest("Not supported")
@@ -2,7 +2,7 @@ import numpy as np
 from holoviews import Dimension, NdLayout, GridSpace
 from holoviews.core.spaces import DynamicMap, HoloMap, Callable
 from holoviews.element import Image, Scatter, Curve, Text
-from holoviews.streams import PositionXY
+from holoviews.streams import PositionXY, Buffer
 from holoviews.util import Dynamic
 from holoviews.element.comparison import ComparisonTestCase
 
@@ -314,3 +314,18 @@ class DynamicCollate(ComparisonTestCase):
         self.assertEqual(list(grid.keys()), [(i, j) for i in range(1, 3)
                                              for j in range(1, 3)])
         self.assertEqual(stream.source, grid[(1, 2)])
+
+
+class DynamicBufferStream(ComparisonTestCase):
+
+    def test_dynamic_buffer_element(self):
+        buff = Buffer({'x': np.array([0., 1.]), 'y': np.array([2., 3.])}, length=3)
+        dmap = DynamicMap(Curve, kdims=[], streams=[buff])
+        buff.update(data={'x': np.array([2., 3.]), 'y': np.array([4., 5.])})
+        self.assertEqual(dmap[()], Curve(([1., 2., 3.], [3., 4., 5.])))
+
+    def test_dynamic_buffer_element_shares_memory(self):
+        buff = Buffer({'x': np.array([0., 1.]), 'y': np.array([2., 3.])}, length=3)
+        dmap = DynamicMap(Curve, kdims=[], streams=[buff])
+        buff.update(data={'x': np.array([2.]), 'y': np.array([4.])})
+        self.assertTrue(np.may_share_memory(dmap[()].data['x'], buff.data['x']))
@@ -1,6 +1,7 @@
 import numpy as np
 
-from holoviews import Dataset, Curve, Path, Histogram, HeatMap
+from holoviews import Dataset, Curve, Path, Histogram, HeatMap, Polygons
+from holoviews.element import PackedPaths
 from holoviews.element.comparison import ComparisonTestCase
 
 class ElementConstructorTest(ComparisonTestCase):
@@ -36,6 +37,25 @@ class ElementConstructorTest(ComparisonTestCase):
     def test_path_ziplist_construct(self):
         self.assertEqual(Path([list(zip(self.xs, self.sin)), list(zip(self.xs, self.cos))]), self.path)
 
+    def test_path_packed_construct(self):
+        packed = PackedPaths.from_paths(self.path.data)
+        self.assertEqual(Path(packed), self.path)
+
+    def test_path_packed_dimension_values(self):
+        path = Path(PackedPaths.from_paths(self.path.data))
+        self.assertEqual(path.dimension_values(1), self.path.dimension_values(1))
+
+    def test_path_packed_slice(self):
+        packed = PackedPaths.from_paths(self.path.data)
+        self.assertEqual(Path(packed[1:]), Path(self.path.data[1:]))
+
+    def test_polygons_packed_values_table(self):
+        paths = [np.array([(0, 0), (1, 0), (1, 1)]), np.array([(2, 2), (3, 3)])]
+        polys = Polygons(PackedPaths.from_paths(paths, values=[1, 2]), vdims=['Value'])
+        table = polys.table()
+        self.assertEqual(len(table), 5)
+        self.assertEqual(table.dimension_values('Value'), np.array([1, 1, 1, 2, 2]))
+
     def test_chart_zip_construct(self):
         self.assertEqual(Histogram(list(zip(self.hxs, self.sin))), self.histogram)
 
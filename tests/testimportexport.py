@@ -4,7 +4,7 @@ Unit test of the (non-rendering) exporters and importers.
 
 import os
 import numpy as np
-from holoviews import Image, Layout
+from holoviews import Image, Layout, NdMapping
 from holoviews.core.io import Serializer, Pickler, Unpickler, Deserializer
 from holoviews.element.comparison import ComparisonTestCase
 
@@ -187,3 +187,25 @@ class TestPicklerAdvanced(ComparisonTestCase):
                                 entries=['Image.I(L)'])
         self.assertEqual(single_layout, loaded)
 
+
+    def test_unpickler_collect(self):
+        for i, img in enumerate([self.image1, self.image2]):
+            Pickler.save(img+img, 'test_unpickler_collect_%d' % i, key={'i':i})
+        files = NdMapping([(i, 'test_unpickler_collect_%d.hvz' % i)
+                           for i in range(2)], kdims=['j'])
+        collected = Unpickler.collect(files)
+        self.assertEqual(collected.Image.I.kdims, ['j', 'i'])
+        self.assertEqual(collected.Image.I.keys(), [(0, 0), (1, 1)])
+        self.assertEqual(collected.Image.II[(1, 1)],
+                         ('test_unpickler_collect_1.hvz', ['Image.II']))
+
+    def test_unpickler_scan_index(self):
+        Pickler.save(self.image1, 'test_unpickler_scan_index', key={'i':0})
+        fname, index = 'test_unpickler_scan_index.hvz', 'test_unpickler_scan_index.idx'
+        try:
+            scanned = Unpickler.instance(index=index).scan([fname])
+            self.assertEqual(scanned, {fname: ({'i':0}, ['Image.'])})
+            self.assertTrue(os.path.isfile(index))
+            self.assertEqual(Unpickler.instance(index=index).scan([fname]), scanned)
+        finally:
+            os.remove(index)
@@ -0,0 +1,72 @@
+"""
+Tests that importing holoviews defers the import of optional
+dependencies until they are first used.
+"""
+import os
+import sys
+import json
+import subprocess
+from unittest import SkipTest
+
+try:
+    import pandas as pd
+except:
+    pd = None
+
+from holoviews.element.comparison import ComparisonTestCase
+
+IMPORT_SCRIPT = """
+import sys, json
+import holoviews
+optional = ['pandas', 'IPython', 'xarray', 'iris', 'dask', 'seaborn']
+print(json.dumps({'imported': [m for m in optional if m in sys.modules]}))
+"""
+
+EXPORT_SCRIPT = """
+import json
+import holoviews.core as core
+from holoviews.core import data
+import pandas as pd
+data.Dataset(pd.DataFrame({'x': [0, 1], 'y': [1, 2]}), kdims=['x'])
+from holoviews.core.data import PandasInterface, DFColumns
+print(json.dumps({'exported': [PandasInterface is DFColumns,
+                               core.PandasInterface is PandasInterface]}))
+"""
+
+PREIMPORTED_SCRIPT = """
+import json
+import pandas
+from holoviews.core.data import PandasInterface
+from holoviews.core import PandasInterface as CoreInterface
+print(json.dumps({'exported': PandasInterface is CoreInterface}))
+"""
+
+
+def run_script(script):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([root, env.get('PYTHONPATH', '')])
+    output = subprocess.check_output([sys.executable, '-c', script], env=env)
+    return json.loads(output.decode('utf-8').splitlines()[-1])
+
+
+class ImportTest(ComparisonTestCase):
+
+    def test_import_defers_optional_dependencies(self):
+        result = run_script(IMPORT_SCRIPT)
+        self.assertEqual(result['imported'], [])
+
+
+class InterfaceExportTest(ComparisonTestCase):
+
+    def setUp(self):
+        if pd is None:
+            raise SkipTest("Pandas not available")
+
+    def test_pandas_interface_exported_once_loaded(self):
+        result = run_script(EXPORT_SCRIPT)
+        self.assertEqual(result['exported'], [True, True])
+
+    def test_pandas_interface_exported_if_pandas_imported(self):
+        result = run_script(PREIMPORTED_SCRIPT)
+        self.assertTrue(result['exported'])
@@ -1,7 +1,7 @@
 from collections import OrderedDict
 
 from holoviews.core import Dimension
-from holoviews.core.ndmapping import MultiDimensionalMapping
+from holoviews.core.ndmapping import MultiDimensionalMapping, NdMapping
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews import HoloMap, Dataset
 import numpy as np
@@ -105,6 +105,16 @@ class NdIndexableMappingTest(ComparisonTestCase):
         self.assertEquals(grouped.values()[0].keys(), ['A'])
         self.assertEquals(grouped.last.keys(), ['B', 'C'])
 
+    def test_idxmapping_groupby_multiple_dims(self):
+        data = [((1, 'A', 0), 'a'), ((0, 'B', 1), 'b'),
+                ((1, 'B', 0), 'c'), ((0, 'A', 1), 'd')]
+        ndmap = MultiDimensionalMapping(data, kdims=['X', 'Y', 'Z'])
+        grouped = ndmap.groupby(['Y', 'Z'])
+        self.assertEquals(grouped.keys(), [('A', 0), ('A', 1), ('B', 0), ('B', 1)])
+        self.assertEquals(grouped[('B', 0)].kdims, ['X'])
+        self.assertEquals(grouped[('B', 0)].keys(), [1])
+        self.assertEquals(grouped[('A', 1)].keys(), [0])
+
     def test_idxmapping_reindex(self):
         data = [((0, 0.5), 'a'), ((1, 0.5), 'b')]
         ndmap = MultiDimensionalMapping(data, kdims=[self.dim1, self.dim2])
@@ -149,6 +159,18 @@ class NdIndexableMappingTest(ComparisonTestCase):
         ndmap.update({'A': nested2})
         self.assertEqual(ndmap['A'].data, nested_clone.data)
 
+    def test_idxmapping_categorical_slice(self):
+        dim = Dimension('cat', values=['c', 'a', 'b'])
+        ndmap = NdMapping([(k, i) for i, k in enumerate('bca')], kdims=[dim])
+        self.assertEqual(ndmap['a':'b'].keys(), ['a'])
+        self.assertEqual(ndmap[['c', 'a']].keys(), ['a', 'c'])
+
+    def test_idxmapping_categorical_invalid_key(self):
+        dim = Dimension('cat', values=['a', 'b'])
+        ndmap = MultiDimensionalMapping([('a', 0)], kdims=[dim])
+        with self.assertRaises(KeyError):
+            ndmap['c'] = 1
+
 
 class HoloMapTest(ComparisonTestCase):
 
@@ -1,11 +1,11 @@
 import numpy as np
 
 from holoviews import (HoloMap, NdOverlay, NdLayout, GridSpace, Image,
-                       Contours, Polygons, Points, Histogram, Curve)
+                       Contours, Polygons, Points, Histogram, Curve, QuadMesh)
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation.element import (operation, transform, threshold,
                                          gradient, contours, histogram,
-                                         interpolate_curve)
+                                         interpolate_curve, regrid)
 
 class ElementOperationTests(ComparisonTestCase):
     """
@@ -64,11 +64,56 @@ class ElementOperationTests(ComparisonTestCase):
         img = Image(np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]]))
         op_contours = contours(img, filled=True, levels=[2, 2.5])
         ndoverlay = NdOverlay(None, kdims=['Levels'])
-        data = [[(0., 0.333333), (0.5, 0.3), (0.5, 0.25), (0., 0.25),
-                 (-0.5, 0.08333333), (-0.5, 0.16666667), (0., 0.33333333)]]
+        data = [[(-0.5, 0.16666667), (-0.5, 0.08333333), (0., 0.25), (0.5, 0.25),
+                 (0.5, 0.3), (0., 0.33333333), (-0.5, 0.16666667)]]
         ndoverlay[0.5] = Polygons(data, group='Level', level=2, vdims=img.vdims)
         self.assertEqual(op_contours, img*ndoverlay)
 
+    def test_image_contours_closed(self):
+        img = Image(np.array([[0, 0, 0], [0, 1, 0], [0, 0, 0.]]))
+        op_contours = contours(img, overlaid=False)
+        data = [[(-0.25, 0.), (0., 0.25), (0.25, 0.), (0., -0.25), (-0.25, 0.)]]
+        ndoverlay = NdOverlay(None, kdims=['Levels'])
+        ndoverlay[0.5] = Contours(data, group='Level', level=0.5, vdims=img.vdims)
+        self.assertEqual(op_contours, ndoverlay)
+
+    def test_image_contours_filled_nan(self):
+        img = Image(np.array([[1, 1, np.NaN], [1, 1, 1], [1, 1, 1.]]))
+        polys = contours(img, filled=True, levels=[0, 2], overlaid=False).last
+        self.assertEqual(len(polys.data), 1)
+        path = polys.data[0]
+        self.assertEqual(path[0], path[-1])
+        self.assertEqual(path[:, 0].max(), 0.5)
+        self.assertEqual(path[:, 1].min(), -0.5)
+
+    def test_image_contours_nan_corner(self):
+        img = Image(np.array([[0, 0, np.NaN], [0, 1, 0], [0, 0, 0.]]))
+        op_contours = contours(img, overlaid=False)
+        data = [[(-0.25, 0.), (0., 0.25), (0.25, 0.), (0., -0.25), (-0.25, 0.)]]
+        ndoverlay = NdOverlay(None, kdims=['Levels'])
+        ndoverlay[0.5] = Contours(data, group='Level', level=0.5, vdims=img.vdims)
+        self.assertEqual(op_contours, ndoverlay)
+
+    def test_image_contours_nan_cells(self):
+        img = Image(np.array([[0, 0, np.NaN], [0, 1, np.NaN], [0, 0, 0.]]))
+        op_contours = contours(img, overlaid=False)
+        data = [[(0.25, -0.25), (0., -0.25), (-0.25, 0.), (0., 0.25)]]
+        ndoverlay = NdOverlay(None, kdims=['Levels'])
+        ndoverlay[0.5] = Contours(data, group='Level', level=0.5, vdims=img.vdims)
+        self.assertEqual(op_contours, ndoverlay)
+
+    def test_image_contours_filled_nan_center(self):
+        img = Image(np.array([[0, 0, 0], [0, np.NaN, 0], [0, 0, 0.]]))
+        polys = contours(img, filled=True, levels=[-1, 1], overlaid=False).last
+        self.assertEqual(len(polys.data), 4)
+        self.assertEqual(polys.data[0], np.array([[-0.5, 0.5], [-0.5, 0.],
+                                                  [0., 0.5], [-0.5, 0.5]]))
+
+    def test_holomap_contours_threaded(self):
+        hmap = HoloMap({i: Image(np.random.rand(10, 10)) for i in range(4)})
+        threaded = contours(hmap, threads=2, levels=(0.3, 0.6))
+        self.assertEqual(threaded, contours(hmap, levels=(0.3, 0.6)))
+
     def test_points_histogram(self):
         points = Points([float(i) for i in range(10)])
         op_hist = histogram(points, num_bins=3)
@@ -99,6 +144,26 @@ class ElementOperationTests(ComparisonTestCase):
         hist = Histogram(([1.,  4., 7.5], [0, 3, 6, 9]), vdims=['y'])
         self.assertEqual(op_hist, hist)
 
+    def test_points_histogram_chunked(self):
+        points = Points(np.random.RandomState(1).randn(1000, 2))
+        op_hist = histogram(points, num_bins=7, chunksize=33)
+        self.assertEqual(op_hist, histogram(points, num_bins=7, chunksize=None))
+
+    def test_points_histogram_nan_weighted(self):
+        points = Points([(0, 0), (1, np.NaN), (2, 1), (3, 2)])
+        op_hist = histogram(points, num_bins=2, dimension='y',
+                            weight_dimension='x', normed=False)
+        hist = Histogram(([0, 5], [0, 1, 2]), kdims=['y'], vdims=['x'])
+        self.assertEqual(op_hist, hist)
+
+    def test_holomap_histogram_shared_edges(self):
+        hmap = HoloMap({i: Points([float(j*i) for j in range(10)])
+                        for i in range(1, 4)})
+        op_hmap = histogram(hmap, num_bins=3, dimension='y', individually=False)
+        for hist in op_hmap.values():
+            self.assertEqual(hist.edges, np.array([0, 9, 18, 27]))
+        self.assertEqual(op_hmap[1].values, np.array([0.1, 0.011111, 0]))
+
     def test_interpolate_curve_pre(self):
         interpolated = interpolate_curve(Curve([0, 0.5, 1]), interpolation='steps-pre')
         curve = Curve([(0, 0), (0, 0.5), (1, 0.5), (1, 1), (2, 1)])
@@ -113,3 +178,58 @@ class ElementOperationTests(ComparisonTestCase):
         interpolated = interpolate_curve(Curve([0, 0.5, 1]), interpolation='steps-post')
         curve = Curve([(0, 0), (1, 0), (1, 0.5), (2, 0.5), (2, 1)])
         self.assertEqual(interpolated, curve)
+
+    def test_regrid_image_mean(self):
+        img = Image(np.arange(16).reshape(4, 4), bounds=(0, 0, 4, 4))
+        regridded = regrid(img, width=2, height=2, dynamic=False)
+        self.assertEqual(regridded, Image(np.array([[2.5, 4.5], [10.5, 12.5]]),
+                                          bounds=(0, 0, 4, 4)))
+
+    def test_regrid_image_window_max(self):
+        img = Image(np.arange(64).reshape(8, 8), bounds=(0, 0, 8, 8))
+        regridded = regrid(img, width=2, height=2, x_range=(0, 4), y_range=(4, 8),
+                           aggregator='max', dynamic=False)
+        self.assertEqual(regridded, Image(np.array([[9, 11], [25, 27]]),
+                                          bounds=(0, 4, 4, 8)))
+
+    def test_regrid_image_modified_inplace(self):
+        img = Image(np.arange(16.).reshape(4, 4), bounds=(0, 0, 4, 4))
+        regrid(img, width=2, height=2, dynamic=False)
+        img.data[:] = 0
+        regridded = regrid(img, width=2, height=2, dynamic=False)
+        self.assertEqual(regridded.data, np.zeros((2, 2)))
+
+    def test_regrid_image_nan_mean_max(self):
+        array = np.arange(16.).reshape(4, 4)
+        array[0, 0] = array[2:, 2:] = np.NaN
+        img = Image(array, bounds=(0, 0, 4, 4))
+        mean = regrid(img, width=2, height=2, dynamic=False)
+        self.assertEqual(mean.data[0], np.array([(1+4+5)/3., 4.5]))
+        self.assertTrue(np.isnan(mean.data[1, 1]))
+        maximum = regrid(img, width=2, height=2, aggregator='max', dynamic=False)
+        self.assertEqual(maximum.data[:, 0], np.array([5, 13]))
+
+    def test_regrid_image_unaligned_window(self):
+        img = Image(np.arange(100).reshape(10, 10), bounds=(0, 0, 10, 10))
+        regridded = regrid(img, width=3, height=10, x_range=(1, 7),
+                           aggregator='nearest', dynamic=False)
+        self.assertEqual(regridded.data.shape, (10, 2))
+        self.assertEqual(regridded.bounds.lbrt(), (0, 0, 8, 10))
+
+    def test_regrid_image_cached_level(self):
+        img = Image(np.arange(64.).reshape(8, 8), bounds=(0, 0, 8, 8))
+        zoomed = regrid(img, width=2, height=2, x_range=(0, 4), y_range=(4, 8),
+                        dynamic=False)
+        full = regrid(img, width=4, height=4, dynamic=False)
+        self.assertTrue(np.shares_memory(zoomed.data, full.data))
+
+    def test_regrid_image_within_resolution(self):
+        img = Image(np.random.rand(10, 10))
+        self.assertIs(regrid(img, dynamic=False), img)
+
+    def test_regrid_quadmesh_window(self):
+        qmesh = QuadMesh((np.arange(9), np.arange(9), np.arange(64).reshape(8, 8)))
+        regridded = regrid(qmesh, width=2, height=2, x_range=(0, 4), y_range=(0, 4),
+                           aggregator='nearest', dynamic=False)
+        self.assertEqual(regridded.data[0], np.array([0, 2, 4]))
+        self.assertEqual(regridded.data[2], np.array([[0, 2], [16, 18]]))
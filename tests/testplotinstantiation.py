@@ -17,9 +17,9 @@ from holoviews.core.util import pd
 from holoviews.element import (Curve, Scatter, Image, VLine, Points,
                                HeatMap, QuadMesh, Spikes, ErrorBars,
                                Scatter3D, Path, Polygons, Bars, Text,
-                               BoxWhisker)
+                               BoxWhisker, PackedPaths, Table)
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.streams import PositionXY, PositionX
+from holoviews.streams import PositionXY, PositionX, TablePage
 from holoviews.plotting import comms
 
 # Standardize backend due to random inconsistencies
@@ -297,6 +297,21 @@ class TestMPLPlotInstantiation(ComparisonTestCase):
             self.assertEqual(artist.get_array(), np.array([j]))
             self.assertEqual(artist.get_clim(), (0, 4))
 
+    def test_holomap_frames(self):
+        hmap = HoloMap({i: Curve([i, i+1]) for i in range(3)})
+        plot = mpl_renderer.get_plot(hmap)
+        frames = list(plot.frames())
+        self.assertEqual(len(frames), 3)
+        width, height = plot.state.canvas.get_width_height()
+        self.assertEqual(len(bytes(frames[0])), width*height*4)
+
+    def test_layout_frames_blit_matches_full_redraw(self):
+        hmap = HoloMap({i: Image(np.random.rand(10, 10)) for i in range(3)})
+        layout = hmap + Curve([1, 2, 3]) + Scatter([1, 2, 3])
+        blitted = [bytes(f) for f in mpl_renderer.get_plot(layout).frames(blit=True)]
+        redrawn = [bytes(f) for f in mpl_renderer.get_plot(layout).frames(blit=False)]
+        self.assertEqual(blitted, redrawn)
+
 
 
 class TestBokehPlotInstantiation(ComparisonTestCase):
@@ -394,6 +409,15 @@ class TestBokehPlotInstantiation(ComparisonTestCase):
         self.assertEqual(plot.handles['source'].data['line_width'], line_width)
         self.assertEqual(plot.handles['source'].data['color'], color)
 
+    def test_batched_points_hover_key_dimension(self):
+        opts = {'NdOverlay': dict(plot=dict(legend_limit=0)),
+                'Points': dict(plot=dict(tools=['hover']))}
+        overlay = NdOverlay({i: Points([(i, j) for j in range(i+1)])
+                             for i in range(3)}, kdims=['Key'])(opts)
+        plot = bokeh_renderer.get_plot(overlay).subplots[()]
+        self.assertEqual(plot.handles['source'].data['Key'],
+                         np.array([0, 1, 1, 2, 2, 2]))
+
     def test_batched_curve_line_color_and_color(self):
         opts = {'NdOverlay': dict(plot=dict(legend_limit=0)),
                 'Curve': dict(style=dict(line_color=Cycle(values=['red', 'blue'])))}
@@ -425,6 +449,46 @@ class TestBokehPlotInstantiation(ComparisonTestCase):
         self.assertEqual(plot.handles['source'].data['line_width'], line_width)
         self.assertEqual(plot.handles['source'].data['color'], color)
 
+    def test_packed_path_data(self):
+        packed = PackedPaths.from_paths([np.array([(0, 1), (1, 2)]),
+                                         np.array([(2, 3), (3, 4), (4, 5)])])
+        plot = bokeh_renderer.get_plot(Path(packed))
+        data = plot.handles['source'].data
+        self.assertEqual([list(xs) for xs in data['xs']], [[0, 1], [2, 3, 4]])
+        self.assertEqual([list(ys) for ys in data['ys']], [[1, 2], [3, 4, 5]])
+
+    def test_table_paged(self):
+        table = Table({'x': np.arange(1000), 'y': np.arange(1000)*2},
+                      kdims=['x'], vdims=['y'])(plot=dict(page_size=10))
+        plot = bokeh_renderer.get_plot(table)
+        bokeh_renderer(plot)
+        source = plot.handles['source']
+        self.assertEqual(source.data['x'], [str(i) for i in range(10)])
+        plot.page_stream.update(page=3)
+        self.assertEqual(source.data['x'], [str(i) for i in range(30, 40)])
+
+    def test_table_paged_sort_and_select(self):
+        table = Table({'x': np.arange(100), 'y': -np.arange(100)},
+                      kdims=['x'], vdims=['y'])
+        stream = TablePage(source=table, page_size=5)
+        plot = bokeh_renderer.get_plot(table)
+        bokeh_renderer(plot)
+        source = plot.handles['source']
+        stream.update(sort_by='y', selection={'x': (10, 50)})
+        self.assertEqual(source.data['x'], ['49', '48', '47', '46', '45'])
+        stream.update(page=1, ascending=False)
+        self.assertEqual(source.data['x'], ['15', '16', '17', '18', '19'])
+
+    def test_packed_polygons_path_values(self):
+        packed = PackedPaths.from_paths([np.array([(0, 1), (1, 2), (1, 0)]),
+                                         np.array([(2, 3), (3, 4), (4, 3)])],
+                                        values=[1, 2])
+        plot = bokeh_renderer.get_plot(Polygons(packed))
+        data = plot.handles['source'].data
+        self.assertEqual(data['Value'], np.array([1, 2]))
+        self.assertEqual(plot.handles['color_mapper'].low, 1)
+        self.assertEqual(plot.handles['color_mapper'].high, 2)
+
     def test_batched_path_line_color_and_color(self):
         opts = {'NdOverlay': dict(plot=dict(legend_limit=0)),
                 'Path': dict(style=dict(line_color=Cycle(values=['red', 'blue'])))}
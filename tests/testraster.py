@@ -3,7 +3,7 @@ Unit tests of Raster elements
 """
 
 import numpy as np
-from holoviews.element import Raster, Image, Curve
+from holoviews.element import Raster, Image, Curve, Table
 from holoviews.element.comparison import ComparisonTestCase
 
 class TestRaster(ComparisonTestCase):
@@ -38,3 +38,52 @@ class TestRaster(ComparisonTestCase):
         self.assertEqual(image.sample(y=0.25),
                          Curve(np.array([(-0.333333, 0), (0, 1), (0.333333, 2)]),
                                kdims=['x'], vdims=['z']))
+
+    def test_raster_index_arrays(self):
+        raster = Raster(self.array1)
+        self.assertEqual(raster[np.array([0, 2]), np.array([1, 0])],
+                         np.array([3, 2]))
+
+    def test_image_index_arrays(self):
+        image = Image(self.array1)
+        self.assertEqual(image[np.array([-.33, 0.33]), np.array([-0.25, 0.25])],
+                         np.array([3, 2]))
+
+    def test_raster_sample_points(self):
+        raster = Raster(self.array1)
+        self.assertEqual(raster.sample([(0, 1), (2, 0)]),
+                         Table(np.array([(0, 1, 3), (2, 0, 2)]),
+                               kdims=['x', 'y'], vdims=['z']))
+
+    def test_image_sample_arrays(self):
+        image = Image(self.array1)
+        xs, ys = np.array([-0.33, 0, 0.33]), np.array([-0.25, 0.25, 0.25])
+        self.assertEqual(image.sample((xs, ys)).dimension_values('z'),
+                         np.array([3, 1, 2]))
+
+    def test_image_sample_scalar_and_list(self):
+        image = Image(self.array1)
+        sampled = image.sample(x=0.33, y=[-0.25, 0.25])
+        self.assertEqual(sampled.dimension_values('x'), np.array([0.33, 0.33]))
+        self.assertEqual(sampled.dimension_values('z'), np.array([5, 2]))
+
+    def test_image_sample_mismatched_lengths(self):
+        image = Image(self.array1)
+        with self.assertRaisesRegexp(ValueError, '2 x-coordinates and 3 y-coordinates'):
+            image.sample(x=[0, 0.33], y=[-0.25, 0, 0.25])
+
+    def test_image_sample_interpolate(self):
+        image = Image(self.array1)
+        xs, ys = np.array([-1/6., 0, 0.4]), np.array([0, 0.25, -0.5])
+        self.assertEqual(image.sample((xs, ys), interpolate=True).dimension_values('z'),
+                         np.array([2, 1, 5]))
+
+    def test_image_closest_array(self):
+        image = Image(self.array1)
+        self.assertEqual(image.closest(np.array([[-0.3, -0.2], [0.1, 0.4]])),
+                         np.array([[-1/3., -0.25], [0, 0.25]]))
+
+    def test_image_closest_kwargs(self):
+        image = Image(self.array1)
+        self.assertEqual(np.array(image.closest(x=[-0.3, 0.1], y=[-0.2, 0.4])),
+                         np.array([(-1/3., -0.25), (0, 0.25)]))
@@ -2,6 +2,7 @@
 Unit test of the streams system
 """
 import param
+import numpy as np
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.streams import * # noqa (Test all available streams)
 
@@ -215,3 +216,111 @@ class TestPlotSizeTransform(ComparisonTestCase):
         plotsize.update(width=600, height=100)
         self.assertEqual(plotsize.contents, {'width':1200, 'height':200, 'scale':2})
 
+
+
+class TestBufferStream(ComparisonTestCase):
+
+    def test_buffer_initial_contents(self):
+        buff = Buffer({'x': np.array([0, 1]), 'y': np.array([2, 3])}, length=4)
+        self.assertEqual(list(buff.contents), ['data'])
+        self.assertEqual(buff.data['x'], np.array([0, 1]))
+        self.assertEqual(buff.data['y'], np.array([2, 3]))
+
+    def test_buffer_update_drops_oldest_rows(self):
+        buff = Buffer({'x': np.array([0, 1]), 'y': np.array([2, 3])}, length=4)
+        for i in range(2, 12, 2):
+            buff.update(data={'x': np.array([i, i+1]), 'y': np.array([i, i+1])})
+        self.assertEqual(buff.data['x'], np.array([8, 9, 10, 11]))
+        self.assertEqual(buff.data['y'], np.array([8, 9, 10, 11]))
+
+    def test_buffer_update_larger_than_length(self):
+        buff = Buffer({'x': np.array([0.])}, length=3)
+        buff.update(data={'x': np.arange(10.)})
+        self.assertEqual(buff.data['x'], np.array([7., 8., 9.]))
+
+    def test_buffer_expiry(self):
+        buff = Buffer({'t': np.array([0.]), 'v': np.array([1.])},
+                      index='t', expiry=2, length=100)
+        for t in range(1, 6):
+            buff.update(data={'t': t, 'v': t})
+        self.assertEqual(buff.data['t'], np.array([3., 4., 5.]))
+
+    def test_buffer_mismatched_columns(self):
+        buff = Buffer({'x': np.array([0.])}, length=3)
+        with self.assertRaises(ValueError):
+            buff.update(data={'y': np.array([1.])})
+
+    def test_buffer_triggers_subscriber(self):
+        subscriber = TestSubscriber()
+        buff = Buffer({'x': np.array([0.])}, length=3, subscribers=[subscriber])
+        buff.update(data={'x': np.array([1.])})
+        self.assertEqual(subscriber.call_count, 1)
+        self.assertEqual(subscriber.kwargs['data']['x'], np.array([0., 1.]))
+
+
+class TestScheduler(ComparisonTestCase):
+
+    def setUp(self):
+        self.time = 0
+        self.scheduler = Scheduler(timer=lambda: self.time)
+
+    def test_scheduler_coalesces_events(self):
+        subscriber = TestSubscriber()
+        position = PositionXY(subscribers=[subscriber])
+        for x in range(5):
+            self.scheduler.submit(position, x=x, y=x)
+        self.assertEqual(self.scheduler.queue_depth, 1)
+        self.assertEqual(self.scheduler.process(), [position])
+        self.assertEqual(subscriber.call_count, 1)
+        self.assertEqual(subscriber.kwargs, {'x': 4, 'y': 4})
+        self.assertEqual(self.scheduler.stats, {'events': 5, 'dropped': 4,
+                                                'triggered': 1, 'queue_depth': 0})
+
+    def test_scheduler_merges_partial_events(self):
+        position = PositionXY()
+        self.scheduler.submit(position, x=1)
+        self.scheduler.submit(position, y=2)
+        self.scheduler.process()
+        self.assertEqual(position.contents, {'x': 1, 'y': 2})
+
+    def test_scheduler_drops_events_while_processing(self):
+        position = PositionXY()
+        def subscriber(**kwargs):
+            for x in range(3):
+                self.scheduler.submit(position, x=x)
+            self.assertEqual(self.scheduler.process(), [])
+        position.add_subscriber(subscriber)
+        self.scheduler.submit(position, x=10)
+        self.scheduler.process()
+        self.assertEqual(self.scheduler.queue_depth, 1)
+        self.assertEqual(self.scheduler.dropped, 2)
+        position.clear()
+        self.scheduler.process()
+        self.assertEqual(position.contents, {'x': 2, 'y': 0})
+
+    def test_scheduler_debounce(self):
+        position = PositionXY(debounce=0.5)
+        self.scheduler.submit(position, x=1)
+        self.time = 0.3
+        self.scheduler.submit(position, x=2)
+        self.time = 0.6
+        self.assertEqual(self.scheduler.process(), [])
+        self.assertEqual(self.scheduler.next_due(), 0.2)
+        self.time = 0.8
+        self.assertEqual(self.scheduler.process(), [position])
+        self.assertEqual(position.contents, {'x': 2, 'y': 0})
+
+    def test_scheduler_throttle(self):
+        position = PositionXY(throttle=1)
+        self.scheduler.submit(position, x=1)
+        self.assertEqual(self.scheduler.process(), [position])
+        self.time = 0.5
+        self.scheduler.submit(position, x=2)
+        self.assertEqual(self.scheduler.process(), [])
+        self.time = 1
+        self.assertEqual(self.scheduler.process(), [position])
+        self.assertEqual(position.contents, {'x': 2, 'y': 0})
+
+    def test_rename_preserves_scheduling(self):
+        position = PositionXY(debounce=0.5, throttle=1).rename(x='x2')
+        self.assertEqual((position.debounce, position.throttle), (0.5, 1))
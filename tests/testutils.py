@@ -16,7 +16,7 @@ except:
 
 from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
-    deephash, merge_dimensions, get_path, make_path_unique
+    deephash, merge_dimensions, get_path, make_path_unique, CategoryTable
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PositionXY
@@ -465,6 +465,23 @@ class TestMergeDimensions(unittest.TestCase):
         self.assertEqual(dimensions[0].values, [0, 1, 2])
 
 
+class TestCategoryTable(ComparisonTestCase):
+
+    def test_category_table_encode(self):
+        table = CategoryTable(['a', 'b', 'c'])
+        self.assertEqual(table.encode(np.array(['c', 'd', 'a'])), np.array([2, -1, 0]))
+        self.assertEqual(table.encode(['b']), np.array([1]))
+
+    def test_category_table_code_invalid(self):
+        with self.assertRaises(ValueError):
+            CategoryTable(['a', 'b']).code('c')
+
+    def test_dimension_categories_cached(self):
+        dim = Dimension('A', values=['b', 'a'])
+        self.assertIs(dim.categories, dim.categories)
+        self.assertEqual(dim.categories.decode([0, 1]), ['a', 'b'])
+
+
 class TestTreePathUtils(unittest.TestCase):
 
     def test_get_path_with_label(self):